@@ -0,0 +1,166 @@
+import argparse
+import os
+import sys
+import time
+import uuid
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from dotenv import load_dotenv
+from sqlalchemy import func, inspect, or_, select, true
+
+# Ensure src is in pythonpath
+sys.path.append(os.getcwd())
+load_dotenv()
+
+from src.database import SessionLocal, engine
+from src.modules.managers.models import ManagerModel
+from src.modules.employees.models import EmployeeModel
+from src.modules.clients.models import ClientModel
+from src.modules.agents.models import AgentModel
+from src.modules.employees.handlers import employee_embedding_text
+from src.modules.clients.handlers import client_embedding_text
+from src.modules.embeddings.service import MAX_BATCH_SIZE, EmbeddingService
+from src.modules.embeddings.providers import embedding_service_from_env
+from src.modules.embeddings.storage import bulk_update_embeddings
+
+# Per table: the columns the embedding text is built from, in embedding_text argument order
+SOURCES = {
+    "employees": (EmployeeModel, employee_embedding_text,
+                  [EmployeeModel.first_name, EmployeeModel.last_name, EmployeeModel.email, EmployeeModel.mobile]),
+    "clients": (ClientModel, client_embedding_text,
+                [ClientModel.client_name, ClientModel.mobile, ClientModel.email, ClientModel.client_description]),
+}
+
+
+def stale(model, model_version: str, force: bool):
+    if force:
+        return true()
+    return or_(model.embedding.is_(None), model.embedding_model.is_distinct_from(model_version))
+
+
+def pages(model, columns, condition, page_size: int, after: uuid.UUID | None):
+    """Keyset pages of (id, text columns) over the primary key, each read in its own short transaction."""
+    while True:
+        stmt = select(model.id, *columns).where(condition).order_by(model.id).limit(page_size)
+        if after:
+            stmt = stmt.where(model.id > after)
+        with SessionLocal() as db:
+            rows = db.execute(stmt).all()
+        if not rows:
+            return
+        yield rows
+        after = rows[-1].id
+
+
+def embed_and_store(embedding_service: EmbeddingService, model, embedding_text, rows, retries: int) -> int:
+    texts = [embedding_text(*row[1:]) for row in rows]
+    for attempt in range(retries + 1):
+        try:
+            vectors = embedding_service.embed_texts(texts)
+            break
+        except Exception as e:
+            if attempt == retries:
+                raise
+            # Usually rate limiting: back off and try again
+            delay = 2 ** attempt
+            print(f"  embedding failed ({e}); retrying in {delay}s")
+            time.sleep(delay)
+
+    with SessionLocal() as db:
+        updated = bulk_update_embeddings(
+            db,
+            model.__table__,
+            {row.id: vector for row, vector in zip(rows, vectors)},
+            model=embedding_service.model_version,
+        )
+        db.commit()
+    return updated
+
+
+def backfill_table(embedding_service: EmbeddingService, table: str, args) -> None:
+    model, embedding_text, columns = SOURCES[table]
+    condition = stale(model, embedding_service.model_version, args.force)
+    with SessionLocal() as db:
+        query = select(func.count()).select_from(model).where(condition)
+        if args.after:
+            query = query.where(model.id > args.after)
+        total = db.execute(query).scalar()
+    if args.limit:
+        total = min(total, args.limit)
+    print(f"{table}: {total} rows to embed with {embedding_service.model_version}")
+    if not total:
+        return
+
+    done = failed = submitted = 0
+    last_id = None
+    started = time.perf_counter()
+
+    def collect(future, rows):
+        nonlocal done, failed, last_id
+        try:
+            done += future.result()
+        except Exception as e:
+            failed += len(rows)
+            print(f"  batch {rows[0].id}..{rows[-1].id} failed: {e}")
+        last_id = rows[-1].id if last_id is None else max(last_id, rows[-1].id)
+        report(table, done, failed, total, started, last_id)
+
+    # A bounded number of batches in flight keeps memory flat and the API within its rate limits
+    with ThreadPoolExecutor(max_workers=args.concurrency) as pool:
+        in_flight = {}
+        for page in pages(model, columns, condition, args.batch_size, args.after):
+            page = page[:total - submitted]
+            if not page:
+                break
+            submitted += len(page)
+            in_flight[pool.submit(embed_and_store, embedding_service, model, embedding_text, page, args.retries)] = page
+            if len(in_flight) >= args.concurrency:
+                finished, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+                for future in finished:
+                    collect(future, in_flight.pop(future))
+        for future in list(in_flight):
+            collect(future, in_flight.pop(future))
+
+    if failed:
+        print(f"{table}: {failed} rows failed; re-run to retry them (finished rows are not embedded again)")
+
+
+def report(table: str, done: int, failed: int, total: int, started: float, last_id) -> None:
+    elapsed = time.perf_counter() - started
+    rate = done / elapsed if elapsed else 0.0
+    remaining = (total - done - failed) / rate if rate else float("inf")
+    print(f"  {table}: {done + failed}/{total} ({100 * (done + failed) / total:.1f}%), "
+          f"{rate:.1f} rows/s, ~{remaining:.0f}s left, last id {last_id}")
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Embed employees and clients whose embedding is missing or from another model. "
+                    "Safe to interrupt and re-run: rows already embedded with the current model are skipped."
+    )
+    parser.add_argument("--table", choices=[*SOURCES, "all"], default="all")
+    parser.add_argument("--batch-size", type=int, default=MAX_BATCH_SIZE, help="rows per embedding request")
+    parser.add_argument("--concurrency", type=int, default=4, help="embedding requests in flight")
+    parser.add_argument("--retries", type=int, default=3)
+    parser.add_argument("--limit", type=int, help="stop after this many rows per table")
+    parser.add_argument("--after", type=uuid.UUID, help="resume after this id (the last id printed)")
+    parser.add_argument("--force", action="store_true", help="re-embed every row, current ones included")
+    args = parser.parse_args()
+
+    # The target model comes from EMBEDDING_PROVIDER / EMBEDDING_MODEL, as for the server
+    embedding_service = embedding_service_from_env()
+    if embedding_service is None:
+        print("GEMINI_API_KEY is not set and no local EMBEDDING_PROVIDER is selected")
+        sys.exit(1)
+
+    inspector = inspect(engine)
+    for table in SOURCES:
+        if "embedding_model" not in {column["name"] for column in inspector.get_columns(table)}:
+            print(f"{table}.embedding_model is missing; run python create_indexes.py first")
+            sys.exit(1)
+
+    for table in (SOURCES if args.table == "all" else [args.table]):
+        backfill_table(embedding_service, table, args)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,118 @@
+import argparse
+import asyncio
+import os
+import statistics
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+from dotenv import load_dotenv
+
+# Ensure src is in pythonpath
+sys.path.append(os.getcwd())
+load_dotenv()
+
+from src.database import SessionLocal, AsyncSessionLocal, async_engine
+from src.modules.managers.models import ManagerModel
+from src.modules.employees.models import EmployeeModel
+from src.modules.clients.models import ClientModel
+from src.modules.job_shifts.models import JobShiftModel
+from src.modules.agents.models import AgentModel
+from src.modules.job_shifts.service import JobShiftService, AsyncJobShiftService
+from src.modules.employees.service import EmployeeService, AsyncEmployeeService
+
+# Starlette runs sync endpoints on an anyio threadpool limited to 40 threads
+THREADPOOL_SIZE = 40
+
+
+def report(label: str, latencies: list[float], elapsed: float):
+    latencies.sort()
+    p95 = latencies[int(len(latencies) * 0.95) - 1]
+    print(
+        f"{label:<28} {len(latencies) / elapsed:>9.1f} req/s   "
+        f"p50 {statistics.median(latencies) * 1000:>7.2f} ms   p95 {p95 * 1000:>7.2f} ms"
+    )
+
+
+def run_sync(call, requests: int) -> tuple[list[float], float]:
+    def one():
+        db = SessionLocal()
+        try:
+            start = time.perf_counter()
+            call(db)
+            return time.perf_counter() - start
+        finally:
+            db.close()
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=THREADPOOL_SIZE) as pool:
+        latencies = list(pool.map(lambda _: one(), range(requests)))
+    return latencies, time.perf_counter() - start
+
+
+async def run_async(call, requests: int, concurrency: int) -> tuple[list[float], float]:
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def one():
+        async with semaphore, AsyncSessionLocal() as db:
+            start = time.perf_counter()
+            await call(db)
+            return time.perf_counter() - start
+
+    start = time.perf_counter()
+    latencies = await asyncio.gather(*(one() for _ in range(requests)))
+    return list(latencies), time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare the sync and async read paths under concurrent load.")
+    parser.add_argument("--requests", type=int, default=2000)
+    parser.add_argument("--concurrency", type=int, default=200)
+    args = parser.parse_args()
+
+    db = SessionLocal()
+    manager = db.query(ManagerModel).first()
+    db.close()
+    if not manager:
+        print("No manager found. Run seed_db.py first.")
+        sys.exit(1)
+
+    start_date = datetime.now() - timedelta(days=365)
+    end_date = datetime.now() + timedelta(days=365)
+    print(f"Benchmarking manager {manager.id}: {args.requests} requests, async concurrency {args.concurrency}\n")
+
+    cases = [
+        (
+            "FindShifts",
+            lambda db: JobShiftService(db).get_shifts_by_params(manager.id, start_date=start_date, end_date=end_date),
+            lambda db: AsyncJobShiftService(db).get_shifts_by_params(manager.id, start_date=start_date, end_date=end_date),
+        ),
+        (
+            "FindSchedule",
+            lambda db: JobShiftService(db).get_schedule_by_params(manager.id),
+            lambda db: AsyncJobShiftService(db).get_schedule_by_params(manager.id),
+        ),
+        (
+            "employees text-search",
+            lambda db: EmployeeService(db, None, None).search_employees_text("a", manager_id=manager.id),
+            lambda db: AsyncEmployeeService(db).search_employees_text("a", manager_id=manager.id),
+        ),
+    ]
+
+    async def run_all_async():
+        results = []
+        for _, _, async_call in cases:
+            results.append(await run_async(async_call, args.requests, args.concurrency))
+        await async_engine.dispose()
+        return results
+
+    async_results = asyncio.run(run_all_async())
+    for (label, sync_call, _), (async_latencies, async_elapsed) in zip(cases, async_results):
+        sync_latencies, sync_elapsed = run_sync(sync_call, args.requests)
+        report(f"{label} (sync)", sync_latencies, sync_elapsed)
+        report(f"{label} (async)", async_latencies, async_elapsed)
+        print()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,142 @@
+import argparse
+import os
+import statistics
+import sys
+import time
+from datetime import datetime, timedelta, timezone
+from dotenv import load_dotenv
+from sqlalchemy import text
+
+# Ensure src is in pythonpath
+sys.path.append(os.getcwd())
+load_dotenv()
+
+from src.database import SessionLocal
+from src.modules.managers.models import ManagerModel
+from src.modules.employees.models import EmployeeModel
+from src.modules.clients.models import ClientModel
+from src.modules.job_shifts.models import JobShiftModel
+from src.modules.agents.models import AgentModel
+from src.modules.job_shifts.service import JobShiftService
+
+BENCH_EMAIL = "availability.bench@example.com"
+MONTH_START = datetime(2025, 9, 1, tzinfo=timezone.utc)
+# "Who is free Tuesday 9-17?"
+WINDOW_START = datetime(2025, 9, 16, 9, tzinfo=timezone.utc)
+WINDOW_END = datetime(2025, 9, 16, 17, tzinfo=timezone.utc)
+
+
+def seed(db, employees: int, shifts_per_employee: int):
+    manager = ManagerModel(first_name="Availability", last_name="Bench", username="availability_bench",
+                           email=BENCH_EMAIL, password="-")
+    db.add(manager)
+    db.flush()
+    params = {"manager_id": manager.id, "employees": employees}
+    db.execute(text("""
+        INSERT INTO employees (id, first_name, last_name, mobile, email, manager_id)
+        SELECT gen_random_uuid(), 'Employee', i::text, '+1555' || i, 'availability.bench.employee.' || i || '@example.com', :manager_id
+        FROM generate_series(1, :employees) AS i
+    """), params)
+    db.execute(text("""
+        INSERT INTO clients (id, client_name, client_description, mobile, email, manager_id)
+        VALUES (gen_random_uuid(), 'Availability client', 'bench', '+1666', 'availability.bench.client@example.com', :manager_id)
+    """), params)
+    print(f"Seeding {employees * shifts_per_employee} shifts over a month...")
+    # Shifts of 2-6 hours at varying times of day, so windows see partial, back-to-back and no overlap
+    db.execute(text("""
+        WITH e AS (SELECT id, row_number() OVER (ORDER BY id) AS n FROM employees WHERE manager_id = :manager_id)
+        INSERT INTO job_shifts (id, manager_id, employee_id, client_id, start_date, end_date, is_paid)
+        SELECT gen_random_uuid(), :manager_id, e.id, (SELECT id FROM clients WHERE manager_id = :manager_id),
+               :month_start + ((e.n + i * 7) % 30) * interval '1 day' + ((e.n * 3 + i * 5) % 18) * interval '1 hour',
+               :month_start + ((e.n + i * 7) % 30) * interval '1 day' + ((e.n * 3 + i * 5) % 18) * interval '1 hour'
+                   + (2 + (e.n + i) % 5) * interval '1 hour',
+               false
+        FROM e CROSS JOIN generate_series(1, :per_employee) AS i
+    """), {**params, "per_employee": shifts_per_employee, "month_start": MONTH_START})
+    db.commit()
+    db.execute(text("ANALYZE employees, job_shifts"))
+    return manager
+
+
+def cleanup(db, manager):
+    for table in ("job_shifts", "employees", "clients"):
+        db.execute(text(f"DELETE FROM {table} WHERE manager_id = :manager_id"), {"manager_id": manager.id})
+    db.delete(manager)
+    db.commit()
+
+
+def schedule_per_employee(db, service: JobShiftService, manager_id) -> dict:
+    """The old approach: each employee's schedule through get_schedule_by_params, then interval math in Python."""
+    employees = db.query(EmployeeModel.id).filter(EmployeeModel.manager_id == manager_id).all()
+    free = {}
+    for (employee_id,) in employees:
+        # Reach back a day so shifts that started before the window are seen
+        shifts = service.get_schedule_by_params(
+            employee_id=employee_id, start_date=WINDOW_START - timedelta(days=1), end_date=WINDOW_END
+        )
+        busy = sorted(
+            (max(shift["start_date"], WINDOW_START), min(shift["end_date"], WINDOW_END))
+            for shift in shifts
+            if shift["start_date"] < WINDOW_END and shift["end_date"] > WINDOW_START
+        )
+        slots, cursor = [], WINDOW_START
+        for busy_start, busy_end in busy:
+            if busy_start > cursor:
+                slots.append((cursor, busy_start))
+            cursor = max(cursor, busy_end)
+        if cursor < WINDOW_END:
+            slots.append((cursor, WINDOW_END))
+        if slots:
+            free[employee_id] = slots
+    return free
+
+
+def availability_sweep(service: JobShiftService, manager_id) -> dict:
+    return {
+        row["employee_id"]: [(slot["start"], slot["end"]) for slot in row["free_slots"]]
+        for row in service.get_availability(manager_id, WINDOW_START, WINDOW_END)
+    }
+
+
+def timed(call, repeat: int):
+    result = call()  # warm up caches
+    latencies = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        call()
+        latencies.append(time.perf_counter() - start)
+    return result, statistics.median(latencies) * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Free slots for every employee: per-employee schedules vs one sweep.")
+    parser.add_argument("--employees", type=int, default=500)
+    parser.add_argument("--shifts-per-employee", type=int, default=20)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--keep", action="store_true", help="keep the seeded rows")
+    args = parser.parse_args()
+
+    db = SessionLocal()
+    manager = db.query(ManagerModel).filter(ManagerModel.email == BENCH_EMAIL).first() or seed(
+        db, args.employees, args.shifts_per_employee
+    )
+    try:
+        service = JobShiftService(db)
+        old, old_ms = timed(lambda: schedule_per_employee(db, service, manager.id), args.repeat)
+        new, new_ms = timed(lambda: availability_sweep(service, manager.id), args.repeat)
+
+        print(f"\n{'approach':<40}{'median (ms)':>12}")
+        print(f"{'get_schedule_by_params per employee':<40}{old_ms:>12.1f}")
+        print(f"{'FindAvailability (one query + sweep)':<40}{new_ms:>12.1f}")
+        print(f"speedup {old_ms / new_ms:.1f}x, {len(new)} of {args.employees} employees have free time, "
+              f"{'slots match' if old == new else 'slots differ'}")
+        if old != new:
+            sys.exit(1)
+    finally:
+        if not args.keep:
+            cleanup(db, manager)
+        db.close()
+
+
+if __name__ == "__main__":
+    main()
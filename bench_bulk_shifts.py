@@ -0,0 +1,115 @@
+import argparse
+import os
+import sys
+import time
+from datetime import datetime, timedelta, timezone
+from dotenv import load_dotenv
+from fastapi.testclient import TestClient
+from sqlalchemy import text
+
+# Ensure src is in pythonpath
+sys.path.append(os.getcwd())
+load_dotenv()
+
+from src.database import SessionLocal
+from src.main import app
+from src.modules.managers.models import ManagerModel
+from src.modules.employees.models import EmployeeModel
+from src.modules.clients.models import ClientModel
+from src.modules.job_shifts.models import JobShiftModel
+from src.modules.job_shifts.schemas import JobShiftCreate
+from src.modules.job_shifts.service import JobShiftService
+from src.modules.reporting.models import ShiftDailyRollupModel
+
+BENCH_EMAIL = "bulk.shifts.bench@example.com"
+MONTH_START = datetime(2025, 6, 1, tzinfo=timezone.utc)
+
+
+def seed(db, people: int):
+    manager = ManagerModel(first_name="Bulk", last_name="Bench", username="bulk_shifts_bench",
+                           email=BENCH_EMAIL, password="-")
+    db.add(manager)
+    db.flush()
+    employees = [EmployeeModel(first_name="Bulk", last_name=str(i), mobile="+1555", manager_id=manager.id,
+                               email=f"bulk.bench.employee.{i}@example.com") for i in range(people)]
+    clients = [ClientModel(client_name=f"Bulk client {i}", client_description="bench", mobile="+1666",
+                           manager_id=manager.id, email=f"bulk.bench.client.{i}@example.com") for i in range(people)]
+    db.add_all(employees + clients)
+    db.commit()
+    return manager, employees, clients
+
+
+def cleanup(db, manager):
+    for model in (ShiftDailyRollupModel, JobShiftModel, EmployeeModel, ClientModel):
+        db.query(model).filter(model.manager_id == manager.id).delete()
+    db.delete(manager)
+    db.commit()
+
+
+def roster(manager, employees, clients, count: int) -> list[dict]:
+    """Back-to-back 3 hour shifts spread across the manager's staff and clients, none overlapping."""
+    shifts = []
+    for i in range(count):
+        # The employee's k-th shift; overlapping shifts would be rejected by POST /job_shifts/
+        start = MONTH_START + timedelta(hours=3 * (i // len(employees)))
+        shifts.append({
+            "manager_id": str(manager.id),
+            "employee_id": str(employees[i % len(employees)].id),
+            "client_id": str(clients[(i // len(employees)) % len(clients)].id),
+            "start_date": start.isoformat(),
+            "end_date": (start + timedelta(hours=3)).isoformat(),
+            "is_paid": False,
+        })
+    return shifts
+
+
+def delete_shifts(db, manager):
+    db.execute(text("DELETE FROM job_shifts WHERE manager_id = :manager_id"), {"manager_id": manager.id})
+    db.commit()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Bulk shift import vs one POST per shift.")
+    parser.add_argument("--shifts", type=int, default=10_000)
+    parser.add_argument("--people", type=int, default=50)
+    parser.add_argument("--single", type=int, default=500, help="shifts to time through POST /job_shifts/")
+    args = parser.parse_args()
+
+    db = SessionLocal()
+    manager, employees, clients = seed(db, args.people)
+    shifts = roster(manager, employees, clients, args.shifts)
+    try:
+        with TestClient(app) as client:
+            start = time.perf_counter()
+            for shift in shifts[:args.single]:
+                client.post("/api/job_shifts/", json=shift).raise_for_status()
+            single_per_shift = (time.perf_counter() - start) / args.single
+            delete_shifts(db, manager)
+
+            # Service only: validation done up front, one transaction of batched INSERT ... RETURNING
+            payloads = [JobShiftCreate(**shift) for shift in shifts]
+            with SessionLocal() as service_db:
+                start = time.perf_counter()
+                ids = JobShiftService(service_db).create_shifts(payloads)
+                service_elapsed = time.perf_counter() - start
+            assert len(ids) == args.shifts
+            delete_shifts(db, manager)
+
+            # Whole request: JSON parsing, validation, insert, rollup refresh and the response
+            start = time.perf_counter()
+            response = client.post("/api/job_shifts/bulk", json={"shifts": shifts})
+            response.raise_for_status()
+            http_elapsed = time.perf_counter() - start
+            assert response.json()["count"] == args.shifts
+
+        print(f"\n{args.shifts} shifts")
+        print(f"{'one POST per shift (extrapolated)':<40}{single_per_shift * args.shifts:>9.2f}s")
+        print(f"{'JobShiftService.create_shifts':<40}{service_elapsed:>9.2f}s")
+        print(f"{'POST /job_shifts/bulk':<40}{http_elapsed:>9.2f}s")
+    finally:
+        cleanup(db, manager)
+        db.close()
+
+
+if __name__ == "__main__":
+    main()
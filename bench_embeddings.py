@@ -0,0 +1,54 @@
+import argparse
+import os
+import sys
+import time
+from dotenv import load_dotenv
+
+# Ensure src is in pythonpath
+sys.path.append(os.getcwd())
+load_dotenv()
+
+from src.modules.embeddings.providers import embedding_service_from_env
+from src.modules.employees.handlers import employee_embedding_text
+
+
+def sample_texts(count: int) -> list[str]:
+    return [
+        employee_embedding_text(f"First{i}", f"Last{i % 997}", f"employee.{i}@example.com", f"+1555{i:07d}")
+        for i in range(count)
+    ]
+
+
+def throughput(embed_texts, texts: list[str], batch_size: int) -> float:
+    start = time.perf_counter()
+    for i in range(0, len(texts), batch_size):
+        embed_texts(texts[i:i + batch_size])
+    return len(texts) / (time.perf_counter() - start)
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Embedding throughput of the configured EMBEDDING_PROVIDER: one text per call vs batches."
+    )
+    parser.add_argument("--texts", type=int, default=5000)
+    parser.add_argument("--batch-sizes", type=int, nargs="+", default=[1, 16, 100, 1000, 5000])
+    args = parser.parse_args()
+
+    service = embedding_service_from_env()
+    if service is None:
+        print("No embedding provider: set EMBEDDING_PROVIDER=hashing (or sentence-transformers), or GEMINI_API_KEY")
+        sys.exit(1)
+    texts = sample_texts(args.texts)
+    # Warm up: loads models, opens connections and starts worker processes
+    service.embed_texts(texts[:max(args.batch_sizes)])
+
+    print(f"{service.model_version}, {os.cpu_count()} cores, {args.texts} texts\n")
+    print(f"{'batch size':>10}{'texts/s':>12}")
+    for batch_size in args.batch_sizes:
+        print(f"{batch_size:>10}{throughput(service.embed_texts, texts, batch_size):>12.0f}")
+    if hasattr(service, "close"):
+        service.close()
+
+
+if __name__ == "__main__":
+    main()
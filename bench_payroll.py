@@ -0,0 +1,143 @@
+import argparse
+import os
+import statistics
+import sys
+import time
+from collections import defaultdict
+from datetime import datetime, timezone
+from dotenv import load_dotenv
+from sqlalchemy import text
+
+# Ensure src is in pythonpath
+sys.path.append(os.getcwd())
+load_dotenv()
+
+from src.database import SessionLocal
+from src.modules.managers.models import ManagerModel
+from src.modules.employees.models import EmployeeModel
+from src.modules.clients.models import ClientModel
+from src.modules.job_shifts.models import JobShiftModel
+from src.modules.agents.models import AgentModel
+from src.modules.job_shifts.service import JobShiftService
+
+BENCH_EMAIL = "payroll.bench@example.com"
+YEAR_START = datetime(2025, 1, 1, tzinfo=timezone.utc)
+YEAR_END = datetime(2026, 1, 1, tzinfo=timezone.utc)
+
+
+def month_starts():
+    return [datetime(2025, month, 1, tzinfo=timezone.utc) for month in range(1, 13)] + [YEAR_END]
+
+
+def seed(db, employees: int, clients: int, shifts_per_day: int):
+    manager = ManagerModel(first_name="Payroll", last_name="Bench", username="payroll_bench",
+                           email=BENCH_EMAIL, password="-", default_rate=40.0)
+    db.add(manager)
+    db.flush()
+    params = {"manager_id": manager.id, "employees": employees, "clients": clients}
+    # A third of employees and clients carry their own rate so every precedence branch is exercised
+    db.execute(text("""
+        INSERT INTO employees (id, first_name, last_name, mobile, email, default_rate, manager_id)
+        SELECT gen_random_uuid(), 'Employee', i::text, '+1555' || i, 'payroll.bench.employee.' || i || '@example.com',
+               CASE WHEN i % 3 = 0 THEN 30 + i % 20 ELSE 0 END, :manager_id
+        FROM generate_series(1, :employees) AS i
+    """), params)
+    db.execute(text("""
+        INSERT INTO clients (id, client_name, client_description, mobile, email, default_rate, manager_id)
+        SELECT gen_random_uuid(), 'Client ' || i, 'bench', '+1666' || i, 'payroll.bench.client.' || i || '@example.com',
+               CASE WHEN i % 3 = 0 THEN 60 + i % 25 ELSE 0 END, :manager_id
+        FROM generate_series(1, :clients) AS i
+    """), params)
+    print(f"Seeding {shifts_per_day * 365} shifts over 2025...")
+    db.execute(text("""
+        WITH e AS (SELECT id, row_number() OVER (ORDER BY id) - 1 AS n FROM employees WHERE manager_id = :manager_id),
+             c AS (SELECT id, row_number() OVER (ORDER BY id) - 1 AS n FROM clients WHERE manager_id = :manager_id)
+        INSERT INTO job_shifts (id, manager_id, employee_id, client_id, start_date, end_date, is_paid)
+        SELECT gen_random_uuid(), :manager_id, e.id, c.id,
+               :year_start + (i / :per_day) * interval '1 day' + (6 + i % 12) * interval '1 hour',
+               :year_start + (i / :per_day) * interval '1 day' + (6 + i % 12) * interval '1 hour'
+                   + (4 + i % 5) * interval '1 hour',
+               i % 4 <> 0
+        FROM generate_series(0, :per_day * 365 - 1) AS i
+        JOIN e ON e.n = i % :employees
+        JOIN c ON c.n = i % :clients
+    """), {**params, "per_day": shifts_per_day, "year_start": YEAR_START})
+    db.commit()
+    db.execute(text("ANALYZE employees, clients, job_shifts"))
+    return manager
+
+
+def cleanup(db, manager):
+    for table in ("job_shifts", "employees", "clients"):
+        db.execute(text(f"DELETE FROM {table} WHERE manager_id = :manager_id"), {"manager_id": manager.id})
+    db.delete(manager)
+    db.commit()
+
+
+def client_side_payroll(service: JobShiftService, manager_id) -> dict:
+    """The old approach: pull every shift through FindShifts month by month and sum in Python."""
+    totals = defaultdict(float)
+    months = month_starts()
+    for start, end in zip(months, months[1:]):
+        for shift in service.get_shifts_by_params(manager_id, start_date=start, end_date=end):
+            if shift["start_date"] == end:
+                continue  # FindShifts ranges are inclusive; the next month owns this shift
+            hours = (shift["end_date"] - shift["start_date"]).total_seconds() / 3600
+            totals[shift["employee_id"]] += hours * shift["effective_rate"]
+    return totals
+
+
+def sql_payroll(service: JobShiftService, manager_id) -> dict:
+    totals = defaultdict(float)
+    for row in service.get_payroll_summary(manager_id, YEAR_START, YEAR_END, group_by="employee", period="month"):
+        totals[row["employee_id"]] += row["amount"]
+    return totals
+
+
+def timed(call, repeat: int):
+    result = call()  # warm up caches
+    latencies = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        call()
+        latencies.append(time.perf_counter() - start)
+    return result, statistics.median(latencies) * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Yearly payroll: client-side summing vs the SQL aggregation.")
+    parser.add_argument("--employees", type=int, default=60)
+    parser.add_argument("--clients", type=int, default=40)
+    parser.add_argument("--shifts-per-day", type=int, default=300)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--keep", action="store_true", help="keep the seeded rows")
+    args = parser.parse_args()
+
+    db = SessionLocal()
+    manager = db.query(ManagerModel).filter(ManagerModel.email == BENCH_EMAIL).first() or seed(
+        db, args.employees, args.clients, args.shifts_per_day
+    )
+    try:
+        service = JobShiftService(db)
+        client_totals, client_ms = timed(lambda: client_side_payroll(service, manager.id), args.repeat)
+        sql_totals, sql_ms = timed(lambda: sql_payroll(service, manager.id), args.repeat)
+
+        mismatched = [
+            employee_id for employee_id in client_totals.keys() | sql_totals.keys()
+            if abs(client_totals.get(employee_id, 0.0) - sql_totals.get(employee_id, 0.0)) > 0.01
+        ]
+        print(f"\n{'approach':<36}{'median (ms)':>12}")
+        print(f"{'FindShifts per month + Python sum':<36}{client_ms:>12.1f}")
+        print(f"{'PayrollSummary (SQL)':<36}{sql_ms:>12.1f}")
+        print(f"speedup {client_ms / sql_ms:.1f}x, {len(sql_totals)} employees, "
+              f"{'totals match' if not mismatched else f'{len(mismatched)} totals differ'}")
+        if mismatched:
+            sys.exit(1)
+    finally:
+        if not args.keep:
+            cleanup(db, manager)
+        db.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,111 @@
+import argparse
+import os
+import statistics
+import sys
+import time
+from dotenv import load_dotenv
+from sqlalchemy import text
+
+# Ensure src is in pythonpath
+sys.path.append(os.getcwd())
+load_dotenv()
+
+from src.database import SessionLocal
+from src.modules.managers.models import ManagerModel
+from src.modules.employees.models import EmployeeModel
+from src.modules.clients.models import ClientModel
+from src.modules.job_shifts.models import JobShiftModel
+from src.modules.agents.models import AgentModel
+from src.modules.employees.service import EmployeeService
+
+BENCH_EMAIL = "text.search.bench@example.com"
+TRIGRAM_INDEXES = [index.name for index in EmployeeModel.__table__.indexes if index.name.endswith("_trgm")]
+
+FIRST_NAMES = ["James", "Mary", "Robert", "Patricia", "John", "Jennifer", "Michael", "Linda", "David", "Elizabeth",
+               "William", "Barbara", "Richard", "Susan", "Joseph", "Jessica", "Thomas", "Sarah", "Charles", "Karen"]
+LAST_NAMES = ["Smith", "Johnson", "Williams", "Brown", "Jones", "Garcia", "Miller", "Davis", "Rodriguez", "Martinez",
+              "Hernandez", "Lopez", "Gonzalez", "Wilson", "Anderson", "Taylor", "Moore", "Jackson", "Martin", "Lee"]
+
+
+def seed(db, rows: int):
+    manager = ManagerModel(first_name="Bench", last_name="Manager", username="text_search_bench",
+                           email=BENCH_EMAIL, password="-")
+    db.add(manager)
+    db.flush()
+    print(f"Seeding {rows} employees...")
+    start = time.perf_counter()
+    # Names repeat like real data; the md5 suffix makes most last names and nicknames distinct
+    db.execute(text("""
+        INSERT INTO employees (id, first_name, last_name, nickname, mobile, email, default_rate, manager_id)
+        SELECT gen_random_uuid(),
+               (:first_names)[1 + i % 20],
+               (:last_names)[1 + (i / 20) % 20] || '-' || substr(md5(i::text), 1, 6),
+               substr(md5((i * 7)::text), 1, 8),
+               '+1555' || lpad(i::text, 7, '0'),
+               'bench.' || i || '@example.com',
+               0,
+               :manager_id
+        FROM generate_series(1, :rows) AS i
+    """), {"first_names": FIRST_NAMES, "last_names": LAST_NAMES, "manager_id": manager.id, "rows": rows})
+    db.commit()
+    db.execute(text("ANALYZE employees"))
+    print(f"Seeded in {time.perf_counter() - start:.1f}s")
+    return manager
+
+
+def cleanup(db, manager):
+    db.execute(text("DELETE FROM employees WHERE manager_id = :manager_id"), {"manager_id": manager.id})
+    db.delete(manager)
+    db.commit()
+
+
+def time_queries(db, repeat: int) -> dict[str, float]:
+    service = EmployeeService(db, None, None)
+    cases = {
+        "text-search 'mart'": lambda: service.search_employees_text("mart", limit=10),
+        "text-search '3f2a'": lambda: service.search_employees_text("3f2a", limit=10),
+        "FindEmployees email": lambda: service.get_employees_by_params(None, email="bench.424242@"),
+        "FindEmployees last_name": lambda: service.get_employees_by_params(None, last_name="lopez-9a1"),
+    }
+    results = {}
+    for label, call in cases.items():
+        call()  # warm up caches
+        latencies = []
+        for _ in range(repeat):
+            start = time.perf_counter()
+            call()
+            latencies.append(time.perf_counter() - start)
+        results[label] = statistics.median(latencies) * 1000
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Text search latency with and without trigram indexes.")
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--keep", action="store_true", help="keep the seeded rows")
+    args = parser.parse_args()
+
+    db = SessionLocal()
+    manager = db.query(ManagerModel).filter(ManagerModel.email == BENCH_EMAIL).first() or seed(db, args.rows)
+    try:
+        # DDL is transactional in Postgres: drop the indexes, measure, then roll the drop back
+        for index_name in TRIGRAM_INDEXES:
+            db.execute(text(f"DROP INDEX IF EXISTS {index_name}"))
+        before = time_queries(db, args.repeat)
+        db.rollback()
+
+        after = time_queries(db, args.repeat)
+        db.rollback()
+
+        print(f"\n{'query':<28}{'no trgm (ms)':>14}{'trgm (ms)':>12}{'speedup':>10}")
+        for label in before:
+            print(f"{label:<28}{before[label]:>14.2f}{after[label]:>12.2f}{before[label] / after[label]:>9.1f}x")
+    finally:
+        if not args.keep:
+            cleanup(db, manager)
+        db.close()
+
+
+if __name__ == "__main__":
+    main()
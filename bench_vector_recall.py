@@ -0,0 +1,168 @@
+import argparse
+import os
+import statistics
+import sys
+import time
+import numpy as np
+from dotenv import load_dotenv
+from sqlalchemy import func, insert, select, text
+
+# Ensure src is in pythonpath
+sys.path.append(os.getcwd())
+load_dotenv()
+
+from src.database import SessionLocal, engine
+from src.modules.managers.models import ManagerModel
+from src.modules.employees.models import EmployeeModel
+from src.modules.clients.models import ClientModel
+from src.modules.agents.models import AgentModel
+from src.modules.embeddings.indexes import PGVECTOR_VERSION_QUERY, apply_ann_settings, quantized_hnsw_index
+from src.modules.embeddings.quantization import QUANTIZATION_MIN_PGVECTOR, VectorSearch
+from src.modules.employees.service import employees_vector_search_query
+
+BENCH_EMAIL = "recall.bench@example.com"
+CLUSTERS = 200
+# Spread of rows around their cluster centre, relative to the spread of the centres
+NOISE = 0.35
+
+
+def corpus(rng, dims: int):
+    """Clustered unit vectors whose variance decays along the dimensions, like Matryoshka embeddings."""
+    decay = 1 / np.sqrt(1 + np.arange(dims) / 64)
+    centroids = rng.standard_normal((CLUSTERS, dims)) * decay
+
+    def sample(count: int) -> np.ndarray:
+        vectors = centroids[rng.integers(CLUSTERS, size=count)] + rng.standard_normal((count, dims)) * decay * NOISE
+        return vectors / np.linalg.norm(vectors, axis=1, keepdims=True)
+
+    return sample
+
+
+def seed(db, vectors: np.ndarray):
+    manager = ManagerModel(first_name="Recall", last_name="Bench", username="recall_bench", email=BENCH_EMAIL, password="-")
+    db.add(manager)
+    db.flush()
+    print(f"Seeding {len(vectors)} embedded employees...")
+    for start in range(0, len(vectors), 1000):
+        db.execute(insert(EmployeeModel), [
+            {
+                "first_name": "Recall", "last_name": str(i), "mobile": "+1555",
+                "email": f"recall.bench.employee.{i}@example.com", "manager_id": manager.id, "embedding": vector,
+            }
+            for i, vector in enumerate(vectors[start:start + 1000].tolist(), start)
+        ])
+    db.commit()
+    # Autocommit: VACUUM cannot run in a transaction. It also clears index entries left by earlier runs.
+    with engine.connect().execution_options(isolation_level="AUTOCOMMIT") as conn:
+        conn.execute(text("VACUUM ANALYZE employees"))
+    return manager
+
+
+def cleanup(db, manager):
+    db.execute(text("DELETE FROM employees WHERE manager_id = :manager_id"), {"manager_id": manager.id})
+    db.delete(manager)
+    db.commit()
+
+
+def search_ids(db, query: list[float], k: int, search: VectorSearch, ef_search: int | None, exact: bool = False) -> list:
+    if exact:
+        # Ground truth: a sequential scan with an exact sort
+        db.execute(text("SET LOCAL enable_indexscan = off"))
+    else:
+        # Measure the index even where the planner would still prefer a scan at this table size
+        db.execute(text("SET LOCAL enable_seqscan = off"))
+        apply_ann_settings(db, ef_search=ef_search)
+    ids = [employee.id for employee, _ in db.execute(employees_vector_search_query(query, None, k, search)).all()]
+    db.rollback()  # ends the transaction, and with it the SET LOCAL settings
+    return ids
+
+
+def timed_exact(db, query: list[float], k: int) -> float:
+    start = time.perf_counter()
+    search_ids(db, query, k, VectorSearch(), None, exact=True)
+    return (time.perf_counter() - start) * 1000
+
+
+def measure(db, queries, truth, k: int, search: VectorSearch, ef_search: int | None):
+    latencies, recalls = [], []
+    search_ids(db, queries[0], k, search, ef_search)  # warm up
+    for query, expected in zip(queries, truth):
+        start = time.perf_counter()
+        ids = search_ids(db, query, k, search, ef_search)
+        latencies.append(time.perf_counter() - start)
+        recalls.append(len(set(ids) & set(expected)) / k)
+    return statistics.mean(recalls), statistics.median(latencies) * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Recall@k and latency of vector search over float32, halfvec, binary and truncated (Matryoshka) indexes."
+    )
+    parser.add_argument("--rows", type=int, default=20_000)
+    parser.add_argument("--queries", type=int, default=50)
+    parser.add_argument("--k", type=int, default=10)
+    parser.add_argument("--storages", nargs="+", default=["vector", "halfvec", "binary"])
+    parser.add_argument("--dims", type=int, nargs="+", default=[1536, 768, 256], help="search dims (Matryoshka prefixes)")
+    parser.add_argument("--rerank-factors", type=int, nargs="+", default=[1, 4, 10])
+    parser.add_argument("--ef-search", type=int, default=40, help="raised to k * rerank factor when that is larger")
+    parser.add_argument("--seed", type=int, default=7)
+    parser.add_argument("--keep", action="store_true", help="keep the seeded rows and the indexes built")
+    args = parser.parse_args()
+
+    full_dims = EmployeeModel.embedding.type.dim
+    rng = np.random.default_rng(args.seed)
+    sample = corpus(rng, full_dims)
+    db = SessionLocal()
+    manager = db.query(ManagerModel).filter(ManagerModel.email == BENCH_EMAIL).first() or seed(db, sample(args.rows))
+    queries = sample(args.queries).tolist()
+
+    version = db.execute(PGVECTOR_VERSION_QUERY).scalar() or "0"
+    quantization = tuple(int(part) for part in version.split(".")) >= QUANTIZATION_MIN_PGVECTOR
+    if db.execute(text("SELECT to_regclass('ix_employees_embedding_ivfflat')")).scalar():
+        print("WARNING: ix_employees_embedding_ivfflat exists; the planner may pick it over the HNSW indexes measured here")
+    built = []
+    try:
+        truth = [search_ids(db, query, args.k, VectorSearch(), None, exact=True) for query in queries]
+        exact_ms = statistics.median(timed_exact(db, query, args.k) for query in queries[:10])
+
+        print(f"\npgvector {version}, {args.rows} rows, {args.queries} queries, recall@{args.k}")
+        print(f"{'index':<16}{'index MB':>10}{'rerank':>8}{'ef_search':>11}{'recall':>9}{'median (ms)':>13}")
+        print(f"{'exact scan':<16}{'-':>10}{'-':>8}{'-':>11}{1.0:>9.3f}{exact_ms:>13.1f}")
+        for storage in args.storages:
+            for dims in args.dims:
+                search = VectorSearch(storage, dims if dims < full_dims else None)
+                if search.is_exact(EmployeeModel.embedding):
+                    index_name = "ix_employees_embedding_hnsw"
+                elif not quantization:
+                    print(f"{search.name:<16}  skipped: needs pgvector 0.7 or later")
+                    continue
+                else:
+                    index = quantized_hnsw_index(EmployeeModel.__table__, search)
+                    index_name = index.name
+                    if not db.execute(text("SELECT to_regclass(:name)"), {"name": index_name}).scalar():
+                        print(f"Building {index_name}...")
+                        start = time.perf_counter()
+                        with engine.begin() as conn:
+                            index.create(conn)
+                        built.append(index)
+                        print(f"  built in {time.perf_counter() - start:.1f}s")
+                size_mb = db.execute(select(func.pg_relation_size(index_name))).scalar() / 2**20
+                db.rollback()
+                for factor in args.rerank_factors:
+                    # The full-precision index has no re-rank step; it runs at the same ef_search for comparison
+                    search = VectorSearch(search.storage, search.dims, factor)
+                    ef_search = max(args.ef_search, args.k * factor)
+                    recall, median_ms = measure(db, queries, truth, args.k, search, ef_search)
+                    rerank = "-" if search.is_exact(EmployeeModel.embedding) else factor
+                    print(f"{search.name:<16}{size_mb:>10.1f}{rerank:>8}{ef_search:>11}{recall:>9.3f}{median_ms:>13.1f}")
+    finally:
+        if not args.keep:
+            with engine.begin() as conn:
+                for index in built:
+                    index.drop(conn)
+            cleanup(db, manager)
+        db.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,120 @@
+import argparse
+import math
+import os
+import sys
+import uuid
+from dotenv import load_dotenv
+from sqlalchemy import func, inspect, select, text
+from sqlalchemy.schema import CreateIndex
+
+# Ensure src is in pythonpath
+sys.path.append(os.getcwd())
+
+load_dotenv()
+
+from src.database import engine, Base
+from src.modules.managers.models import ManagerModel
+from src.modules.employees.models import EmployeeModel
+from src.modules.clients.models import ClientModel
+from src.modules.job_shifts.models import JobShiftModel
+from src.modules.agents.models import AgentModel
+from src.modules.reporting.models import ShiftDailyRollupModel
+from src.modules.outbox.models import OutboxEventModel
+from src.modules.embeddings.indexes import PGVECTOR_VERSION_QUERY, ivfflat_index, manager_hnsw_index, quantized_hnsw_index
+from src.modules.embeddings.quantization import QUANTIZATION_MIN_PGVECTOR, VECTOR_SEARCH
+
+VECTOR_TABLES = [EmployeeModel.__table__, ClientModel.__table__]
+
+
+def default_ivfflat_lists(row_count: int) -> int:
+    # pgvector guidance: rows / 1000 up to 1M rows, sqrt(rows) beyond that
+    if row_count > 1_000_000:
+        return int(math.sqrt(row_count))
+    return max(10, row_count // 1000)
+
+
+def add_missing_columns(conn):
+    """Add nullable model columns that existing tables lack; create_all never alters a table."""
+    inspector = inspect(conn)
+    for table in Base.metadata.sorted_tables:
+        existing = {column["name"] for column in inspector.get_columns(table.name)}
+        for column in table.columns:
+            if column.name in existing:
+                continue
+            if not column.nullable:
+                print(f"WARNING: {table.name}.{column.name} is NOT NULL and must be added by hand")
+                continue
+            print(f"Adding column {table.name}.{column.name}...")
+            conn.execute(text(
+                f"ALTER TABLE {table.name} ADD COLUMN IF NOT EXISTS {column.name} {column.type.compile(conn.dialect)}"
+            ))
+
+
+def create_index(conn, index, concurrently: bool):
+    index.dialect_kwargs["postgresql_concurrently"] = concurrently
+    print(f"Creating index {index.name} on {index.table.name} (if missing)...")
+    conn.execute(CreateIndex(index, if_not_exists=True))
+
+
+def create_indexes(
+    concurrently: bool = False,
+    ivfflat: bool = False,
+    lists: int | None = None,
+    maintenance_work_mem: str | None = None,
+    manager_ids: list[uuid.UUID] | None = None,
+):
+    """Create every index (and nullable column) declared on the models that the database is missing.
+
+    Base.metadata.create_all only builds indexes together with their table, so
+    existing deployments use this to pick up indexes and columns added to the models later.
+    """
+    # CREATE INDEX CONCURRENTLY cannot run inside a transaction block
+    with engine.connect().execution_options(isolation_level="AUTOCOMMIT") as conn:
+        # Creates required extensions, then tables that do not exist yet together with their indexes
+        Base.metadata.create_all(bind=conn)
+        add_missing_columns(conn)
+        if maintenance_work_mem:
+            # HNSW builds are much faster when the graph fits in maintenance_work_mem
+            conn.execute(select(func.set_config("maintenance_work_mem", maintenance_work_mem, False)))
+
+        for table in Base.metadata.sorted_tables:
+            for index in sorted(table.indexes, key=lambda index: index.name):
+                create_index(conn, index, concurrently)
+
+        if ivfflat:
+            for table in VECTOR_TABLES:
+                row_count = conn.execute(
+                    select(func.count()).select_from(table).where(table.c.embedding.isnot(None))
+                ).scalar()
+                create_index(conn, ivfflat_index(table, lists or default_ivfflat_lists(row_count)), concurrently)
+
+        # The compact index the configured EMBEDDING_SEARCH_STORAGE / EMBEDDING_SEARCH_DIMS search reads
+        if not VECTOR_SEARCH.is_exact(EmployeeModel.embedding):
+            version = conn.execute(PGVECTOR_VERSION_QUERY).scalar() or "0"
+            if tuple(int(part) for part in version.split(".")) < QUANTIZATION_MIN_PGVECTOR:
+                print(f"WARNING: pgvector {version} cannot build {VECTOR_SEARCH.name} indexes; upgrade to 0.7 or later")
+            else:
+                for table in VECTOR_TABLES:
+                    create_index(conn, quantized_hnsw_index(table, VECTOR_SEARCH), concurrently)
+
+        for manager_id in manager_ids or []:
+            for table in VECTOR_TABLES:
+                create_index(conn, manager_hnsw_index(table, manager_id), concurrently)
+
+    print("Indexes are up to date.")
+    if concurrently:
+        print("Note: a failed concurrent build leaves an INVALID index behind; drop it and re-run.")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Create missing database indexes, including pgvector ANN indexes.")
+    parser.add_argument("--concurrently", action="store_true", help="build without blocking writes")
+    parser.add_argument("--ivfflat", action="store_true", help="also build IVFFlat indexes on embedding columns")
+    parser.add_argument("--lists", type=int, help="IVFFlat list count (default: derived from row count)")
+    parser.add_argument("--maintenance-work-mem", help="e.g. 1GB, applied to this session's index builds")
+    parser.add_argument(
+        "--manager-index", type=uuid.UUID, action="append", metavar="MANAGER_ID",
+        help="build partial HNSW indexes scoped to this manager (repeatable, for the largest tenants)",
+    )
+    args = parser.parse_args()
+    create_indexes(args.concurrently, args.ivfflat, args.lists, args.maintenance_work_mem, args.manager_index)
@@ -0,0 +1,43 @@
+import argparse
+import os
+import sys
+import time
+import uuid
+from datetime import date
+from dotenv import load_dotenv
+
+# Ensure src is in pythonpath
+sys.path.append(os.getcwd())
+load_dotenv()
+
+from src.database import SessionLocal, engine, Base
+from src.modules.managers.models import ManagerModel
+from src.modules.employees.models import EmployeeModel
+from src.modules.clients.models import ClientModel
+from src.modules.job_shifts.models import JobShiftModel
+from src.modules.agents.models import AgentModel
+from src.modules.reporting.models import ShiftDailyRollupModel
+from src.modules.reporting.service import rebuild_rollups
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Recompute shift_daily_rollups from job_shifts, e.g. after a backfill or a rate change."
+    )
+    parser.add_argument("--manager-id", type=uuid.UUID, help="only this manager (default: all)")
+    parser.add_argument("--start", type=date.fromisoformat, help="first UTC day to rebuild, YYYY-MM-DD")
+    parser.add_argument("--end", type=date.fromisoformat, help="day after the last one to rebuild, YYYY-MM-DD")
+    args = parser.parse_args()
+
+    Base.metadata.create_all(bind=engine, tables=[ShiftDailyRollupModel.__table__])
+
+    start = time.perf_counter()
+    with SessionLocal() as db:
+        # One transaction: readers see either the old rollups or the rebuilt ones
+        rows = rebuild_rollups(db, args.manager_id, args.start, args.end)
+        db.commit()
+    print(f"Rebuilt {rows} rollup rows in {time.perf_counter() - start:.1f}s")
+
+
+if __name__ == "__main__":
+    main()
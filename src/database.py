@@ -1,20 +1,87 @@
 import os
 from dotenv import load_dotenv
-from sqlalchemy import create_engine
+from sqlalchemy import DDL, create_engine, event
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.orm import sessionmaker, declarative_base
+from sqlalchemy.pool import AsyncAdaptedQueuePool, QueuePool
+
+from src.modules.shared.pool_metrics import PoolMetrics, instrument_pool_class
 
 load_dotenv()
 
 DATABASE_URL = os.getenv("DATABASE_URL")
 
-engine = create_engine(DATABASE_URL)
+# libpq query parameters asyncpg understands, by its name for them; sslmode values
+# (disable, prefer, require, verify-full, ...) are accepted by asyncpg's ssl as they are
+ASYNCPG_QUERY_PARAMS = {"host": "host", "port": "port", "sslmode": "ssl"}
+
+def async_database_url(url: str):
+    """DATABASE_URL with the asyncpg driver and its query string translated for asyncpg.
+
+    asyncpg takes every query parameter as a keyword argument, so psycopg2-only
+    ones would fail at connect time; those need an explicit ASYNC_DATABASE_URL.
+    """
+    url = make_url(url)
+    unsupported = sorted(set(url.query) - set(ASYNCPG_QUERY_PARAMS))
+    if unsupported:
+        raise ValueError(
+            f"DATABASE_URL parameters {', '.join(unsupported)} have no asyncpg equivalent; set ASYNC_DATABASE_URL"
+        )
+    query = {ASYNCPG_QUERY_PARAMS[key]: value for key, value in url.query.items()}
+    return url.set(drivername="postgresql+asyncpg", query=query)
+
+# The async engine talks to the same database through asyncpg. It can be pointed
+# elsewhere explicitly, otherwise it is derived from DATABASE_URL.
+ASYNC_DATABASE_URL = os.getenv("ASYNC_DATABASE_URL") or async_database_url(DATABASE_URL)
+
+# Pool sizing is per engine and per process: with N uvicorn workers the database
+# sees up to N * 2 * (DB_POOL_SIZE + DB_MAX_OVERFLOW) connections.
+POOL_OPTIONS = {
+    "pool_size": int(os.getenv("DB_POOL_SIZE", "5")),
+    "max_overflow": int(os.getenv("DB_MAX_OVERFLOW", "10")),
+    "pool_timeout": float(os.getenv("DB_POOL_TIMEOUT", "30")),
+    "pool_recycle": int(os.getenv("DB_POOL_RECYCLE", "1800")),
+    "pool_pre_ping": os.getenv("DB_POOL_PRE_PING", "true").lower() in ("1", "true", "yes"),
+}
+
+pool_metrics = PoolMetrics()
+async_pool_metrics = PoolMetrics()
+
+engine = create_engine(
+    DATABASE_URL,
+    poolclass=instrument_pool_class(QueuePool, pool_metrics),
+    **POOL_OPTIONS,
+)
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
+async_engine = create_async_engine(
+    ASYNC_DATABASE_URL,
+    poolclass=instrument_pool_class(AsyncAdaptedQueuePool, async_pool_metrics),
+    **POOL_OPTIONS,
+)
+AsyncSessionLocal = async_sessionmaker(async_engine, class_=AsyncSession, autoflush=False, expire_on_commit=False)
+
 Base = declarative_base()
 
+# Extensions the models' column types and indexes depend on, created ahead of create_all
+for extension in ("vector", "pg_trgm", "btree_gist"):
+    event.listen(Base.metadata, "before_create", DDL(f"CREATE EXTENSION IF NOT EXISTS {extension}"))
+
 def get_db():
     db = SessionLocal()
     try:
         yield db
     finally:
         db.close()
+
+async def get_async_db():
+    async with AsyncSessionLocal() as db:
+        yield db
+
+def get_pool_stats() -> dict:
+    return {
+        "config": POOL_OPTIONS,
+        "sync": pool_metrics.snapshot(engine.pool),
+        "async": async_pool_metrics.snapshot(async_engine.pool),
+    }
@@ -1,28 +1,48 @@
+import asyncio
 import os
+from contextlib import asynccontextmanager
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from dotenv import load_dotenv
 
-from src.database import engine, Base
+from src.database import engine, Base, get_pool_stats
 from src.modules.managers.router import router as managers_router
 from src.modules.employees.router import router as employees_router
 from src.modules.clients.router import router as clients_router
-from src.modules.shared.domain.bus import InMemoryEventBus
-from src.modules.employees.events import EmployeeCreated
+from src.modules.shared.domain.bus import AsyncEventBus, InMemoryEventBus
+from src.modules.employees.events import EmployeeCreated, EmployeesImported
 from src.modules.employees.handlers import EmployeeEmbeddingHandler
-from src.modules.clients.events import ClientCreated
+from src.modules.clients.events import ClientCreated, ClientsImported
 from src.modules.clients.handlers import ClientEmbeddingHandler
-from src.modules.embeddings.service import GeminiEmbeddingService
+from src.modules.job_shifts.events import JobShiftCreated, JobShiftsBulkCreated, JobShiftUpdated
+from src.modules.reporting.handlers import ShiftRollupHandler
+from src.modules.reporting.models import ShiftDailyRollupModel
+from src.modules.outbox.models import OutboxEventModel
+from src.modules.outbox.registry import event_registry
+from src.modules.outbox.relay import OutboxRelay
+from src.modules.embeddings.providers import embedding_service_from_env
+from src.modules.embeddings.cache import CachedEmbeddingService, EmbeddingCache
 
 load_dotenv()
 
 # Create database tables
 Base.metadata.create_all(bind=engine)
 
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Async handlers run on this loop; sync ones on the bus's worker threads
+    event_bus.start(asyncio.get_running_loop())
+    outbox_relay.start()
+    yield
+    # Off the loop: the relay may be mid-batch, and the drain may wait on async handlers that need it
+    await asyncio.to_thread(outbox_relay.stop)
+    await asyncio.to_thread(event_bus.shutdown, float(os.getenv("EVENT_BUS_SHUTDOWN_TIMEOUT", "30")))
+
 app = FastAPI(
     title="Personal Assistant API",
     description="API for Personal Assistant application",
-    version="1.0.0"
+    version="1.0.0",
+    lifespan=lifespan
 )
 
 
@@ -34,23 +54,53 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
-# Initialize Event Bus
-event_bus = InMemoryEventBus()
+# Initialize Event Bus: handlers run off the request path, on a bounded queue
+event_bus = AsyncEventBus(
+    workers=int(os.getenv("EVENT_BUS_WORKERS", "4")),
+    max_queue_size=int(os.getenv("EVENT_BUS_QUEUE_SIZE", "1000")),
+)
+
+# Employee and client events are committed to the outbox with the rows they describe.
+# Every process runs a relay; SKIP LOCKED keeps them from dispatching the same event twice.
+# The relay runs their handlers inline on its own bus, so an event leaves the outbox only
+# after its handlers succeeded; failures are recorded on the row and retried.
+event_registry.register(EmployeeCreated, EmployeesImported, ClientCreated, ClientsImported)
+outbox_bus = InMemoryEventBus()
+outbox_relay = OutboxRelay(
+    outbox_bus,
+    event_registry,
+    batch_size=int(os.getenv("OUTBOX_BATCH_SIZE", "100")),
+    poll_interval=float(os.getenv("OUTBOX_POLL_INTERVAL", "1.0")),
+)
+
+# Shared by every request so repeated search queries skip the embedding API
+embedding_cache = EmbeddingCache.from_env()
+app.state.embedding_service = None
+
+# Daily shift rollups for the reporting endpoints follow every shift write
+shift_rollup_handler = ShiftRollupHandler()
+event_bus.subscribe(JobShiftCreated, shift_rollup_handler.handle)
+event_bus.subscribe(JobShiftUpdated, shift_rollup_handler.handle)
+event_bus.subscribe(JobShiftsBulkCreated, shift_rollup_handler.handle_bulk)
 
 # Initialize Services and Handlers
-api_key = os.getenv("GEMINI_API_KEY")
-if api_key:
-    embedding_service = GeminiEmbeddingService(api_key=api_key)
+# Gemini by default; EMBEDDING_PROVIDER=hashing or sentence-transformers embeds locally, offline
+embedding_service = embedding_service_from_env()
+if embedding_service:
+    # One process-wide service; clients and models are loaded on first use or at startup
+    app.state.embedding_service = CachedEmbeddingService(embedding_service, embedding_cache)
     
-    # Handlers
+    # Handlers: they embed and store the vectors before the relay lets go of the event
     employee_embedding_handler = EmployeeEmbeddingHandler(embedding_service)
     client_embedding_handler = ClientEmbeddingHandler(embedding_service)
     
-    # Register Handlers
-    event_bus.subscribe(EmployeeCreated, employee_embedding_handler.handle)
-    event_bus.subscribe(ClientCreated, client_embedding_handler.handle)
+    # Register Handlers on the bus the outbox relay dispatches to
+    outbox_bus.subscribe(EmployeeCreated, employee_embedding_handler.handle)
+    outbox_bus.subscribe(ClientCreated, client_embedding_handler.handle)
+    outbox_bus.subscribe(EmployeesImported, employee_embedding_handler.handle_imported)
+    outbox_bus.subscribe(ClientsImported, client_embedding_handler.handle_imported)
 else:
-    print("WARNING: GEMINI_API_KEY not found. Embeddings will not be generated.")
+    print("WARNING: GEMINI_API_KEY not found and no local EMBEDDING_PROVIDER set. Embeddings will not be generated.")
 
 app.include_router(managers_router, prefix="/api")
 app.include_router(employees_router, prefix="/api")
@@ -61,6 +111,17 @@ app.include_router(job_shifts_router, prefix="/api")
 from src.modules.agents.router import router as agents_router
 app.include_router(agents_router, prefix="/api")
 
+from src.modules.reporting.router import router as reporting_router
+app.include_router(reporting_router, prefix="/api")
+
 @app.get("/")
 def read_root():
     return {"message": "Welcome to Personal Assistant API"}
+
+@app.get("/metrics/db-pool")
+def read_db_pool_stats():
+    return get_pool_stats()
+
+@app.get("/metrics/embedding-cache")
+def read_embedding_cache_stats():
+    return embedding_cache.stats()
@@ -9,3 +9,8 @@ class ClientCreated(DomainEvent):
     mobile: str
     email: str
     client_description: str
+
+# Published once per import batch instead of one ClientCreated per row
+@dataclass(frozen=True, kw_only=True)
+class ClientsImported(DomainEvent):
+    clients: tuple[ClientCreated, ...]
@@ -1,33 +1,38 @@
-from sqlalchemy.orm import Session
-from src.modules.clients.events import ClientCreated
-from src.modules.embeddings.service import GeminiEmbeddingService
+from sqlalchemy.orm import Session, sessionmaker
+from src.database import SessionLocal
+from src.modules.clients.events import ClientCreated, ClientsImported
 from src.modules.clients.models import ClientModel
-from src.database import SessionLocal 
+from src.modules.embeddings.service import EmbeddingService
+from src.modules.embeddings.storage import embed_rows
+
+
+def client_embedding_text(client_name: str, mobile: str, email: str, client_description: str) -> str:
+    return f"{client_name} | {mobile} | {email} | {client_description}"
+
 
 class ClientEmbeddingHandler:
-    def __init__(self, embedding_service: GeminiEmbeddingService):
+    """Embeds clients as the outbox relay hands over their events; see EmployeeEmbeddingHandler."""
+
+    def __init__(self, embedding_service: EmbeddingService, session_factory: sessionmaker = SessionLocal):
         self.embedding_service = embedding_service
+        self.session_factory = session_factory
 
     def handle(self, event: ClientCreated):
-        text_to_embed = f"{event.client_name} | {event.mobile} | {event.email} | {event.client_description}"
-        print(f"Generating embedding for client: {text_to_embed}")
-        
+        self._embed([event])
+
+    def handle_imported(self, event: ClientsImported):
+        # One embed_texts call for the whole batch
+        self._embed(event.clients)
+
+    def _embed(self, clients: list[ClientCreated]) -> None:
+        texts = {
+            client.client_id: client_embedding_text(client.client_name, client.mobile, client.email, client.client_description)
+            for client in clients
+        }
+        db: Session = self.session_factory()
         try:
-            embedding_vector = self.embedding_service.embed_text(text_to_embed)
-            
-            db: Session = SessionLocal()
-            try:
-                stmt = (
-                    ClientModel.__table__
-                    .update()
-                    .where(ClientModel.id == event.client_id)
-                    .values(embedding=embedding_vector)
-                )
-                db.execute(stmt)
-                db.commit()
-                print(f"Updated embedding for client {event.client_id}")
-            finally:
-                db.close()
-                
-        except Exception as e:
-            print(f"Error generating/saving embedding for client {event.client_id}: {e}")
+            updated = embed_rows(db, self.embedding_service, ClientModel.__table__, texts)
+            db.commit()
+        finally:
+            db.close()
+        print(f"Updated {updated} embeddings in clients")
@@ -1,13 +1,25 @@
 import uuid
-from sqlalchemy import Column, String, DateTime, ForeignKey, Float
-from sqlalchemy.orm import relationship
+from sqlalchemy import Column, String, DateTime, ForeignKey, Float, Index
+from sqlalchemy.orm import deferred, relationship
 from pgvector.sqlalchemy import Vector
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.sql import func
 from src.database import Base
+from src.modules.embeddings.indexes import hnsw_index
+from src.modules.embeddings.storage import EMBEDDING_DIMS
+from src.modules.shared.text_search import trigram_index
 
 class ClientModel(Base):
     __tablename__ = "clients"
+    __table_args__ = (
+        hnsw_index("ix_clients_embedding_hnsw", "embedding"),
+        trigram_index("ix_clients_client_name_trgm", "client_name"),
+        trigram_index("ix_clients_email_trgm", "email"),
+        trigram_index("ix_clients_mobile_trgm", "mobile"),
+        trigram_index("ix_clients_client_description_trgm", "client_description"),
+        # Keyset pagination order
+        Index("ix_clients_created_at_id", "created_at", "id"),
+    )
 
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4, index=True)
     client_name = Column(String, index=True)
@@ -16,10 +28,13 @@ class ClientModel(Base):
     client_description = Column(String)
     default_rate = Column(Float, default=0.0)
     
-    manager_id = Column(UUID(as_uuid=True), ForeignKey("managers.id"))
+    manager_id = Column(UUID(as_uuid=True), ForeignKey("managers.id"), index=True)
     manager = relationship("ManagerModel", back_populates="clients")
     
-    embedding = Column(Vector(1536))
+    # Deferred: only the vector search and embedding writers touch it, never regular reads
+    embedding = deferred(Column(Vector(EMBEDDING_DIMS)))
+    # model_version of the service that produced the embedding; NULL or outdated rows are re-embedded by backfill_embeddings.py
+    embedding_model = deferred(Column(String))
     
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     updated_at = Column(DateTime(timezone=True), onupdate=func.now())
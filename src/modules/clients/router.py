@@ -1,32 +1,53 @@
-from fastapi import APIRouter, Depends, HTTPException, status
-import os
+from fastapi import APIRouter, Depends, HTTPException, Request, status, Query
+from fastapi.concurrency import run_in_threadpool
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
-from typing import List
+from typing import List, Optional
+from uuid import UUID
 
-from src.database import get_db
-from src.modules.clients.schemas import ClientCreate, ClientRead, ClientSearchRequest, ClientSearchResult, ClientFindRequest, ClientTextSearchRequest
-from src.modules.clients.service import ClientService
-from src.modules.shared.domain.bus import EventBus
-from src.modules.embeddings.service import GeminiEmbeddingService
+from src.database import get_async_db, get_db
+from src.modules.clients.schemas import ClientCreate, ClientImport, ClientImportResult, ClientRead, ClientSearchRequest, ClientSearchResult, ClientFindRequest, ClientTextSearchRequest, ClientHybridSearchRequest, ClientHybridSearchResult
+from src.modules.clients.service import IMPORT_BATCH_SIZE, AsyncClientService, ClientService, clients_export_query
+from src.modules.shared.csv_import import CsvValidationError, iter_csv_batches, validate_rows
+from src.modules.shared.export import ExportFormat, export_response
+from src.modules.shared.pagination import MAX_PAGE_SIZE, CursorPage, InvalidCursor
+from src.modules.shared.domain.bus import EventPublisher
+from src.modules.outbox.bus import OutboxEventBus
+from src.modules.embeddings.cache import CachedEmbeddingService
 
-# Defer import of event_bus to avoid circular dependency, same pattern as employees
-def get_event_bus():
-    from src.main import event_bus
-    return event_bus
+def get_event_bus(db: Session = Depends(get_db)) -> EventPublisher:
+    # Deferred import to avoid circular dependency
+    from src.main import outbox_relay
+    # Events go to the outbox in the request's transaction; the relay dispatches them after commit
+    return OutboxEventBus(db, on_commit=outbox_relay.wake)
 
-def get_embedding_service():
-    api_key = os.getenv("GEMINI_API_KEY")
-    if not api_key:
-        raise HTTPException(status_code=500, detail="GEMINI_API_KEY not configured")
-    return GeminiEmbeddingService(api_key=api_key)
+def get_embedding_service(request: Request) -> CachedEmbeddingService:
+    # Process-wide instance created in src/main.py
+    embedding_service = request.app.state.embedding_service
+    if embedding_service is None:
+        raise HTTPException(status_code=500, detail="Embedding service not configured")
+    return embedding_service
 
 def get_service(
     db: Session = Depends(get_db), 
-    event_bus: EventBus = Depends(get_event_bus),
-    embedding_service: GeminiEmbeddingService = Depends(get_embedding_service)
+    event_bus: EventPublisher = Depends(get_event_bus),
+    embedding_service: CachedEmbeddingService = Depends(get_embedding_service)
 ) -> ClientService:
     return ClientService(db, event_bus, embedding_service)
 
+def get_import_service(db: Session = Depends(get_db), event_bus: EventPublisher = Depends(get_event_bus)) -> ClientService:
+    # Imports never embed inline (the worker does), so they work without GEMINI_API_KEY
+    return ClientService(db, event_bus, None)
+
+def get_async_service(db: AsyncSession = Depends(get_async_db)) -> AsyncClientService:
+    return AsyncClientService(db)
+
+def get_async_search_service(
+    db: AsyncSession = Depends(get_async_db),
+    embedding_service: CachedEmbeddingService = Depends(get_embedding_service)
+) -> AsyncClientService:
+    return AsyncClientService(db, embedding_service)
+
 router = APIRouter(
     prefix="/clients",
     tags=["clients"],
@@ -43,9 +64,46 @@ def create_client(
         raise HTTPException(status_code=400, detail="Email already registered")
     return service.create_client(client=client)
 
-@router.get("/", response_model=List[ClientRead])
-def read_clients(skip: int = 0, limit: int = 100, service: ClientService = Depends(get_service)):
-    return service.get_clients(skip=skip, limit=limit)
+@router.post("/import", response_model=ClientImportResult, status_code=status.HTTP_201_CREATED)
+def import_clients(clients: ClientImport, service: ClientService = Depends(get_import_service)):
+    """
+    Create many clients at once. Emails that are already registered (or repeated in the body) are skipped and returned.
+    """
+    return service.import_clients(clients)
+
+@router.post("/import/csv", response_model=ClientImportResult, status_code=status.HTTP_201_CREATED)
+async def import_clients_csv(request: Request, manager_id: UUID, service: ClientService = Depends(get_import_service)):
+    """
+    Create clients for a manager from a CSV body whose header row names ClientCreate fields.
+    The upload is parsed and inserted in batches as it streams in; a row that fails validation rejects the whole import.
+    """
+    inserted, skipped_emails = [], []
+    async for batch in iter_csv_batches(request.stream(), IMPORT_BATCH_SIZE):
+        try:
+            clients = validate_rows(ClientCreate, batch, manager_id=manager_id)
+        except CsvValidationError as e:
+            raise HTTPException(status_code=422, detail=e.errors)
+        batch_inserted, batch_skipped = await run_in_threadpool(service.insert_clients, clients)
+        inserted += batch_inserted
+        skipped_emails += batch_skipped
+    if not inserted and not skipped_emails:
+        raise HTTPException(status_code=400, detail="CSV has no rows")
+    return await run_in_threadpool(service.commit_import, inserted, skipped_emails)
+
+@router.get("/export")
+def export_clients(format: ExportFormat = "ndjson", manager_id: Optional[UUID] = None):
+    """
+    Stream every client (optionally one manager's) as NDJSON or CSV, without building the whole list in memory.
+    """
+    return export_response(clients_export_query(manager_id), format, "clients")
+
+@router.get("/", response_model=CursorPage[ClientRead])
+def read_clients(cursor: Optional[str] = None, limit: int = Query(100, ge=1, le=MAX_PAGE_SIZE), service: ClientService = Depends(get_service)):
+    try:
+        clients, next_cursor = service.get_clients(cursor=cursor, limit=limit)
+    except InvalidCursor as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    return {"items": clients, "next_cursor": next_cursor}
 
 @router.post("/general-semantic-search", response_model=List[ClientSearchResult])
 def search_clients(
@@ -55,19 +113,41 @@ def search_clients(
     """
     Search for clients using semantic search on their profile embedding.
     """
-    return service.search_clients(query=request.query, limit=request.limit)
+    return service.search_clients(
+        query=request.query,
+        limit=request.limit,
+        manager_id=request.manager_id,
+        ef_search=request.ef_search,
+        probes=request.probes
+    )
 
 @router.post("/text-search", response_model=List[ClientRead])
-def search_clients_text(
+async def search_clients_text(
     request: ClientTextSearchRequest,
-    service: ClientService = Depends(get_service)
+    service: AsyncClientService = Depends(get_async_service)
 ):
-    return service.search_clients_text(
+    return await service.search_clients_text(
         query=request.query,
         manager_id=request.manager_id,
         limit=request.limit
     )
 
+@router.post("/hybrid-search", response_model=List[ClientHybridSearchResult])
+async def hybrid_search_clients(
+    request: ClientHybridSearchRequest,
+    service: AsyncClientService = Depends(get_async_search_service)
+):
+    """
+    Search clients by text and by embedding in one call, ranked with reciprocal rank fusion.
+    """
+    return await service.hybrid_search_clients(
+        query=request.query,
+        manager_id=request.manager_id,
+        limit=request.limit,
+        candidates=request.candidates,
+        ef_search=request.ef_search
+    )
+
 @router.post("/FindClients", response_model=List[ClientRead])
 def find_clients(
     search_params: ClientFindRequest,
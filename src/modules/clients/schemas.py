@@ -1,6 +1,6 @@
-from pydantic import BaseModel, EmailStr
+from pydantic import BaseModel, EmailStr, Field
 from datetime import datetime
-from typing import Optional
+from typing import Annotated, Optional
 from uuid import UUID
 
 class ClientBase(BaseModel):
@@ -13,6 +13,17 @@ class ClientBase(BaseModel):
 class ClientCreate(ClientBase):
     manager_id: UUID
 
+MAX_IMPORT_ROWS = 50_000
+
+# JSON body of POST /clients/import
+ClientImport = Annotated[list[ClientCreate], Field(min_length=1, max_length=MAX_IMPORT_ROWS)]
+
+class ClientImportResult(BaseModel):
+    created: int
+    ids: list[UUID]
+    # Already registered, or repeated within the import
+    skipped_emails: list[str]
+
 class ClientRead(ClientBase):
     id: UUID
     manager_id: UUID
@@ -25,6 +36,10 @@ class ClientRead(ClientBase):
 class ClientSearchRequest(BaseModel):
     query: str
     limit: int = 5
+    manager_id: Optional[UUID] = None
+    # Optional ANN tuning: larger values improve recall at the cost of latency
+    ef_search: Optional[int] = Field(None, ge=1, le=1000)
+    probes: Optional[int] = Field(None, ge=1)
 
 class ClientSearchResult(ClientRead):
     similarity_score: float
@@ -41,3 +56,17 @@ class ClientTextSearchRequest(BaseModel):
     query: str
     manager_id: Optional[UUID] = None
     limit: int = 10
+
+class ClientHybridSearchRequest(BaseModel):
+    query: str
+    manager_id: Optional[UUID] = None
+    limit: int = Field(10, ge=1, le=100)
+    # How many candidates each of the lexical and vector legs contributes before fusion
+    candidates: int = Field(50, ge=1, le=1000)
+    ef_search: Optional[int] = Field(None, ge=1, le=1000)
+
+class ClientHybridSearchResult(ClientRead):
+    score: float
+    lexical_rank: Optional[int] = None
+    vector_rank: Optional[int] = None
+    similarity_score: Optional[float] = None
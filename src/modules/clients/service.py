@@ -1,14 +1,29 @@
+import asyncio
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 from sqlalchemy.orm import Session
-from sqlalchemy import or_
+from sqlalchemy import Select, select
 from src.modules.clients.models import ClientModel
-from src.modules.clients.schemas import ClientCreate
-from src.modules.shared.domain.bus import EventBus
-from src.modules.clients.events import ClientCreated
+from src.modules.clients.schemas import ClientCreate, ClientRead
+from src.modules.shared.bulk import bulk_insert, with_ids
+from src.modules.shared.domain.bus import EventPublisher
+from src.modules.clients.events import ClientCreated, ClientsImported
 from uuid import UUID
-from src.modules.embeddings.service import GeminiEmbeddingService
+from src.modules.embeddings.service import EmbeddingService
+from src.modules.embeddings.quantization import VECTOR_SEARCH, VectorSearch
+from src.database import AsyncSessionLocal
+from src.modules.embeddings.indexes import apply_ann_settings, apply_ann_settings_async
+from src.modules.shared.pagination import keyset_paginate
+from src.modules.shared.ranking import reciprocal_rank_fusion
+from src.modules.shared.text_search import contains, contains_any, relevance
+
+CLIENT_PAGE_KEY = (ClientModel.created_at, ClientModel.id)
+
+# Rows per INSERT and per imported event; the whole import is still one transaction
+IMPORT_BATCH_SIZE = 1000
+IMPORT_COLUMNS = ["id", "client_name", "mobile", "email", "client_description", "default_rate", "manager_id"]
 
 class ClientService:
-    def __init__(self, db: Session, event_bus: EventBus, embedding_service: GeminiEmbeddingService):
+    def __init__(self, db: Session, event_bus: EventPublisher, embedding_service: EmbeddingService):
         self.db = db
         self.event_bus = event_bus
         self.embedding_service = embedding_service
@@ -18,8 +33,8 @@ class ClientService:
             **client.model_dump()
         )
         self.db.add(db_client)
-        self.db.commit()
-        self.db.refresh(db_client)
+        # Assigns the id the event carries
+        self.db.flush()
         
         event = ClientCreated(
             client_id=db_client.id,
@@ -28,27 +43,81 @@ class ClientService:
             email=db_client.email,
             client_description=db_client.client_description
         )
+        # Written to the outbox in this transaction, so the event commits with the client
         self.event_bus.publish(event)
+        self.db.commit()
+        self.db.refresh(db_client)
         
         return db_client
 
-    def get_clients(self, skip: int = 0, limit: int = 100) -> list[ClientModel]:
-        return self.db.query(ClientModel).offset(skip).limit(limit).all()
+    def import_clients(self, clients: list[ClientCreate]) -> dict:
+        """Insert many clients in one transaction, skipping emails that are already taken."""
+        inserted, skipped_emails = [], []
+        for start in range(0, len(clients), IMPORT_BATCH_SIZE):
+            batch_inserted, batch_skipped = self.insert_clients(clients[start:start + IMPORT_BATCH_SIZE])
+            inserted += batch_inserted
+            skipped_emails += batch_skipped
+        return self.commit_import(inserted, skipped_emails)
+
+    def insert_clients(self, clients: list[ClientCreate]) -> tuple[list[dict], list[str]]:
+        """Insert one batch of an import and publish its event without committing.
+
+        Returns the inserted rows and the skipped emails.
+
+        ON CONFLICT (email) DO NOTHING settles uniqueness for the whole batch in the
+        INSERT itself, against both existing rows and rows earlier in the same import.
+        """
+        rows = with_ids([client.model_dump() for client in clients])
+        stmt = (
+            bulk_insert(ClientModel.__table__, rows, IMPORT_COLUMNS)
+            .on_conflict_do_nothing(index_elements=["email"])
+            .returning(ClientModel.id)
+        )
+        inserted_ids = set(self.db.execute(stmt).scalars())
+        inserted = [row for row in rows if row["id"] in inserted_ids]
+        skipped_emails = [row["email"] for row in rows if row["id"] not in inserted_ids]
+        if inserted:
+            # One event per batch, committed with the import; each stays a small outbox row embedded in one call
+            self.event_bus.publish(ClientsImported(clients=tuple(
+                ClientCreated(
+                    client_id=row["id"],
+                    client_name=row["client_name"],
+                    mobile=row["mobile"],
+                    email=row["email"],
+                    client_description=row["client_description"]
+                )
+                for row in inserted
+            )))
+        return inserted, skipped_emails
+
+    def commit_import(self, inserted: list[dict], skipped_emails: list[str]) -> dict:
+        self.db.commit()
+        return {"created": len(inserted), "ids": [row["id"] for row in inserted], "skipped_emails": skipped_emails}
+
+    def get_clients(self, cursor: str = None, limit: int = 100) -> tuple[list[ClientModel], str | None]:
+        return keyset_paginate(self.db.query(ClientModel), CLIENT_PAGE_KEY, cursor, limit)
 
     def get_client_by_email(self, email: str) -> ClientModel | None:
         return self.db.query(ClientModel).filter(ClientModel.email == email).first()
 
-    def search_clients(self, query: str, limit: int = 5) -> list[ClientModel]:
+    def search_clients(
+        self,
+        query: str,
+        limit: int = 5,
+        manager_id: UUID = None,
+        ef_search: int = None,
+        probes: int = None
+    ) -> list[ClientModel]:
         # Generate embedding for the query
         query_embedding = self.embedding_service.embed_text(query)
+
+        # Recall/latency knobs for the HNSW / IVFFlat index, scoped to this transaction.
+        # A manager-scoped search also turns on iterative index scans so the filter
+        # cannot starve the result set.
+        apply_ann_settings(self.db, ef_search=ef_search, probes=probes, filtered=manager_id is not None)
         
         # Search for similar clients using cosine distance
-        distance_col = ClientModel.embedding.cosine_distance(query_embedding)
-        
-        results = self.db.query(ClientModel, distance_col)\
-            .order_by(distance_col)\
-            .limit(limit)\
-            .all()
+        results = self.db.execute(clients_vector_search_query(query_embedding, manager_id, limit)).all()
         
         # Convert to list of dicts with similarity score and distance
         return [
@@ -72,14 +141,22 @@ class ClientService:
         
         if manager_id:
             query = query.filter(ClientModel.manager_id == manager_id)
-        if client_name:
-            query = query.filter(ClientModel.client_name.ilike(f"%{client_name}%"))
-        if email:
-            query = query.filter(ClientModel.email.ilike(f"%{email}%"))
-        if mobile:
-            query = query.filter(ClientModel.mobile.ilike(f"%{mobile}%"))
-        if client_description:
-            query = query.filter(ClientModel.client_description.ilike(f"%{client_description}%"))
+
+        # Each filter is served by its column's trigram index; best matches first
+        text_params = [
+            (column, value)
+            for column, value in (
+                (ClientModel.client_name, client_name),
+                (ClientModel.email, email),
+                (ClientModel.mobile, mobile),
+                (ClientModel.client_description, client_description),
+            )
+            if value
+        ]
+        for column, value in text_params:
+            query = query.filter(contains(column, value))
+        if text_params:
+            query = query.order_by(sum(relevance(value, column) for column, value in text_params).desc())
             
         return query.all()
 
@@ -89,16 +166,127 @@ class ClientService:
         manager_id: UUID = None,
         limit: int = 10
     ) -> list[ClientModel]:
-        base_query = self.db.query(ClientModel)
+        return self.db.scalars(clients_text_search_query(query, manager_id, limit)).all()
 
-        if manager_id:
-            base_query = base_query.filter(ClientModel.manager_id == manager_id)
 
-        text_filter = or_(
-            ClientModel.client_name.ilike(f"%{query}%"),
-            ClientModel.email.ilike(f"%{query}%"),
-            ClientModel.mobile.ilike(f"%{query}%"),
-            ClientModel.client_description.ilike(f"%{query}%")
+class AsyncClientService:
+    """Read-only client queries for endpoints served on the event loop."""
+
+    def __init__(
+        self,
+        db: AsyncSession,
+        embedding_service: EmbeddingService = None,
+        session_factory: async_sessionmaker = AsyncSessionLocal
+    ):
+        self.db = db
+        self.embedding_service = embedding_service
+        # Hybrid search runs its vector leg on a second session, concurrently with the lexical one
+        self.session_factory = session_factory
+
+    async def search_clients_text(
+        self,
+        query: str,
+        manager_id: UUID = None,
+        limit: int = 10
+    ) -> list[ClientModel]:
+        return (await self.db.scalars(clients_text_search_query(query, manager_id, limit))).all()
+
+    async def hybrid_search_clients(
+        self,
+        query: str,
+        manager_id: UUID = None,
+        limit: int = 10,
+        candidates: int = 50,
+        ef_search: int = None
+    ) -> list[dict]:
+        """Fuse trigram and vector candidates with reciprocal rank fusion in one call."""
+        lexical_result, vector_results = await asyncio.gather(
+            self.db.execute(clients_text_search_query(query, manager_id, candidates)),
+            self._vector_candidates(query, manager_id, candidates, ef_search),
         )
+        lexical_results = lexical_result.scalars().all()
+
+        clients_by_id = {client.id: client for client in lexical_results}
+        distances = {}
+        for client, distance in vector_results:
+            clients_by_id.setdefault(client.id, client)
+            distances[client.id] = distance
+        lexical_ranks = {client.id: rank for rank, client in enumerate(lexical_results, start=1)}
+        vector_ranks = {client.id: rank for rank, (client, _) in enumerate(vector_results, start=1)}
+
+        fused = reciprocal_rank_fusion([list(lexical_ranks), list(vector_ranks)])[:limit]
+        return [
+            {
+                **ClientRead.model_validate(clients_by_id[client_id]).model_dump(),
+                "score": score,
+                "lexical_rank": lexical_ranks.get(client_id),
+                "vector_rank": vector_ranks.get(client_id),
+                "similarity_score": 1 - distances[client_id] if client_id in distances else None,
+            }
+            for client_id, score in fused
+        ]
+
+    async def _vector_candidates(self, query: str, manager_id: UUID, candidates: int, ef_search: int = None) -> list:
+        # The query embedding is usually a cache hit; otherwise the API call overlaps the lexical query
+        query_embedding = await asyncio.to_thread(self.embedding_service.embed_text, query)
+        async with self.session_factory() as vector_db:
+            await apply_ann_settings_async(vector_db, ef_search=ef_search, filtered=manager_id is not None)
+            stmt = clients_vector_search_query(query_embedding, manager_id, candidates)
+            return (await vector_db.execute(stmt)).all()
+
+
+def clients_export_query(manager_id: UUID = None) -> Select:
+    """Every client column except the embedding, in keyset order, for streaming exports."""
+    stmt = select(
+        ClientModel.id,
+        ClientModel.client_name,
+        ClientModel.mobile,
+        ClientModel.email,
+        ClientModel.client_description,
+        ClientModel.default_rate,
+        ClientModel.manager_id,
+        ClientModel.created_at,
+        ClientModel.updated_at,
+    )
+    if manager_id:
+        stmt = stmt.where(ClientModel.manager_id == manager_id)
+    return stmt.order_by(*CLIENT_PAGE_KEY)
+
+
+def clients_text_search_query(query: str, manager_id: UUID = None, limit: int = 10) -> Select:
+    stmt = select(ClientModel)
+
+    if manager_id:
+        stmt = stmt.where(ClientModel.manager_id == manager_id)
+
+    columns = (ClientModel.client_name, ClientModel.email, ClientModel.mobile, ClientModel.client_description)
+
+    return (
+        stmt.where(contains_any(query, *columns))
+        .order_by(relevance(query, *columns).desc(), ClientModel.id)
+        .limit(limit)
+    )
+
+
+def clients_vector_search_query(
+    query_embedding: list[float],
+    manager_id: UUID = None,
+    limit: int = 5,
+    search: VectorSearch = VECTOR_SEARCH,
+) -> Select:
+    distance_col = ClientModel.embedding.cosine_distance(query_embedding)
+    stmt = select(ClientModel, distance_col)
+
+    criteria = []
+    if manager_id:
+        # Small tenants are served from the manager_id btree and an exact sort,
+        # large ones from the HNSW index (or a per-manager partial index)
+        criteria.append(ClientModel.manager_id == manager_id)
+
+    if search.is_exact(ClientModel.embedding):
+        stmt = stmt.where(*criteria)
+    else:
+        # Candidates from the compact (halfvec / binary / truncated) index, re-ranked at full precision
+        stmt = stmt.where(ClientModel.id.in_(search.candidates(ClientModel.id, ClientModel.embedding, query_embedding, limit, *criteria)))
 
-        return base_query.filter(text_filter).limit(limit).all()
+    return stmt.order_by(distance_col).limit(limit)
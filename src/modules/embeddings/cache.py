@@ -0,0 +1,174 @@
+import hashlib
+import os
+import sqlite3
+import threading
+import time
+import unicodedata
+from array import array
+from collections import OrderedDict
+
+from src.modules.embeddings.service import EmbeddingService
+
+
+def normalize_text(text: str) -> str:
+    # Case is kept: the embedding model is case-sensitive, whitespace and Unicode forms are not meaningful
+    return " ".join(unicodedata.normalize("NFC", text).split())
+
+
+def cache_key(model_name: str, dims: int, text: str) -> str:
+    digest = hashlib.sha256(normalize_text(text).encode("utf-8")).hexdigest()
+    return f"{model_name}:{dims}:{digest}"
+
+
+class LRUEmbeddingStore:
+    """In-process tier: a size-bounded LRU map from cache key to vector."""
+
+    def __init__(self, max_entries: int):
+        self.max_entries = max_entries
+        self._entries: OrderedDict[str, list[float]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> list[float] | None:
+        with self._lock:
+            vector = self._entries.get(key)
+            if vector is not None:
+                self._entries.move_to_end(key)
+            return vector
+
+    def put(self, key: str, vector: list[float]) -> None:
+        with self._lock:
+            self._entries[key] = vector
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+class SQLiteEmbeddingStore:
+    """Persistent tier: a local SQLite file that survives restarts and is shared by workers."""
+
+    def __init__(self, path: str, max_entries: int):
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False, timeout=5.0)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS embedding_cache ("
+            "key TEXT PRIMARY KEY, vector BLOB NOT NULL, last_used REAL NOT NULL)"
+        )
+        self._conn.execute("CREATE INDEX IF NOT EXISTS ix_embedding_cache_last_used ON embedding_cache (last_used)")
+        self._conn.commit()
+
+    def get(self, key: str) -> list[float] | None:
+        with self._lock:
+            row = self._conn.execute("SELECT vector FROM embedding_cache WHERE key = ?", (key,)).fetchone()
+            if row is None:
+                return None
+            self._conn.execute("UPDATE embedding_cache SET last_used = ? WHERE key = ?", (time.time(), key))
+            self._conn.commit()
+        return array("f", row[0]).tolist()
+
+    def put(self, key: str, vector: list[float]) -> None:
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO embedding_cache (key, vector, last_used) VALUES (?, ?, ?)",
+                (key, array("f", vector).tobytes(), time.time()),
+            )
+            (count,) = self._conn.execute("SELECT count(*) FROM embedding_cache").fetchone()
+            if count > self.max_entries:
+                # Evict the least recently used tenth in one go rather than one row per insert
+                self._conn.execute(
+                    "DELETE FROM embedding_cache WHERE key IN "
+                    "(SELECT key FROM embedding_cache ORDER BY last_used LIMIT ?)",
+                    (count - self.max_entries + self.max_entries // 10,),
+                )
+            self._conn.commit()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._conn.execute("SELECT count(*) FROM embedding_cache").fetchone()[0]
+
+
+class EmbeddingCache:
+    """Two-tier embedding cache: in-process LRU in front of an optional persistent store."""
+
+    def __init__(self, memory: LRUEmbeddingStore, persistent: SQLiteEmbeddingStore | None = None):
+        self.memory = memory
+        self.persistent = persistent
+        self._lock = threading.Lock()
+        self._counters = {"memory_hits": 0, "persistent_hits": 0, "misses": 0}
+
+    @classmethod
+    def from_env(cls) -> "EmbeddingCache":
+        memory = LRUEmbeddingStore(int(os.getenv("EMBEDDING_CACHE_SIZE", "10000")))
+        path = os.getenv("EMBEDDING_CACHE_PATH")
+        persistent = None
+        if path:
+            persistent = SQLiteEmbeddingStore(path, int(os.getenv("EMBEDDING_CACHE_PERSISTENT_SIZE", "200000")))
+        return cls(memory, persistent)
+
+    def get(self, key: str) -> list[float] | None:
+        vector = self.memory.get(key)
+        if vector is not None:
+            self._count("memory_hits")
+            return vector
+        if self.persistent is not None:
+            vector = self.persistent.get(key)
+            if vector is not None:
+                self.memory.put(key, vector)
+                self._count("persistent_hits")
+                return vector
+        self._count("misses")
+        return None
+
+    def put(self, key: str, vector: list[float]) -> None:
+        self.memory.put(key, vector)
+        if self.persistent is not None:
+            self.persistent.put(key, vector)
+
+    def stats(self) -> dict:
+        with self._lock:
+            stats = dict(self._counters)
+        lookups = sum(stats.values())
+        stats["hit_ratio"] = (lookups - stats["misses"]) / lookups if lookups else 0.0
+        stats["memory_entries"] = len(self.memory)
+        stats["persistent_entries"] = len(self.persistent) if self.persistent is not None else None
+        return stats
+
+    def _count(self, counter: str) -> None:
+        with self._lock:
+            self._counters[counter] += 1
+
+
+class CachedEmbeddingService:
+    """Drop-in wrapper around an embedding service that answers repeated texts from the cache."""
+
+    def __init__(self, service: EmbeddingService, cache: EmbeddingCache):
+        self.service = service
+        self.cache = cache
+        self.model_name = service.model_name
+        self.dims = service.dims
+
+    def embed_text(self, text: str) -> list[float]:
+        key = cache_key(self.model_name, self.dims, text)
+        vector = self.cache.get(key)
+        if vector is None:
+            vector = self.service.embed_text(text)
+            self.cache.put(key, vector)
+        return vector
+
+    def embed_texts(self, texts: list[str]) -> list[list[float]]:
+        keys = [cache_key(self.model_name, self.dims, text) for text in texts]
+        vectors = [self.cache.get(key) for key in keys]
+
+        # Only the misses go to the API, deduplicated, in a single batched call
+        missing = list(dict.fromkeys(key for key, vector in zip(keys, vectors) if vector is None))
+        if missing:
+            text_by_key = dict(zip(keys, texts))
+            fresh = dict(zip(missing, self.service.embed_texts([text_by_key[key] for key in missing])))
+            for key, vector in fresh.items():
+                self.cache.put(key, vector)
+            vectors = [vector if vector is not None else fresh[key] for key, vector in zip(keys, vectors)]
+        return vectors
@@ -0,0 +1,136 @@
+from uuid import UUID
+from sqlalchemy import Index, Table, func, literal, select, text
+from sqlalchemy.dialects.postgresql import UUID as PG_UUID
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+from src.modules.embeddings.quantization import OPERATOR_CLASSES, VectorSearch
+
+# pgvector defaults; higher values build slower and recall better
+HNSW_M = 16
+HNSW_EF_CONSTRUCTION = 64
+
+
+def hnsw_index(name: str, column: str, m: int = HNSW_M, ef_construction: int = HNSW_EF_CONSTRUCTION) -> Index:
+    """HNSW index for cosine-distance search on a pgvector column, for use in ``__table_args__``."""
+    return Index(
+        name,
+        column,
+        postgresql_using="hnsw",
+        postgresql_with={"m": m, "ef_construction": ef_construction},
+        postgresql_ops={column: "vector_cosine_ops"},
+    )
+
+
+def ivfflat_index(table: Table, lists: int) -> Index:
+    """IVFFlat index for cosine-distance search on ``table.embedding``.
+
+    IVFFlat learns its lists from existing rows, so it is built on demand from
+    create_indexes.py after the table is populated rather than declared on the model.
+    """
+    return Index(
+        f"ix_{table.name}_embedding_ivfflat",
+        table.c.embedding,
+        postgresql_using="ivfflat",
+        postgresql_with={"lists": lists},
+        postgresql_ops={"embedding": "vector_cosine_ops"},
+    )
+
+
+def manager_hnsw_index(table: Table, manager_id: UUID) -> Index:
+    """Partial HNSW index over a single manager's rows.
+
+    Worth building for the largest tenants only: their scoped searches then walk
+    a graph containing nothing but their own rows.
+    """
+    return Index(
+        f"ix_{table.name}_embedding_hnsw_{manager_id.hex}",
+        table.c.embedding,
+        postgresql_using="hnsw",
+        postgresql_with={"m": HNSW_M, "ef_construction": HNSW_EF_CONSTRUCTION},
+        postgresql_ops={"embedding": "vector_cosine_ops"},
+        postgresql_where=table.c.manager_id == literal(manager_id, PG_UUID(as_uuid=True)),
+    )
+
+
+def quantized_hnsw_index(table: Table, search: VectorSearch) -> Index:
+    """HNSW index over the compact expression ``search`` orders by (halfvec, binary or truncated dims).
+
+    Smaller than the full-precision index and faster to build and scan; the
+    exact re-rank reads the float32 column only for the few candidates.
+    """
+    return Index(
+        f"ix_{table.name}_embedding_{search.name}_hnsw",
+        search.expression(table.c.embedding).label("embedding_search"),
+        postgresql_using="hnsw",
+        postgresql_with={"m": HNSW_M, "ef_construction": HNSW_EF_CONSTRUCTION},
+        postgresql_ops={"embedding_search": OPERATOR_CLASSES[search.storage]},
+    )
+
+
+PGVECTOR_VERSION_QUERY = text("SELECT extversion FROM pg_extension WHERE extname = 'vector'")
+
+_pgvector_version: tuple[int, ...] | None = None
+
+
+def _record_pgvector_version(version: str | None) -> None:
+    global _pgvector_version
+    _pgvector_version = tuple(int(part) for part in (version or "0").split(".") if part.isdigit())
+
+
+def supports_iterative_scan(db: Session) -> bool:
+    # hnsw.iterative_scan exists from pgvector 0.8; setting it on older versions is an error
+    if _pgvector_version is None:
+        _record_pgvector_version(db.execute(PGVECTOR_VERSION_QUERY).scalar())
+    return _pgvector_version >= (0, 8)
+
+
+async def supports_iterative_scan_async(db: AsyncSession) -> bool:
+    if _pgvector_version is None:
+        _record_pgvector_version((await db.execute(PGVECTOR_VERSION_QUERY)).scalar())
+    return _pgvector_version >= (0, 8)
+
+
+def ann_settings_query(
+    ef_search: int | None = None,
+    probes: int | None = None,
+    iterative_scan: bool = False,
+):
+    """Statement that sets the ANN search knobs for the current transaction only, or None.
+
+    ``ef_search`` sizes the HNSW candidate list and ``probes`` the number of IVFFlat
+    lists scanned: both trade latency for recall. ``iterative_scan`` keeps an HNSW
+    scan going until enough rows pass the query's WHERE clause, so filtered
+    searches still return ``limit`` rows. Run it in the same transaction as the
+    search query.
+    """
+    settings = []
+    if ef_search is not None:
+        settings.append(func.set_config("hnsw.ef_search", str(ef_search), True))
+    if probes is not None:
+        settings.append(func.set_config("ivfflat.probes", str(probes), True))
+    if iterative_scan:
+        settings.append(func.set_config("hnsw.iterative_scan", "strict_order", True))
+    return select(*settings) if settings else None
+
+
+def apply_ann_settings(
+    db: Session,
+    ef_search: int | None = None,
+    probes: int | None = None,
+    filtered: bool = False,
+) -> None:
+    stmt = ann_settings_query(ef_search, probes, iterative_scan=filtered and supports_iterative_scan(db))
+    if stmt is not None:
+        db.execute(stmt)
+
+
+async def apply_ann_settings_async(
+    db: AsyncSession,
+    ef_search: int | None = None,
+    probes: int | None = None,
+    filtered: bool = False,
+) -> None:
+    iterative_scan = filtered and await supports_iterative_scan_async(db)
+    stmt = ann_settings_query(ef_search, probes, iterative_scan=iterative_scan)
+    if stmt is not None:
+        await db.execute(stmt)
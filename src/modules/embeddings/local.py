@@ -0,0 +1,125 @@
+import hashlib
+import multiprocessing
+import os
+import re
+import threading
+import unicodedata
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from src.modules.embeddings.service import EmbeddingService
+
+WORD_WEIGHT = 1.0
+# Character trigrams make near spellings ("Jon" / "John") land close together
+TRIGRAM_WEIGHT = 0.5
+
+
+def _features(text: str) -> list[tuple[str, float]]:
+    words = re.findall(r"\w+", unicodedata.normalize("NFKC", text).casefold())
+    features = [(f"w:{word}", WORD_WEIGHT) for word in words]
+    for word in words:
+        padded = f" {word} "
+        features.extend((f"c:{padded[i:i + 3]}", TRIGRAM_WEIGHT) for i in range(len(padded) - 2))
+    return features
+
+
+def hash_embed(texts: list[str], dims: int) -> np.ndarray:
+    """Feature-hash each text into a unit vector of ``dims`` floats.
+
+    Every word and character trigram is hashed to a position and a sign, so the
+    cosine similarity of two vectors approximates their weighted feature overlap.
+    """
+    vectors = np.zeros((len(texts), dims), dtype=np.float32)
+    for row, text in enumerate(texts):
+        positions, values = [], []
+        for feature, weight in _features(text):
+            digest = int.from_bytes(hashlib.blake2b(feature.encode("utf-8"), digest_size=8).digest(), "little")
+            positions.append(digest % dims)
+            values.append(weight if digest >> 63 else -weight)
+        # add.at accumulates features that collide on the same position
+        np.add.at(vectors[row], positions, values)
+    norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+    return vectors / np.where(norms == 0, 1, norms)
+
+
+class HashingEmbeddingService(EmbeddingService):
+    """Deterministic embedder that needs no model and no network.
+
+    Good enough for lexical and fuzzy-name search, and reproducible in tests and
+    benchmarks. Large batches are split across a pool of processes, one per core.
+    """
+
+    def __init__(self, dims: int = 1536, workers: int | None = None, min_chunk_size: int = 256):
+        self.model_name = "hashing-v1"
+        self.dims = dims
+        self.workers = workers or os.cpu_count() or 1
+        self.min_chunk_size = min_chunk_size
+        self._pool: ProcessPoolExecutor | None = None
+        self._pool_lock = threading.Lock()
+
+    @property
+    def pool(self) -> ProcessPoolExecutor:
+        # Spawned, not forked: the server process has threads and open connections
+        if self._pool is None:
+            with self._pool_lock:
+                if self._pool is None:
+                    self._pool = ProcessPoolExecutor(self.workers, mp_context=multiprocessing.get_context("spawn"))
+        return self._pool
+
+    def embed_text(self, text: str) -> list[float]:
+        return hash_embed([text], self.dims)[0].tolist()
+
+    def embed_texts(self, texts: list[str]) -> list[list[float]]:
+        chunks = min(self.workers, len(texts) // self.min_chunk_size)
+        if chunks <= 1:
+            return hash_embed(texts, self.dims).tolist()
+        size = -(-len(texts) // chunks)
+        parts = self.pool.map(hash_embed, [texts[i:i + size] for i in range(0, len(texts), size)], [self.dims] * chunks)
+        return np.concatenate(list(parts)).tolist()
+
+    def close(self) -> None:
+        if self._pool is not None:
+            self._pool.shutdown()
+            self._pool = None
+
+
+class SentenceTransformerEmbeddingService(EmbeddingService):
+    """A local sentence-transformers model on the CPU (the ``local`` extra).
+
+    Vectors are zero-padded up to ``dims`` so they fit the embedding columns;
+    padding leaves cosine distances unchanged.
+    """
+
+    def __init__(
+        self,
+        model_name: str = "sentence-transformers/all-MiniLM-L6-v2",
+        dims: int = 1536,
+        batch_size: int = 64,
+        device: str = "cpu",
+    ):
+        try:
+            from sentence_transformers import SentenceTransformer
+        except ImportError as e:
+            raise RuntimeError(
+                "EMBEDDING_PROVIDER=sentence-transformers requires the local extra (pip install '.[local]')"
+            ) from e
+        self.model_name = model_name
+        self.dims = dims
+        self.batch_size = batch_size
+        self.model = SentenceTransformer(model_name, device=device)
+        self.native_dims = self.model.get_sentence_embedding_dimension()
+        if self.native_dims > dims:
+            raise ValueError(f"{model_name} produces {self.native_dims} dimensions, more than {dims}")
+        # torch already spreads one batch over every core; concurrent calls would only contend
+        self._lock = threading.Lock()
+
+    def embed_text(self, text: str) -> list[float]:
+        return self.embed_texts([text])[0]
+
+    def embed_texts(self, texts: list[str]) -> list[list[float]]:
+        with self._lock:
+            vectors = self.model.encode(
+                texts, batch_size=self.batch_size, convert_to_numpy=True, normalize_embeddings=True
+            )
+        return np.pad(vectors, ((0, 0), (0, self.dims - self.native_dims))).tolist()
@@ -0,0 +1,31 @@
+import os
+
+from src.modules.embeddings.service import EmbeddingService, GeminiEmbeddingService
+from src.modules.embeddings.storage import EMBEDDING_DIMS
+
+EMBEDDING_PROVIDERS = ("gemini", "hashing", "sentence-transformers")
+
+
+def embedding_service_from_env() -> EmbeddingService | None:
+    """Build the embedding backend named by EMBEDDING_PROVIDER (default ``gemini``).
+
+    Returns None when Gemini is selected but GEMINI_API_KEY is not set. The local
+    backends are imported only when selected, so their dependencies stay optional.
+    """
+    provider = os.getenv("EMBEDDING_PROVIDER", "gemini").lower()
+    model_name = os.getenv("EMBEDDING_MODEL")
+    if provider == "gemini":
+        api_key = os.getenv("GEMINI_API_KEY")
+        if not api_key:
+            return None
+        return GeminiEmbeddingService(api_key=api_key, model_name=model_name or "gemini-embedding-001", dims=EMBEDDING_DIMS)
+    if provider == "hashing":
+        from src.modules.embeddings.local import HashingEmbeddingService
+        workers = os.getenv("EMBEDDING_WORKERS")
+        return HashingEmbeddingService(dims=EMBEDDING_DIMS, workers=int(workers) if workers else None)
+    if provider == "sentence-transformers":
+        from src.modules.embeddings.local import SentenceTransformerEmbeddingService
+        return SentenceTransformerEmbeddingService(
+            model_name=model_name or "sentence-transformers/all-MiniLM-L6-v2", dims=EMBEDDING_DIMS
+        )
+    raise ValueError(f"Unknown EMBEDDING_PROVIDER {provider!r}; expected one of {', '.join(EMBEDDING_PROVIDERS)}")
@@ -0,0 +1,91 @@
+import os
+from dataclasses import dataclass
+from typing import Literal
+
+from pgvector.sqlalchemy import BIT, HALFVEC, Vector
+from sqlalchemy import Select, cast, func, literal_column, select
+
+SearchStorage = Literal["vector", "halfvec", "binary"]
+
+# HNSW operator class per representation; binary vectors are compared by Hamming distance
+OPERATOR_CLASSES = {"vector": "vector_cosine_ops", "halfvec": "halfvec_cosine_ops", "binary": "bit_hamming_ops"}
+
+# halfvec, binary_quantize and subvector arrived in pgvector 0.7
+QUANTIZATION_MIN_PGVECTOR = (0, 7)
+
+
+@dataclass(frozen=True)
+class VectorSearch:
+    """How the approximate stage of a vector search reads the embedding column.
+
+    ``storage`` is the representation the ANN index holds: full float32 vectors,
+    float16 ``halfvec`` (half the size) or sign bits (1/32 of the size). ``dims``
+    below the column size searches only the leading dimensions of Matryoshka
+    embeddings. Anything but the full vector fetches ``rerank_factor`` times the
+    requested rows and re-ranks them by exact cosine distance on the stored
+    float32 embedding, which recovers most of the recall the compact form loses.
+    """
+
+    storage: SearchStorage = "vector"
+    dims: int | None = None
+    rerank_factor: int = 4
+
+    def __post_init__(self):
+        if self.storage not in OPERATOR_CLASSES:
+            raise ValueError(f"Unknown search storage {self.storage!r}; expected one of {', '.join(OPERATOR_CLASSES)}")
+
+    @classmethod
+    def from_env(cls) -> "VectorSearch":
+        dims = os.getenv("EMBEDDING_SEARCH_DIMS")
+        return cls(
+            storage=os.getenv("EMBEDDING_SEARCH_STORAGE", "vector").lower(),
+            dims=int(dims) if dims else None,
+            rerank_factor=int(os.getenv("EMBEDDING_RERANK_FACTOR", "4")),
+        )
+
+    @property
+    def name(self) -> str:
+        return f"{self.storage}{self.dims or ''}"
+
+    def search_dims(self, column) -> int:
+        return min(self.dims or column.type.dim, column.type.dim)
+
+    def is_exact(self, column) -> bool:
+        return self.storage == "vector" and self.search_dims(column) == column.type.dim
+
+    def expression(self, column):
+        """The compact form of ``column`` the approximate stage orders by.
+
+        An ANN index only serves the search when it is built on exactly this
+        expression (see quantized_hnsw_index).
+        """
+        dims = self.search_dims(column)
+        expression = column
+        if dims < column.type.dim:
+            # Inlined, not bound: the planner matches index expressions textually
+            expression = cast(func.subvector(column, literal_column("1"), literal_column(str(dims))), Vector(dims))
+        if self.storage == "halfvec":
+            return cast(expression, HALFVEC(dims))
+        if self.storage == "binary":
+            return cast(func.binary_quantize(expression), BIT(dims))
+        return expression
+
+    def distance(self, column, query_embedding: list[float]):
+        query = query_embedding[:self.search_dims(column)]
+        if self.storage == "binary":
+            # binary_quantize keeps one bit per dimension: whether it is positive
+            return self.expression(column).hamming_distance("".join("1" if value > 0 else "0" for value in query))
+        return self.expression(column).cosine_distance(query)
+
+    def candidates(self, id_column, column, query_embedding: list[float], limit: int, *criteria) -> Select:
+        """Ids of the nearest ``limit * rerank_factor`` rows by the compact distance, to be re-ranked exactly."""
+        return (
+            select(id_column)
+            .where(*criteria)
+            .order_by(self.distance(column, query_embedding))
+            .limit(limit * self.rerank_factor)
+        )
+
+
+# Process-wide search settings, read once like the database pool settings
+VECTOR_SEARCH = VectorSearch.from_env()
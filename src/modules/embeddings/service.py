@@ -1,11 +1,51 @@
+import math
+import threading
+from abc import ABC, abstractmethod
 from google import genai
 from google.genai import types
 
-class GeminiEmbeddingService:
+# The Gemini embedding API accepts at most this many contents per request
+MAX_BATCH_SIZE = 100
+# gemini-embedding-001 is Matryoshka-trained: a smaller output_dimensionality keeps the leading dimensions
+GEMINI_NATIVE_DIMS = 3072
+
+class EmbeddingService(ABC):
+    """An embedding backend. Vectors are ``dims`` long and compared by cosine distance."""
+
+    model_name: str
+    dims: int
+
+    @property
+    def model_version(self) -> str:
+        # Stored with every embedding; vectors from another model or size are not comparable
+        return f"{self.model_name}:{self.dims}"
+
+    @abstractmethod
+    def embed_text(self, text: str) -> list[float]:
+        pass
+
+    @abstractmethod
+    def embed_texts(self, texts: list[str]) -> list[list[float]]:
+        """Embed a batch; results come back in input order."""
+        pass
+
+
+class GeminiEmbeddingService(EmbeddingService):
     def __init__(self, api_key: str, model_name: str = "gemini-embedding-001", dims: int = 1536):
-        self.client = genai.Client(api_key=api_key)
+        self.api_key = api_key
         self.model_name = model_name
         self.dims = dims
+        self._client: genai.Client | None = None
+        self._client_lock = threading.Lock()
+
+    @property
+    def client(self) -> genai.Client:
+        # Built on first use and then reused, so its HTTP connection pool stays warm across requests
+        if self._client is None:
+            with self._client_lock:
+                if self._client is None:
+                    self._client = genai.Client(api_key=self.api_key)
+        return self._client
 
     def embed_text(self, text: str) -> list[float]:
         # Using output_dimensionality to attempt to valid the requested dims if model supports it
@@ -17,4 +57,25 @@ class GeminiEmbeddingService:
                 output_dimensionality=self.dims
             )
         )
-        return result.embeddings[0].values
+        return self._normalized(result.embeddings[0].values)
+
+    def embed_texts(self, texts: list[str]) -> list[list[float]]:
+        # One request per MAX_BATCH_SIZE texts; results come back in input order
+        vectors = []
+        for start in range(0, len(texts), MAX_BATCH_SIZE):
+            result = self.client.models.embed_content(
+                model=self.model_name,
+                contents=texts[start:start + MAX_BATCH_SIZE],
+                config=types.EmbedContentConfig(
+                    output_dimensionality=self.dims
+                )
+            )
+            vectors.extend(self._normalized(embedding.values) for embedding in result.embeddings)
+        return vectors
+
+    def _normalized(self, values: list[float]) -> list[float]:
+        # Only full-size Gemini vectors come back unit length; truncated ones are rescaled
+        if self.dims >= GEMINI_NATIVE_DIMS:
+            return values
+        norm = math.sqrt(sum(value * value for value in values))
+        return [value / norm for value in values] if norm else values
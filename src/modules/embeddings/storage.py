@@ -0,0 +1,46 @@
+import os
+from uuid import UUID
+from sqlalchemy import Table, cast, column, update, values
+from sqlalchemy.orm import Session
+from sqlalchemy.dialects.postgresql import UUID as PG_UUID
+from src.modules.embeddings.service import EmbeddingService
+
+# Size of the embedding columns; every provider is built to produce vectors this long
+EMBEDDING_DIMS = int(os.getenv("EMBEDDING_DIMS", "1536"))
+
+
+def bulk_update_embeddings(db: Session, table: Table, vectors: dict[UUID, list[float]], model: str = None) -> int:
+    """Write many embeddings with a single ``UPDATE ... FROM (VALUES ...)`` statement.
+
+    ``model`` (the embedding service's model_version) is recorded in ``embedding_model``
+    so stale vectors can be found after a model change. The caller owns the
+    transaction. Returns the number of rows updated.
+    """
+    if not vectors:
+        return 0
+
+    embedding_type = table.c.embedding.type
+    rows = values(
+        column("id", PG_UUID(as_uuid=True)),
+        column("embedding", embedding_type),
+        name="new_embeddings",
+    ).data(list(vectors.items()))
+
+    stmt = (
+        update(table)
+        .where(table.c.id == rows.c.id)
+        .values(embedding=cast(rows.c.embedding, embedding_type), embedding_model=model)
+    )
+    return db.execute(stmt).rowcount
+
+
+def embed_rows(db: Session, embedding_service: EmbeddingService, table: Table, texts: dict[UUID, str]) -> int:
+    """Embed ``texts`` keyed by row id and write the vectors with bulk_update_embeddings.
+
+    Errors from the embedding service propagate and nothing is written. The
+    caller owns the transaction. Returns the number of rows updated.
+    """
+    if not texts:
+        return 0
+    vectors = embedding_service.embed_texts(list(texts.values()))
+    return bulk_update_embeddings(db, table, dict(zip(texts, vectors)), model=embedding_service.model_version)
@@ -9,3 +9,8 @@ class EmployeeCreated(DomainEvent):
     last_name: str
     email: str
     mobile: str
+
+# Published once per import batch instead of one EmployeeCreated per row
+@dataclass(frozen=True, kw_only=True)
+class EmployeesImported(DomainEvent):
+    employees: tuple[EmployeeCreated, ...]
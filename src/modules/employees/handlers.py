@@ -1,40 +1,42 @@
-from sqlalchemy.orm import Session
-from src.modules.employees.events import EmployeeCreated
-from src.modules.embeddings.service import GeminiEmbeddingService
+from sqlalchemy.orm import Session, sessionmaker
+from src.database import SessionLocal
+from src.modules.employees.events import EmployeeCreated, EmployeesImported
 from src.modules.employees.models import EmployeeModel
-from src.database import SessionLocal # Using SessionLocal directly for simplicity in handler
+from src.modules.embeddings.service import EmbeddingService
+from src.modules.embeddings.storage import embed_rows
+
+
+def employee_embedding_text(first_name: str, last_name: str, email: str, mobile: str) -> str:
+    return f"{first_name} | {last_name} | {email} | {mobile}"
+
 
 class EmployeeEmbeddingHandler:
-    def __init__(self, embedding_service: GeminiEmbeddingService):
+    """Embeds employees as the outbox relay hands over their events.
+
+    The vectors are written before the handler returns and errors propagate, so
+    the relay deletes an event only once its embeddings are stored.
+    """
+
+    def __init__(self, embedding_service: EmbeddingService, session_factory: sessionmaker = SessionLocal):
         self.embedding_service = embedding_service
+        self.session_factory = session_factory
 
     def handle(self, event: EmployeeCreated):
-        text_to_embed = f"{event.first_name} | {event.last_name} | {event.email} | {event.mobile}"
-        print(f"Generating embedding for text: {text_to_embed}")
-        
+        self._embed([event])
+
+    def handle_imported(self, event: EmployeesImported):
+        # One embed_texts call for the whole batch
+        self._embed(event.employees)
+
+    def _embed(self, employees: list[EmployeeCreated]) -> None:
+        texts = {
+            employee.employee_id: employee_embedding_text(employee.first_name, employee.last_name, employee.email, employee.mobile)
+            for employee in employees
+        }
+        db: Session = self.session_factory()
         try:
-            embedding_vector = self.embedding_service.embed_text(text_to_embed)
-            
-            # Update employee with embedding
-            # In a real event bus this might be in a separate process/thread
-            # Ideally we'd dependency inject the DB session provider
-            db: Session = SessionLocal()
-            try:
-                # We need to fetch the employee again to update it
-                # Using the ID from the event
-                # Note: models.py needs to be imported for this to work
-                # We are directly updating the specific employee row
-                stmt = (
-                    EmployeeModel.__table__
-                    .update()
-                    .where(EmployeeModel.id == event.employee_id)
-                    .values(embedding=embedding_vector)
-                )
-                db.execute(stmt)
-                db.commit()
-                print(f"Updated embedding for employee {event.employee_id}")
-            finally:
-                db.close()
-                
-        except Exception as e:
-            print(f"Error generating/saving embedding for employee {event.employee_id}: {e}")
+            updated = embed_rows(db, self.embedding_service, EmployeeModel.__table__, texts)
+            db.commit()
+        finally:
+            db.close()
+        print(f"Updated {updated} embeddings in employees")
@@ -1,14 +1,26 @@
 import uuid
 import uuid
-from sqlalchemy import Column, String, DateTime, ForeignKey, Float
+from sqlalchemy import Column, String, DateTime, ForeignKey, Float, Index
 from pgvector.sqlalchemy import Vector
 from sqlalchemy.dialects.postgresql import UUID
-from sqlalchemy.orm import relationship
+from sqlalchemy.orm import deferred, query_expression, relationship
 from sqlalchemy.sql import func
 from src.database import Base
+from src.modules.embeddings.indexes import hnsw_index
+from src.modules.embeddings.storage import EMBEDDING_DIMS
+from src.modules.shared.text_search import trigram_index
 
 class EmployeeModel(Base):
     __tablename__ = "employees"
+    __table_args__ = (
+        hnsw_index("ix_employees_embedding_hnsw", "embedding"),
+        trigram_index("ix_employees_first_name_trgm", "first_name"),
+        trigram_index("ix_employees_last_name_trgm", "last_name"),
+        trigram_index("ix_employees_nickname_trgm", "nickname"),
+        trigram_index("ix_employees_email_trgm", "email"),
+        # Keyset pagination order
+        Index("ix_employees_created_at_id", "created_at", "id"),
+    )
 
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4, index=True)
     first_name = Column(String, index=True)
@@ -17,10 +29,16 @@ class EmployeeModel(Base):
     mobile = Column(String)
     email = Column(String, unique=True, index=True)
     default_rate = Column(Float, default=0.0)
-    manager_id = Column(UUID(as_uuid=True), ForeignKey("managers.id"))
-    embedding = Column(Vector(1536))
+    manager_id = Column(UUID(as_uuid=True), ForeignKey("managers.id"), index=True)
+    # Deferred: only the vector search and embedding writers touch it, never regular reads
+    embedding = deferred(Column(Vector(EMBEDDING_DIMS)))
+    # model_version of the service that produced the embedding; NULL or outdated rows are re-embedded by backfill_embeddings.py
+    embedding_model = deferred(Column(String))
     
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     updated_at = Column(DateTime(timezone=True), onupdate=func.now())
 
     manager = relationship("ManagerModel", back_populates="employees")
+
+    # Filled in by queries that select the resolved rate (see employees.service.with_effective_rate)
+    effective_rate = query_expression()
@@ -1,13 +1,17 @@
-from fastapi import APIRouter, Depends, HTTPException, status
-import os
+from fastapi import APIRouter, Depends, HTTPException, Request, status, Query
+from fastapi.concurrency import run_in_threadpool
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
-from typing import List
+from typing import List, Optional
 from uuid import UUID
 
-from src.database import get_db
-from src.modules.employees.schemas import EmployeeCreate, EmployeeRead, EmployeeSearchRequest, EmployeeSearchResult, EmployeeFindRequest, EmployeeTextSearchRequest
-from src.modules.employees.service import EmployeeService
-from src.modules.embeddings.service import GeminiEmbeddingService
+from src.database import get_async_db, get_db
+from src.modules.employees.schemas import EmployeeCreate, EmployeeImport, EmployeeImportResult, EmployeeRead, EmployeeSearchRequest, EmployeeSearchResult, EmployeeFindRequest, EmployeeTextSearchRequest, EmployeeHybridSearchRequest, EmployeeHybridSearchResult
+from src.modules.employees.service import IMPORT_BATCH_SIZE, AsyncEmployeeService, EmployeeService, employees_export_query
+from src.modules.shared.csv_import import CsvValidationError, iter_csv_batches, validate_rows
+from src.modules.shared.export import ExportFormat, export_response
+from src.modules.shared.pagination import MAX_PAGE_SIZE, CursorPage, InvalidCursor
+from src.modules.embeddings.cache import CachedEmbeddingService
 
 router = APIRouter(
     prefix="/employees",
@@ -15,30 +19,46 @@ router = APIRouter(
     responses={404: {"description": "Not found"}},
 )
 
-from src.modules.shared.domain.bus import EventBus
+from src.modules.shared.domain.bus import EventPublisher
+from src.modules.outbox.bus import OutboxEventBus
 
 # Dependency injection for EventBus, in a real app this would be more sophisticated
 # For now we will rely on a global or app-state based bus, or pass it via dependency overrides
 # But to keep it simple and working with the existing pattern:
 
-def get_event_bus():
+def get_event_bus(db: Session = Depends(get_db)) -> EventPublisher:
     # Deferred import to avoid circular dependency
-    from src.main import event_bus
-    return event_bus
+    from src.main import outbox_relay
+    # Events go to the outbox in the request's transaction; the relay dispatches them after commit
+    return OutboxEventBus(db, on_commit=outbox_relay.wake)
 
-def get_embedding_service():
-    api_key = os.getenv("GEMINI_API_KEY")
-    if not api_key:
-        raise HTTPException(status_code=500, detail="GEMINI_API_KEY not configured")
-    return GeminiEmbeddingService(api_key=api_key)
+def get_embedding_service(request: Request) -> CachedEmbeddingService:
+    # Process-wide instance created in src/main.py
+    embedding_service = request.app.state.embedding_service
+    if embedding_service is None:
+        raise HTTPException(status_code=500, detail="Embedding service not configured")
+    return embedding_service
 
 def get_service(
     db: Session = Depends(get_db), 
-    event_bus: EventBus = Depends(get_event_bus),
-    embedding_service: GeminiEmbeddingService = Depends(get_embedding_service)
+    event_bus: EventPublisher = Depends(get_event_bus),
+    embedding_service: CachedEmbeddingService = Depends(get_embedding_service)
 ) -> EmployeeService:
     return EmployeeService(db, event_bus, embedding_service)
 
+def get_import_service(db: Session = Depends(get_db), event_bus: EventPublisher = Depends(get_event_bus)) -> EmployeeService:
+    # Imports never embed inline (the worker does), so they work without GEMINI_API_KEY
+    return EmployeeService(db, event_bus, None)
+
+def get_async_service(db: AsyncSession = Depends(get_async_db)) -> AsyncEmployeeService:
+    return AsyncEmployeeService(db)
+
+def get_async_search_service(
+    db: AsyncSession = Depends(get_async_db),
+    embedding_service: CachedEmbeddingService = Depends(get_embedding_service)
+) -> AsyncEmployeeService:
+    return AsyncEmployeeService(db, embedding_service)
+
 @router.post("", response_model=EmployeeRead, status_code=status.HTTP_201_CREATED)
 def create_employee(
     employee: EmployeeCreate, 
@@ -51,9 +71,46 @@ def create_employee(
     # For now we assume manager_id is valid or let DB error
     return service.create_employee(employee=employee)
 
-@router.get("", response_model=List[EmployeeRead])
-def read_employees(skip: int = 0, limit: int = 100, service: EmployeeService = Depends(get_service)):
-    return service.get_employees(skip=skip, limit=limit)
+@router.post("/import", response_model=EmployeeImportResult, status_code=status.HTTP_201_CREATED)
+def import_employees(employees: EmployeeImport, service: EmployeeService = Depends(get_import_service)):
+    """
+    Create many employees at once. Emails that are already registered (or repeated in the body) are skipped and returned.
+    """
+    return service.import_employees(employees)
+
+@router.post("/import/csv", response_model=EmployeeImportResult, status_code=status.HTTP_201_CREATED)
+async def import_employees_csv(request: Request, manager_id: UUID, service: EmployeeService = Depends(get_import_service)):
+    """
+    Create employees for a manager from a CSV body whose header row names EmployeeCreate fields.
+    The upload is parsed and inserted in batches as it streams in; a row that fails validation rejects the whole import.
+    """
+    inserted, skipped_emails = [], []
+    async for batch in iter_csv_batches(request.stream(), IMPORT_BATCH_SIZE):
+        try:
+            employees = validate_rows(EmployeeCreate, batch, manager_id=manager_id)
+        except CsvValidationError as e:
+            raise HTTPException(status_code=422, detail=e.errors)
+        batch_inserted, batch_skipped = await run_in_threadpool(service.insert_employees, employees)
+        inserted += batch_inserted
+        skipped_emails += batch_skipped
+    if not inserted and not skipped_emails:
+        raise HTTPException(status_code=400, detail="CSV has no rows")
+    return await run_in_threadpool(service.commit_import, inserted, skipped_emails)
+
+@router.get("/export")
+def export_employees(format: ExportFormat = "ndjson", manager_id: Optional[UUID] = None):
+    """
+    Stream every employee (optionally one manager's) as NDJSON or CSV, without building the whole list in memory.
+    """
+    return export_response(employees_export_query(manager_id), format, "employees")
+
+@router.get("", response_model=CursorPage[EmployeeRead])
+def read_employees(cursor: Optional[str] = None, limit: int = Query(100, ge=1, le=MAX_PAGE_SIZE), service: EmployeeService = Depends(get_service)):
+    try:
+        employees, next_cursor = service.get_employees(cursor=cursor, limit=limit)
+    except InvalidCursor as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    return {"items": employees, "next_cursor": next_cursor}
 
 @router.post("/general-semantic-search", response_model=List[EmployeeSearchResult])
 def search_employees(
@@ -63,31 +120,57 @@ def search_employees(
     """
     Search for employees using semantic search on their profile embedding.
     """
-    return service.search_employees(query=request.query, limit=request.limit)
+    return service.search_employees(
+        query=request.query,
+        limit=request.limit,
+        manager_id=request.manager_id,
+        ef_search=request.ef_search,
+        probes=request.probes
+    )
 
 @router.post("/text-search", response_model=List[EmployeeRead])
-def search_employees_text(
+async def search_employees_text(
     request: EmployeeTextSearchRequest,
-    service: EmployeeService = Depends(get_service)
+    service: AsyncEmployeeService = Depends(get_async_service)
 ):
-    return service.search_employees_text(
+    return await service.search_employees_text(
         query=request.query,
         manager_id=request.manager_id,
         limit=request.limit
     )
 
+@router.post("/hybrid-search", response_model=List[EmployeeHybridSearchResult])
+async def hybrid_search_employees(
+    request: EmployeeHybridSearchRequest,
+    service: AsyncEmployeeService = Depends(get_async_search_service)
+):
+    """
+    Search employees by text and by embedding in one call, ranked with reciprocal rank fusion.
+    """
+    return await service.hybrid_search_employees(
+        query=request.query,
+        manager_id=request.manager_id,
+        limit=request.limit,
+        candidates=request.candidates,
+        ef_search=request.ef_search
+    )
+
 @router.post("/FindEmployees", response_model=List[EmployeeRead])
 def find_employees(
     search_params: EmployeeFindRequest,
     service: EmployeeService = Depends(get_service)
 ):
     """
-    Find employees based on various parameters (manager_id, first_name, last_name, email, nickname).
+    Find employees based on various parameters (manager_id, first_name, last_name, email, nickname),
+    optionally bounded and ordered by effective rate.
     """
     return service.get_employees_by_params(
         manager_id=search_params.manager_id,
         first_name=search_params.first_name,
         last_name=search_params.last_name,
         email=search_params.email,
-        nickname=search_params.nickname
+        nickname=search_params.nickname,
+        min_rate=search_params.min_rate,
+        max_rate=search_params.max_rate,
+        order_by_rate=search_params.order_by_rate
     )
@@ -1,6 +1,6 @@
-from pydantic import BaseModel, EmailStr
+from pydantic import BaseModel, EmailStr, Field, model_validator
 from datetime import datetime
-from typing import Optional
+from typing import Annotated, Literal, Optional
 from uuid import UUID
 
 class EmployeeBase(BaseModel):
@@ -14,6 +14,17 @@ class EmployeeBase(BaseModel):
 class EmployeeCreate(EmployeeBase):
     manager_id: UUID
 
+MAX_IMPORT_ROWS = 50_000
+
+# JSON body of POST /employees/import
+EmployeeImport = Annotated[list[EmployeeCreate], Field(min_length=1, max_length=MAX_IMPORT_ROWS)]
+
+class EmployeeImportResult(BaseModel):
+    created: int
+    ids: list[UUID]
+    # Already registered, or repeated within the import
+    skipped_emails: list[str]
+
 class EmployeeRead(EmployeeBase):
     id: UUID
     default_rate: float
@@ -22,12 +33,23 @@ class EmployeeRead(EmployeeBase):
     created_at: datetime
     updated_at: Optional[datetime] = None
 
+    @model_validator(mode="after")
+    def show_effective_rate_when_unset(self):
+        # An employee without their own rate is shown at the rate they are actually paid
+        if not self.default_rate and self.effective_rate is not None:
+            self.default_rate = self.effective_rate
+        return self
+
     class Config:
         from_attributes = True
 
 class EmployeeSearchRequest(BaseModel):
     query: str
     limit: int = 5
+    manager_id: Optional[UUID] = None
+    # Optional ANN tuning: larger values improve recall at the cost of latency
+    ef_search: Optional[int] = Field(None, ge=1, le=1000)
+    probes: Optional[int] = Field(None, ge=1)
 
 class EmployeeSearchResult(EmployeeRead):
     similarity_score: float
@@ -39,8 +61,26 @@ class EmployeeFindRequest(BaseModel):
     last_name: Optional[str] = None
     email: Optional[str] = None
     nickname: Optional[str] = None
+    # Bounds and ordering on the effective rate (own rate, else the manager's)
+    min_rate: Optional[float] = None
+    max_rate: Optional[float] = None
+    order_by_rate: Optional[Literal["asc", "desc"]] = None
 
 class EmployeeTextSearchRequest(BaseModel):
     query: str
     manager_id: Optional[UUID] = None
     limit: int = 10
+
+class EmployeeHybridSearchRequest(BaseModel):
+    query: str
+    manager_id: Optional[UUID] = None
+    limit: int = Field(10, ge=1, le=100)
+    # How many candidates each of the lexical and vector legs contributes before fusion
+    candidates: int = Field(50, ge=1, le=1000)
+    ef_search: Optional[int] = Field(None, ge=1, le=1000)
+
+class EmployeeHybridSearchResult(EmployeeRead):
+    score: float
+    lexical_rank: Optional[int] = None
+    vector_rank: Optional[int] = None
+    similarity_score: Optional[float] = None
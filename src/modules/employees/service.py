@@ -1,15 +1,34 @@
-from sqlalchemy.orm import Session, joinedload
-from sqlalchemy import or_
+import asyncio
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+from sqlalchemy.orm import Session, with_expression
+from sqlalchemy import Select, select
 from src.modules.employees.models import EmployeeModel
-from src.modules.employees.schemas import EmployeeCreate
-from src.modules.shared.domain.bus import EventBus
-from src.modules.employees.events import EmployeeCreated
+from src.modules.managers.models import ManagerModel
+from src.modules.employees.schemas import EmployeeCreate, EmployeeRead
+from src.modules.shared.bulk import bulk_insert, with_ids
+from src.modules.shared.domain.bus import EventPublisher
+from src.modules.employees.events import EmployeeCreated, EmployeesImported
 from uuid import UUID
-from src.modules.embeddings.service import GeminiEmbeddingService
-from src.modules.shared.rates import resolve_rate
+from src.modules.embeddings.service import EmbeddingService
+from src.modules.embeddings.quantization import VECTOR_SEARCH, VectorSearch
+from src.database import AsyncSessionLocal
+from src.modules.embeddings.indexes import apply_ann_settings, apply_ann_settings_async
+from src.modules.shared.ranking import reciprocal_rank_fusion
+from src.modules.shared.pagination import keyset_paginate
+from src.modules.shared.rates import resolve_rate_sql
+from src.modules.shared.text_search import contains, contains_any, relevance
+
+EMPLOYEE_PAGE_KEY = (EmployeeModel.created_at, EmployeeModel.id)
+
+# Rows per INSERT and per imported event; the whole import is still one transaction
+IMPORT_BATCH_SIZE = 1000
+IMPORT_COLUMNS = ["id", "first_name", "last_name", "nickname", "mobile", "email", "default_rate", "manager_id"]
+
+# Employee rate, falling back to the manager's; joins ManagerModel (see with_effective_rate)
+EFFECTIVE_RATE = resolve_rate_sql(employee_rate=EmployeeModel.default_rate, manager_rate=ManagerModel.default_rate)
 
 class EmployeeService:
-    def __init__(self, db: Session, event_bus: EventBus, embedding_service: GeminiEmbeddingService):
+    def __init__(self, db: Session, event_bus: EventPublisher, embedding_service: EmbeddingService):
         self.db = db
         self.event_bus = event_bus
         self.embedding_service = embedding_service
@@ -19,8 +38,8 @@ class EmployeeService:
             **employee.model_dump()
         )
         self.db.add(db_employee)
-        self.db.commit()
-        self.db.refresh(db_employee)
+        # Assigns the id the event carries
+        self.db.flush()
         
         event = EmployeeCreated(
             employee_id=db_employee.id,
@@ -29,39 +48,87 @@ class EmployeeService:
             email=db_employee.email,
             mobile=db_employee.mobile
         )
+        # Written to the outbox in this transaction, so the event commits with the employee
         self.event_bus.publish(event)
+        self.db.commit()
+        self.db.refresh(db_employee)
         
         return db_employee
 
-    def get_employees(self, skip: int = 0, limit: int = 100) -> list[EmployeeModel]:
-        employees = (
-            self.db.query(EmployeeModel)
-            .options(joinedload(EmployeeModel.manager))
-            .offset(skip)
-            .limit(limit)
-            .all()
+    def import_employees(self, employees: list[EmployeeCreate]) -> dict:
+        """Insert many employees in one transaction, skipping emails that are already taken."""
+        inserted, skipped_emails = [], []
+        for start in range(0, len(employees), IMPORT_BATCH_SIZE):
+            batch_inserted, batch_skipped = self.insert_employees(employees[start:start + IMPORT_BATCH_SIZE])
+            inserted += batch_inserted
+            skipped_emails += batch_skipped
+        return self.commit_import(inserted, skipped_emails)
+
+    def insert_employees(self, employees: list[EmployeeCreate]) -> tuple[list[dict], list[str]]:
+        """Insert one batch of an import and publish its event without committing.
+
+        Returns the inserted rows and the skipped emails.
+
+        ON CONFLICT (email) DO NOTHING settles uniqueness for the whole batch in the
+        INSERT itself, against both existing rows and rows earlier in the same import.
+        """
+        rows = with_ids([employee.model_dump() for employee in employees])
+        stmt = (
+            bulk_insert(EmployeeModel.__table__, rows, IMPORT_COLUMNS)
+            .on_conflict_do_nothing(index_elements=["email"])
+            .returning(EmployeeModel.id)
         )
-        return self._apply_effective_rates(employees)
+        inserted_ids = set(self.db.execute(stmt).scalars())
+        inserted = [row for row in rows if row["id"] in inserted_ids]
+        skipped_emails = [row["email"] for row in rows if row["id"] not in inserted_ids]
+        if inserted:
+            # One event per batch, committed with the import; each stays a small outbox row embedded in one call
+            self.event_bus.publish(EmployeesImported(employees=tuple(
+                EmployeeCreated(
+                    employee_id=row["id"],
+                    first_name=row["first_name"],
+                    last_name=row["last_name"],
+                    email=row["email"],
+                    mobile=row["mobile"]
+                )
+                for row in inserted
+            )))
+        return inserted, skipped_emails
+
+    def commit_import(self, inserted: list[dict], skipped_emails: list[str]) -> dict:
+        self.db.commit()
+        return {"created": len(inserted), "ids": [row["id"] for row in inserted], "skipped_emails": skipped_emails}
+
+    def get_employees(self, cursor: str = None, limit: int = 100) -> tuple[list[EmployeeModel], str | None]:
+        query = with_effective_rate(self.db.query(EmployeeModel))
+        return keyset_paginate(query, EMPLOYEE_PAGE_KEY, cursor, limit)
 
     def get_employee_by_email(self, email: str) -> EmployeeModel | None:
         return self.db.query(EmployeeModel).filter(EmployeeModel.email == email).first()
 
-    def search_employees(self, query: str, limit: int = 5) -> list[EmployeeModel]:
+    def search_employees(
+        self,
+        query: str,
+        limit: int = 5,
+        manager_id: UUID = None,
+        ef_search: int = None,
+        probes: int = None
+    ) -> list[EmployeeModel]:
         # Generate embedding for the query
         query_embedding = self.embedding_service.embed_text(query)
+
+        # Recall/latency knobs for the HNSW / IVFFlat index, scoped to this transaction.
+        # A manager-scoped search also turns on iterative index scans so the filter
+        # cannot starve the result set.
+        apply_ann_settings(self.db, ef_search=ef_search, probes=probes, filtered=manager_id is not None)
         
         # Search for similar employees using cosine distance
         # Note: pgvector's cosine_distance operator is <=>
-        distance_col = EmployeeModel.embedding.cosine_distance(query_embedding)
-        
         # Filter for similarity score > 0.695 (distance < 0.305)
         # We can do this in the query or in python. Doing it in query is more efficient.
         # But for compatibility with limit, we should filter first.
         # Disabled filtering per user request
-        results = self.db.query(EmployeeModel, distance_col)\
-            .order_by(distance_col)\
-            .limit(limit)\
-            .all()
+        results = self.db.execute(employees_vector_search_query(query_embedding, manager_id, limit)).all()
         
         # Convert to list of dicts with similarity score and distance
         return [
@@ -79,22 +146,41 @@ class EmployeeService:
         first_name: str = None,
         last_name: str = None,
         email: str = None,
-        nickname: str = None
+        nickname: str = None,
+        min_rate: float = None,
+        max_rate: float = None,
+        order_by_rate: str = None
     ) -> list[EmployeeModel]:
-        query = self.db.query(EmployeeModel).options(joinedload(EmployeeModel.manager))
-        
+        query = with_effective_rate(self.db.query(EmployeeModel))
+
         if manager_id:
             query = query.filter(EmployeeModel.manager_id == manager_id)
-        if first_name:
-            query = query.filter(EmployeeModel.first_name.ilike(f"%{first_name}%"))
-        if last_name:
-            query = query.filter(EmployeeModel.last_name.ilike(f"%{last_name}%"))
-        if email:
-            query = query.filter(EmployeeModel.email.ilike(f"%{email}%"))
-        if nickname:
-            query = query.filter(EmployeeModel.nickname.ilike(f"%{nickname}%"))
-            
-        return self._apply_effective_rates(query.all())
+
+        # Each filter is served by its column's trigram index; best matches first
+        text_params = [
+            (column, value)
+            for column, value in (
+                (EmployeeModel.first_name, first_name),
+                (EmployeeModel.last_name, last_name),
+                (EmployeeModel.email, email),
+                (EmployeeModel.nickname, nickname),
+            )
+            if value
+        ]
+        for column, value in text_params:
+            query = query.filter(contains(column, value))
+
+        if min_rate is not None:
+            query = query.filter(EFFECTIVE_RATE >= min_rate)
+        if max_rate is not None:
+            query = query.filter(EFFECTIVE_RATE <= max_rate)
+
+        if order_by_rate:
+            query = query.order_by(EFFECTIVE_RATE.desc() if order_by_rate == "desc" else EFFECTIVE_RATE.asc())
+        if text_params:
+            query = query.order_by(sum(relevance(value, column) for column, value in text_params).desc())
+
+        return query.all()
 
     def search_employees_text(
         self,
@@ -102,26 +188,138 @@ class EmployeeService:
         manager_id: UUID = None,
         limit: int = 10
     ) -> list[EmployeeModel]:
-        base_query = self.db.query(EmployeeModel).options(joinedload(EmployeeModel.manager))
+        stmt = employees_text_search_query(query, manager_id, limit)
+        return self.db.scalars(stmt).all()
 
-        if manager_id:
-            base_query = base_query.filter(EmployeeModel.manager_id == manager_id)
 
-        text_filter = or_(
-            EmployeeModel.first_name.ilike(f"%{query}%"),
-            EmployeeModel.last_name.ilike(f"%{query}%"),
-            EmployeeModel.nickname.ilike(f"%{query}%")
+class AsyncEmployeeService:
+    """Read-only employee queries for endpoints served on the event loop."""
+
+    def __init__(
+        self,
+        db: AsyncSession,
+        embedding_service: EmbeddingService = None,
+        session_factory: async_sessionmaker = AsyncSessionLocal
+    ):
+        self.db = db
+        self.embedding_service = embedding_service
+        # Hybrid search runs its vector leg on a second session, concurrently with the lexical one
+        self.session_factory = session_factory
+
+    async def search_employees_text(
+        self,
+        query: str,
+        manager_id: UUID = None,
+        limit: int = 10
+    ) -> list[EmployeeModel]:
+        stmt = employees_text_search_query(query, manager_id, limit)
+        return (await self.db.scalars(stmt)).all()
+
+    async def hybrid_search_employees(
+        self,
+        query: str,
+        manager_id: UUID = None,
+        limit: int = 10,
+        candidates: int = 50,
+        ef_search: int = None
+    ) -> list[dict]:
+        """Fuse trigram and vector candidates with reciprocal rank fusion in one call."""
+        lexical_result, vector_results = await asyncio.gather(
+            self.db.execute(employees_text_search_query(query, manager_id, candidates)),
+            self._vector_candidates(query, manager_id, candidates, ef_search),
         )
+        lexical_results = lexical_result.scalars().all()
 
-        return self._apply_effective_rates(base_query.filter(text_filter).limit(limit).all())
+        employees_by_id = {employee.id: employee for employee in lexical_results}
+        distances = {}
+        for employee, distance in vector_results:
+            employees_by_id.setdefault(employee.id, employee)
+            distances[employee.id] = distance
+        lexical_ranks = {employee.id: rank for rank, employee in enumerate(lexical_results, start=1)}
+        vector_ranks = {employee.id: rank for rank, (employee, _) in enumerate(vector_results, start=1)}
 
-    def _apply_effective_rates(self, employees: list[EmployeeModel]) -> list[EmployeeModel]:
-        for employee in employees:
-            effective_rate = resolve_rate(
-                employee_rate=getattr(employee, "default_rate", None),
-                manager_rate=getattr(employee.manager, "default_rate", None) if employee.manager else None,
-            )
-            employee.effective_rate = effective_rate
-            if employee.default_rate is None or employee.default_rate == 0:
-                employee.default_rate = effective_rate
-        return employees
+        fused = reciprocal_rank_fusion([list(lexical_ranks), list(vector_ranks)])[:limit]
+        return [
+            {
+                **EmployeeRead.model_validate(employees_by_id[employee_id]).model_dump(),
+                "score": score,
+                "lexical_rank": lexical_ranks.get(employee_id),
+                "vector_rank": vector_ranks.get(employee_id),
+                "similarity_score": 1 - distances[employee_id] if employee_id in distances else None,
+            }
+            for employee_id, score in fused
+        ]
+
+    async def _vector_candidates(self, query: str, manager_id: UUID, candidates: int, ef_search: int = None) -> list:
+        # The query embedding is usually a cache hit; otherwise the API call overlaps the lexical query
+        query_embedding = await asyncio.to_thread(self.embedding_service.embed_text, query)
+        async with self.session_factory() as vector_db:
+            await apply_ann_settings_async(vector_db, ef_search=ef_search, filtered=manager_id is not None)
+            stmt = employees_vector_search_query(query_embedding, manager_id, candidates)
+            return (await vector_db.execute(stmt)).all()
+
+
+def with_effective_rate(stmt):
+    """Load ``EmployeeModel.effective_rate`` with the rows of a select or query over employees."""
+    return stmt.outerjoin(ManagerModel, ManagerModel.id == EmployeeModel.manager_id).options(
+        with_expression(EmployeeModel.effective_rate, EFFECTIVE_RATE)
+    )
+
+
+def employees_export_query(manager_id: UUID = None) -> Select:
+    """Every employee column except the embedding, in keyset order, for streaming exports."""
+    stmt = select(
+        EmployeeModel.id,
+        EmployeeModel.first_name,
+        EmployeeModel.last_name,
+        EmployeeModel.nickname,
+        EmployeeModel.mobile,
+        EmployeeModel.email,
+        EmployeeModel.default_rate,
+        EFFECTIVE_RATE.label("effective_rate"),
+        EmployeeModel.manager_id,
+        EmployeeModel.created_at,
+        EmployeeModel.updated_at,
+    ).outerjoin(ManagerModel, ManagerModel.id == EmployeeModel.manager_id)
+    if manager_id:
+        stmt = stmt.where(EmployeeModel.manager_id == manager_id)
+    return stmt.order_by(*EMPLOYEE_PAGE_KEY)
+
+
+def employees_text_search_query(query: str, manager_id: UUID = None, limit: int = 10) -> Select:
+    stmt = with_effective_rate(select(EmployeeModel))
+
+    if manager_id:
+        stmt = stmt.where(EmployeeModel.manager_id == manager_id)
+
+    columns = (EmployeeModel.first_name, EmployeeModel.last_name, EmployeeModel.nickname)
+
+    return (
+        stmt.where(contains_any(query, *columns))
+        .order_by(relevance(query, *columns).desc(), EmployeeModel.id)
+        .limit(limit)
+    )
+
+
+def employees_vector_search_query(
+    query_embedding: list[float],
+    manager_id: UUID = None,
+    limit: int = 5,
+    search: VectorSearch = VECTOR_SEARCH,
+) -> Select:
+    distance_col = EmployeeModel.embedding.cosine_distance(query_embedding)
+    stmt = with_effective_rate(select(EmployeeModel, distance_col))
+
+    criteria = []
+    if manager_id:
+        # Small tenants are served from the manager_id btree and an exact sort,
+        # large ones from the HNSW index (or a per-manager partial index)
+        criteria.append(EmployeeModel.manager_id == manager_id)
+
+    if search.is_exact(EmployeeModel.embedding):
+        stmt = stmt.where(*criteria)
+    else:
+        # Candidates from the compact (halfvec / binary / truncated) index, re-ranked at full precision
+        stmt = stmt.where(EmployeeModel.id.in_(search.candidates(EmployeeModel.id, EmployeeModel.embedding, query_embedding, limit, *criteria)))
+
+    return stmt.order_by(distance_col).limit(limit)
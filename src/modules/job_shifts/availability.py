@@ -0,0 +1,86 @@
+from datetime import datetime, timedelta, timezone
+from itertools import groupby
+from sqlalchemy import Select, and_, func, select
+from uuid import UUID
+from src.modules.employees.models import EmployeeModel
+from src.modules.job_shifts.models import JobShiftModel, shift_period
+
+
+def busy_intervals_query(manager_id: UUID, start_date: datetime, end_date: datetime, employee_ids: list[UUID] = None) -> Select:
+    """Every employee of the manager with the shifts they work in ``[start_date, end_date)``.
+
+    One row per shift, ordered by employee then start, and a single row with NULL
+    shift bounds for an employee with no shifts. Shifts are probed per employee through
+    ix_job_shifts_employee_id_period.
+    """
+    busy = and_(
+        JobShiftModel.employee_id == EmployeeModel.id,
+        shift_period().overlaps(func.tstzrange(start_date, end_date)),
+    )
+    stmt = (
+        select(
+            EmployeeModel.id.label("employee_id"),
+            EmployeeModel.first_name,
+            EmployeeModel.last_name,
+            JobShiftModel.start_date,
+            JobShiftModel.end_date,
+        )
+        .outerjoin(JobShiftModel, busy)
+        .where(EmployeeModel.manager_id == manager_id)
+    )
+    if employee_ids:
+        stmt = stmt.where(EmployeeModel.id.in_(employee_ids))
+    return stmt.order_by(EmployeeModel.last_name, EmployeeModel.first_name, EmployeeModel.id, JobShiftModel.start_date)
+
+
+def free_slots(busy: list[tuple[datetime, datetime]], start_date: datetime, end_date: datetime) -> list[tuple[datetime, datetime]]:
+    """Gaps in ``[start_date, end_date)`` not covered by ``busy``, which must be sorted by start.
+
+    A single sweep: the cursor only moves forward, so overlapping or nested
+    shifts are absorbed without merging them first.
+    """
+    slots = []
+    cursor = start_date
+    for busy_start, busy_end in busy:
+        if busy_start > cursor:
+            slots.append((cursor, busy_start))
+        cursor = max(cursor, busy_end)
+    if cursor < end_date:
+        slots.append((cursor, end_date))
+    return slots
+
+
+def availability_from_rows(rows, start_date: datetime, end_date: datetime, min_duration: timedelta = timedelta(0)) -> list[dict]:
+    """Group the rows of busy_intervals_query by employee and sweep each one's shifts.
+
+    Employees without a free slot of at least ``min_duration`` are left out.
+    """
+    results = []
+    for _, employee_rows in groupby(rows, key=lambda row: row.employee_id):
+        employee_rows = list(employee_rows)
+        busy = [
+            (max(row.start_date, start_date), min(row.end_date, end_date))
+            for row in employee_rows if row.start_date is not None
+        ]
+        slots = [
+            {"start": slot_start, "end": slot_end}
+            for slot_start, slot_end in free_slots(busy, start_date, end_date)
+            if slot_end - slot_start >= min_duration
+        ]
+        if not slots:
+            continue
+        employee = employee_rows[0]
+        results.append({
+            "employee_id": employee.employee_id,
+            "first_name": employee.first_name,
+            "last_name": employee.last_name,
+            "fully_available": not busy,
+            "free_hours": sum((slot["end"] - slot["start"] for slot in slots), timedelta(0)).total_seconds() / 3600,
+            "free_slots": slots,
+        })
+    return results
+
+
+def as_utc(value: datetime) -> datetime:
+    # Shift times are timestamptz; a naive bound is taken as UTC so it compares with them
+    return value if value.tzinfo else value.replace(tzinfo=timezone.utc)
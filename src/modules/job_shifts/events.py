@@ -0,0 +1,32 @@
+from dataclasses import dataclass
+from datetime import datetime
+from src.modules.shared.domain.event import DomainEvent
+from uuid import UUID
+
+@dataclass(frozen=True, kw_only=True)
+class JobShiftCreated(DomainEvent):
+    shift_id: UUID
+    manager_id: UUID
+    employee_id: UUID
+    client_id: UUID
+    start_date: datetime
+
+@dataclass(frozen=True, kw_only=True)
+class JobShiftUpdated(DomainEvent):
+    shift_id: UUID
+    manager_id: UUID
+    employee_id: UUID
+    client_id: UUID
+    start_date: datetime
+    # Where the shift was before the update, so reports can move it out of its old day
+    previous_employee_id: UUID
+    previous_client_id: UUID
+    previous_start_date: datetime
+
+# Published once per manager for a bulk insert, instead of one JobShiftCreated per shift
+@dataclass(frozen=True, kw_only=True)
+class JobShiftsBulkCreated(DomainEvent):
+    manager_id: UUID
+    shift_count: int
+    first_start_date: datetime
+    last_start_date: datetime
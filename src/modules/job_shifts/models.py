@@ -1,12 +1,21 @@
 import uuid
-from sqlalchemy import Column, String, DateTime, ForeignKey, Boolean
+from sqlalchemy import Column, String, DateTime, ForeignKey, Boolean, Index
 from sqlalchemy.orm import relationship
-from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.dialects.postgresql import TSTZRANGE, UUID
 from sqlalchemy.sql import func
 from src.database import Base
 
 class JobShiftModel(Base):
     __tablename__ = "job_shifts"
+    __table_args__ = (
+        # Keyset pagination order
+        Index("ix_job_shifts_start_date_id", "start_date", "id"),
+        # Equality column first, then the start_date range the schedule queries filter on.
+        # The manager index carries id as well so per-manager keyset pages read it in order.
+        Index("ix_job_shifts_manager_id_start_date", "manager_id", "start_date", "id"),
+        Index("ix_job_shifts_employee_id_start_date", "employee_id", "start_date"),
+        Index("ix_job_shifts_client_id_start_date", "client_id", "start_date"),
+    )
 
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4, index=True)
     manager_id = Column(UUID(as_uuid=True), ForeignKey("managers.id"))
@@ -24,3 +33,16 @@ class JobShiftModel(Base):
     manager = relationship("ManagerModel")
     client = relationship("ClientModel")
     employee = relationship("EmployeeModel")
+
+
+def shift_period(shift=JobShiftModel):
+    """``tstzrange(start_date, end_date)`` of ``shift`` (the model or an alias of it), end exclusive.
+
+    Overlap tests must use this exact expression to be served by the GiST indexes below.
+    """
+    return func.tstzrange(shift.start_date, shift.end_date, type_=TSTZRANGE)
+
+
+# Overlap lookups (&&) per employee and per manager; btree_gist lets the uuid column share a GiST index
+Index("ix_job_shifts_employee_id_period", JobShiftModel.employee_id, shift_period(), postgresql_using="gist")
+Index("ix_job_shifts_manager_id_period", JobShiftModel.manager_id, shift_period(), postgresql_using="gist")
@@ -1,14 +1,33 @@
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, status, Query
+from datetime import datetime, timedelta
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
-from typing import List
+from typing import List, Optional
 from uuid import UUID
 
-from src.database import get_db
-from src.modules.job_shifts.schemas import JobShiftCreate, JobShiftRead, JobShiftSearch, JobShiftScheduleRead, ScheduleSearch
-from src.modules.job_shifts.service import JobShiftService
+from src.database import get_async_db, get_db
+from src.modules.job_shifts.schemas import AvailabilitySearch, EmployeeAvailabilityRead, JobShiftBulkCreate, JobShiftBulkCreated, JobShiftCreate, JobShiftUpdate, JobShiftRead, JobShiftSearch, JobShiftScheduleRead, PayrollSummaryRead, PayrollSummaryRequest, ScheduleSearch, ShiftConflictRead
+from src.modules.job_shifts.service import AsyncJobShiftService, InvalidShiftPeriod, JobShiftService, ShiftConflictError, shifts_export_query
+from src.modules.shared.domain.bus import EventBus
+from src.modules.shared.export import ExportFormat, export_response
+from src.modules.shared.pagination import MAX_PAGE_SIZE, CursorPage, InvalidCursor
 
-def get_service(db: Session = Depends(get_db)) -> JobShiftService:
-    return JobShiftService(db)
+def get_event_bus():
+    # Deferred import to avoid circular dependency, same pattern as employees
+    from src.main import event_bus
+    return event_bus
+
+def get_service(db: Session = Depends(get_db), event_bus: EventBus = Depends(get_event_bus)) -> JobShiftService:
+    return JobShiftService(db, event_bus)
+
+def get_async_service(db: AsyncSession = Depends(get_async_db)) -> AsyncJobShiftService:
+    return AsyncJobShiftService(db)
+
+def shift_conflict(error: ShiftConflictError) -> HTTPException:
+    return HTTPException(status_code=409, detail={
+        "message": str(error),
+        "conflicting_shift_ids": [str(shift_id) for shift_id in error.conflicting_shift_ids],
+    })
 
 router = APIRouter(
     prefix="/job_shifts",
@@ -22,14 +41,57 @@ def create_shift(
     service: JobShiftService = Depends(get_service)
 ):
     # In a real app we would verify that manager_id, client_id, employee_id exist
-    return service.create_shift(shift=shift)
+    try:
+        return service.create_shift(shift=shift)
+    except ShiftConflictError as e:
+        raise shift_conflict(e)
+
+@router.post("/bulk", response_model=JobShiftBulkCreated, status_code=status.HTTP_201_CREATED)
+def create_shifts(
+    payload: JobShiftBulkCreate,
+    service: JobShiftService = Depends(get_service)
+):
+    """
+    Create many shifts at once (e.g. a month's roster) in a single transaction.
+    Returns the new ids in the order the shifts were sent.
+    """
+    ids = service.create_shifts(payload.shifts)
+    return {"count": len(ids), "ids": ids}
+
+@router.get("/conflicts", response_model=List[ShiftConflictRead])
+async def find_conflicts(
+    manager_id: UUID,
+    start_date: datetime,
+    end_date: datetime,
+    service: AsyncJobShiftService = Depends(get_async_service)
+):
+    """
+    Double bookings: pairs of shifts of the same employee that overlap within [start_date, end_date).
+    """
+    return await service.get_conflicts(manager_id=manager_id, start_date=start_date, end_date=end_date)
+
+@router.patch("/{shift_id}", response_model=JobShiftRead)
+def update_shift(
+    shift_id: UUID,
+    changes: JobShiftUpdate,
+    service: JobShiftService = Depends(get_service)
+):
+    try:
+        db_shift = service.update_shift(shift_id, changes)
+    except InvalidShiftPeriod as e:
+        raise HTTPException(status_code=422, detail=str(e))
+    except ShiftConflictError as e:
+        raise shift_conflict(e)
+    if db_shift is None:
+        raise HTTPException(status_code=404, detail="Shift not found")
+    return db_shift
 
 @router.post("/FindShifts", response_model=List[JobShiftRead])
-def find_shifts(
+async def find_shifts(
     search_params: JobShiftSearch,
-    service: JobShiftService = Depends(get_service)
+    service: AsyncJobShiftService = Depends(get_async_service)
 ):
-    return service.get_shifts_by_params(
+    return await service.get_shifts_by_params(
         manager_id=search_params.manager_id,
         employee_id=search_params.employee_id,
         client_id=search_params.client_id,
@@ -38,17 +100,69 @@ def find_shifts(
     )
 
 @router.post("/FindSchedule", response_model=List[JobShiftScheduleRead])
-def find_schedule(
+async def find_schedule(
     search_params: ScheduleSearch,
-    service: JobShiftService = Depends(get_service)
+    service: AsyncJobShiftService = Depends(get_async_service)
 ):
-    return service.get_schedule_by_params(
+    return await service.get_schedule_by_params(
         manager_id=search_params.manager_id,
         employee_id=search_params.employee_id,
         start_date=search_params.start_date,
         end_date=search_params.end_date
     )
 
-@router.get("/", response_model=List[JobShiftRead])
-def read_shifts(skip: int = 0, limit: int = 100, service: JobShiftService = Depends(get_service)):
-    return service.get_shifts(skip=skip, limit=limit)
+@router.post("/FindAvailability", response_model=List[EmployeeAvailabilityRead])
+async def find_availability(
+    search_params: AvailabilitySearch,
+    service: AsyncJobShiftService = Depends(get_async_service)
+):
+    """
+    Free time of each of the manager's employees within [start_date, end_date), e.g. "who is free Tuesday 9-17".
+    Employees with no shift in the window have fully_available set.
+    """
+    return await service.get_availability(
+        manager_id=search_params.manager_id,
+        start_date=search_params.start_date,
+        end_date=search_params.end_date,
+        employee_ids=search_params.employee_ids,
+        min_duration=timedelta(minutes=search_params.min_duration_minutes)
+    )
+
+@router.post("/PayrollSummary", response_model=List[PayrollSummaryRead])
+async def payroll_summary(
+    search_params: PayrollSummaryRequest,
+    service: AsyncJobShiftService = Depends(get_async_service)
+):
+    """
+    Hours and amounts per employee (payroll) or per client (billing) for each day, week or month,
+    split into paid and unpaid shifts.
+    """
+    return await service.get_payroll_summary(
+        manager_id=search_params.manager_id,
+        start_date=search_params.start_date,
+        end_date=search_params.end_date,
+        group_by=search_params.group_by,
+        period=search_params.period,
+        employee_id=search_params.employee_id,
+        client_id=search_params.client_id
+    )
+
+@router.get("/export")
+def export_shifts(
+    format: ExportFormat = "ndjson",
+    manager_id: Optional[UUID] = None,
+    start_date: Optional[datetime] = None,
+    end_date: Optional[datetime] = None
+):
+    """
+    Stream shifts as NDJSON or CSV in schedule order, optionally for a manager and a [start_date, end_date) range.
+    """
+    return export_response(shifts_export_query(manager_id, start_date, end_date), format, "job_shifts")
+
+@router.get("/", response_model=CursorPage[JobShiftRead])
+def read_shifts(cursor: Optional[str] = None, limit: int = Query(100, ge=1, le=MAX_PAGE_SIZE), service: JobShiftService = Depends(get_service)):
+    try:
+        shifts, next_cursor = service.get_shifts(cursor=cursor, limit=limit)
+    except InvalidCursor as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    return {"items": shifts, "next_cursor": next_cursor}
@@ -1,6 +1,6 @@
-from pydantic import BaseModel
+from pydantic import BaseModel, Field, model_validator
 from datetime import datetime
-from typing import Optional
+from typing import Literal, Optional
 from uuid import UUID
 
 class JobShiftBase(BaseModel):
@@ -14,6 +14,37 @@ class JobShiftCreate(JobShiftBase):
     client_id: UUID
     employee_id: UUID
 
+    @model_validator(mode="after")
+    def end_after_start(self):
+        if self.end_date <= self.start_date:
+            raise ValueError("end_date must be after start_date")
+        return self
+
+# Upper bound per request keeps one import to one transaction of bounded size
+MAX_BULK_SHIFTS = 50_000
+
+class JobShiftBulkCreate(BaseModel):
+    shifts: list[JobShiftCreate] = Field(min_length=1, max_length=MAX_BULK_SHIFTS)
+
+class JobShiftBulkCreated(BaseModel):
+    count: int
+    ids: list[UUID]
+
+class JobShiftUpdate(BaseModel):
+    client_id: Optional[UUID] = None
+    employee_id: Optional[UUID] = None
+    start_date: Optional[datetime] = None
+    end_date: Optional[datetime] = None
+    is_paid: Optional[bool] = None
+
+    @model_validator(mode="after")
+    def no_nulls(self):
+        # Leave a field out to keep its value; null would store a value JobShiftRead cannot load
+        nulls = sorted(field for field in self.model_fields_set if getattr(self, field) is None)
+        if nulls:
+            raise ValueError(f"{', '.join(nulls)} cannot be null")
+        return self
+
 class JobShiftRead(JobShiftBase):
     id: UUID
     manager_id: UUID
@@ -70,3 +101,62 @@ class ScheduleSearch(BaseModel):
     employee_id: Optional[UUID] = None
     start_date: Optional[datetime] = None
     end_date: Optional[datetime] = None
+
+class PayrollSummaryRequest(BaseModel):
+    manager_id: UUID
+    # Half-open range: shifts starting at or after start_date and before end_date
+    start_date: datetime
+    end_date: datetime
+    group_by: Literal["employee", "client"] = "employee"
+    period: Literal["day", "week", "month"] = "month"
+    employee_id: Optional[UUID] = None
+    client_id: Optional[UUID] = None
+
+class PayrollSummaryRead(BaseModel):
+    period_start: datetime
+    employee_id: Optional[UUID] = None
+    client_id: Optional[UUID] = None
+    name: Optional[str] = None
+    shift_count: int
+    hours: float
+    paid_hours: float
+    unpaid_hours: float
+    amount: float
+    paid_amount: float
+    unpaid_amount: float
+
+class ShiftConflictRead(BaseModel):
+    employee_id: UUID
+    shift_id: UUID
+    conflicting_shift_id: UUID
+    # The period both shifts claim
+    overlap_start: datetime
+    overlap_end: datetime
+
+class AvailabilitySearch(BaseModel):
+    manager_id: UUID
+    # Half-open window to look for free time in, e.g. Tuesday 09:00 to 17:00
+    start_date: datetime
+    end_date: datetime
+    employee_ids: Optional[list[UUID]] = None
+    # Only report gaps at least this long; employees without one are omitted
+    min_duration_minutes: int = Field(default=0, ge=0)
+
+    @model_validator(mode="after")
+    def end_after_start(self):
+        if self.end_date <= self.start_date:
+            raise ValueError("end_date must be after start_date")
+        return self
+
+class FreeSlot(BaseModel):
+    start: datetime
+    end: datetime
+
+class EmployeeAvailabilityRead(BaseModel):
+    employee_id: UUID
+    first_name: str
+    last_name: str
+    # No shift at all in the window
+    fully_available: bool
+    free_hours: float
+    free_slots: list[FreeSlot]
@@ -1,60 +1,137 @@
-from sqlalchemy.orm import Session, joinedload
-from datetime import datetime
-from src.modules.job_shifts.models import JobShiftModel
-from src.modules.job_shifts.schemas import JobShiftCreate
-from src.modules.shared.rates import resolve_rate
+from sqlalchemy import Float, Select, func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session, aliased
+from datetime import datetime, timedelta
+from src.modules.clients.models import ClientModel
+from src.modules.employees.models import EmployeeModel
+from src.modules.job_shifts.availability import as_utc, availability_from_rows, busy_intervals_query
+from src.modules.job_shifts.models import JobShiftModel, shift_period
+from src.modules.managers.models import ManagerModel
+from src.modules.job_shifts.events import JobShiftCreated, JobShiftsBulkCreated, JobShiftUpdated
+from src.modules.job_shifts.schemas import JobShiftCreate, JobShiftUpdate
+from src.modules.shared.domain.bus import EventBus
+from src.modules.shared.bulk import bulk_insert, with_ids
+from src.modules.shared.pagination import keyset_paginate
+from src.modules.shared.rates import resolve_rate_sql
 from uuid import UUID
 
+# Shifts page in schedule order; id breaks ties between shifts starting together
+SHIFT_PAGE_KEY = (JobShiftModel.start_date, JobShiftModel.id)
+
+BULK_COLUMNS = ["id", "manager_id", "client_id", "employee_id", "start_date", "end_date", "is_paid"]
+
+class InvalidShiftPeriod(ValueError):
+    """The shift would end at or before it starts."""
+
+class ShiftConflictError(Exception):
+    """The employee already has shifts overlapping the requested period."""
+
+    def __init__(self, conflicting_shift_ids: list[UUID]):
+        super().__init__("Employee already has a shift in this period")
+        self.conflicting_shift_ids = conflicting_shift_ids
+
 class JobShiftService:
-    def __init__(self, db: Session):
+    def __init__(self, db: Session, event_bus: EventBus = None):
         self.db = db
+        self.event_bus = event_bus
 
     def create_shift(self, shift: JobShiftCreate) -> JobShiftModel:
+        self._check_overlaps(shift.employee_id, shift.start_date, shift.end_date)
         db_shift = JobShiftModel(
-            **shift.model_dump()
+            # effective_rate is derived on read, it is not a column
+            **shift.model_dump(exclude={"effective_rate"})
         )
         self.db.add(db_shift)
         self.db.commit()
         self.db.refresh(db_shift)
+
+        self._publish(JobShiftCreated(
+            shift_id=db_shift.id,
+            manager_id=db_shift.manager_id,
+            employee_id=db_shift.employee_id,
+            client_id=db_shift.client_id,
+            start_date=db_shift.start_date
+        ))
         return db_shift
 
-    def _apply_effective_rates(self, shifts: list[JobShiftModel]) -> list[JobShiftModel]:
-        for shift in shifts:
-            shift.effective_rate = resolve_rate(
-                client_rate=getattr(shift.client, "default_rate", None) if shift.client else None,
-                employee_rate=getattr(shift.employee, "default_rate", None) if shift.employee else None,
-                manager_rate=getattr(shift.manager, "default_rate", None) if shift.manager else None,
-            )
-        return shifts
-
-    def get_shifts(self, skip: int = 0, limit: int = 100) -> list[JobShiftModel]:
-        shifts = (
-            self.db.query(JobShiftModel)
-            .options(
-                joinedload(JobShiftModel.client),
-                joinedload(JobShiftModel.employee),
-                joinedload(JobShiftModel.manager),
-            )
-            .offset(skip)
-            .limit(limit)
-            .all()
-        )
-        return self._apply_effective_rates(shifts)
-
-    def get_shifts_by_manager(self, manager_id: UUID, skip: int = 0, limit: int = 100) -> list[JobShiftModel]:
-        shifts = (
-            self.db.query(JobShiftModel)
-            .options(
-                joinedload(JobShiftModel.client),
-                joinedload(JobShiftModel.employee),
-                joinedload(JobShiftModel.manager),
-            )
-            .filter(JobShiftModel.manager_id == manager_id)
-            .offset(skip)
-            .limit(limit)
-            .all()
+    def create_shifts(self, shifts: list[JobShiftCreate]) -> list[UUID]:
+        """Insert many shifts with a single statement and commit, returning their ids in input order."""
+        rows = with_ids([shift.model_dump(exclude={"effective_rate"}) for shift in shifts])
+        self.db.execute(bulk_insert(JobShiftModel.__table__, rows, BULK_COLUMNS))
+        self.db.commit()
+
+        start_dates_by_manager = {}
+        for row in rows:
+            start_dates_by_manager.setdefault(row["manager_id"], []).append(row["start_date"])
+        for manager_id, start_dates in start_dates_by_manager.items():
+            self._publish(JobShiftsBulkCreated(
+                manager_id=manager_id,
+                shift_count=len(start_dates),
+                first_start_date=min(start_dates),
+                last_start_date=max(start_dates)
+            ))
+        return [row["id"] for row in rows]
+
+    def update_shift(self, shift_id: UUID, changes: JobShiftUpdate) -> JobShiftModel | None:
+        db_shift = self.db.get(JobShiftModel, shift_id)
+        if db_shift is None:
+            return None
+        previous_employee_id, previous_client_id, previous_start_date = (
+            db_shift.employee_id, db_shift.client_id, db_shift.start_date
         )
-        return self._apply_effective_rates(shifts)
+        updates = changes.model_dump(exclude_unset=True)
+        # Stored times are timezone-aware; a naive one from the request is taken as UTC so they compare
+        for field in updates.keys() & {"start_date", "end_date"}:
+            updates[field] = as_utc(updates[field])
+        if updates.keys() & {"employee_id", "start_date", "end_date"}:
+            start_date = updates.get("start_date", db_shift.start_date)
+            end_date = updates.get("end_date", db_shift.end_date)
+            if end_date <= start_date:
+                raise InvalidShiftPeriod("end_date must be after start_date")
+            self._check_overlaps(updates.get("employee_id", db_shift.employee_id), start_date, end_date, shift_id)
+        for field, value in updates.items():
+            setattr(db_shift, field, value)
+        self.db.commit()
+        self.db.refresh(db_shift)
+
+        self._publish(JobShiftUpdated(
+            shift_id=db_shift.id,
+            manager_id=db_shift.manager_id,
+            employee_id=db_shift.employee_id,
+            client_id=db_shift.client_id,
+            start_date=db_shift.start_date,
+            previous_employee_id=previous_employee_id,
+            previous_client_id=previous_client_id,
+            previous_start_date=previous_start_date
+        ))
+        return db_shift
+
+    def _check_overlaps(self, employee_id: UUID, start_date: datetime, end_date: datetime, shift_id: UUID = None) -> None:
+        """Raise ShiftConflictError if the employee already has a shift overlapping ``[start_date, end_date)``."""
+        # Serializes bookings per employee until this transaction ends, so two
+        # concurrent requests cannot both pass the check for the same slot
+        self.db.execute(select(func.pg_advisory_xact_lock(func.hashtext(str(employee_id)))))
+        conflicting_ids = self.db.execute(
+            overlapping_shifts_query(employee_id, start_date, end_date, exclude_shift_id=shift_id)
+        ).scalars().all()
+        if conflicting_ids:
+            raise ShiftConflictError(list(conflicting_ids))
+
+    def _publish(self, event) -> None:
+        if self.event_bus:
+            self.event_bus.publish(event)
+
+    def get_shifts(self, cursor: str = None, limit: int = 100) -> tuple[list[dict], str | None]:
+        query = join_rate_sources(self.db.query(*SHIFT_COLUMNS))
+        rows, next_cursor = keyset_paginate(query, SHIFT_PAGE_KEY, cursor, limit)
+        return [_shift_read(row) for row in rows], next_cursor
+
+    def get_shifts_by_manager(
+        self, manager_id: UUID, cursor: str = None, limit: int = 100
+    ) -> tuple[list[dict], str | None]:
+        query = join_rate_sources(self.db.query(*SHIFT_COLUMNS)).filter(JobShiftModel.manager_id == manager_id)
+        rows, next_cursor = keyset_paginate(query, SHIFT_PAGE_KEY, cursor, limit)
+        return [_shift_read(row) for row in rows], next_cursor
 
     def get_shifts_by_params(
         self, 
@@ -63,32 +140,9 @@ class JobShiftService:
         client_id: UUID = None, 
         start_date: datetime = None, 
         end_date: datetime = None
-    ) -> list[JobShiftModel]:
-        from datetime import timedelta
-        
-        # Default date logic
-        if not start_date or not end_date:
-            now = datetime.now()
-            # Set to start of today to include shifts that already started today
-            start_date = now.replace(hour=0, minute=0, second=0, microsecond=0)
-            end_date = start_date + timedelta(days=30)
-            
-        query = self.db.query(JobShiftModel).options(
-            joinedload(JobShiftModel.client),
-            joinedload(JobShiftModel.employee),
-            joinedload(JobShiftModel.manager),
-        ).filter(
-            JobShiftModel.manager_id == manager_id,
-            JobShiftModel.start_date >= start_date,
-            JobShiftModel.start_date <= end_date
-        )
-        
-        if employee_id:
-            query = query.filter(JobShiftModel.employee_id == employee_id)
-        if client_id:
-            query = query.filter(JobShiftModel.client_id == client_id)
-            
-        return self._apply_effective_rates(query.all())
+    ) -> list[dict]:
+        stmt = shifts_by_params_query(manager_id, employee_id, client_id, start_date, end_date)
+        return [_shift_read(row) for row in self.db.execute(stmt)]
 
     def get_schedule_by_params(
         self,
@@ -96,26 +150,323 @@ class JobShiftService:
         employee_id: UUID = None,
         start_date: datetime = None,
         end_date: datetime = None
-    ) -> list[JobShiftModel]:
-        query = self.db.query(JobShiftModel).options(
-            joinedload(JobShiftModel.client),
-            joinedload(JobShiftModel.employee),
-            joinedload(JobShiftModel.manager),
+    ) -> list[dict]:
+        stmt = schedule_by_params_query(manager_id, employee_id, start_date, end_date)
+        return [_schedule_read(row) for row in self.db.execute(stmt)]
+
+    def get_payroll_summary(
+        self,
+        manager_id: UUID,
+        start_date: datetime,
+        end_date: datetime,
+        group_by: str = "employee",
+        period: str = "month",
+        employee_id: UUID = None,
+        client_id: UUID = None
+    ) -> list[dict]:
+        stmt = payroll_summary_query(manager_id, start_date, end_date, group_by, period, employee_id, client_id)
+        return [dict(row._mapping) for row in self.db.execute(stmt)]
+
+    def get_conflicts(self, manager_id: UUID, start_date: datetime, end_date: datetime) -> list[dict]:
+        stmt = shift_conflicts_query(manager_id, start_date, end_date)
+        return [dict(row._mapping) for row in self.db.execute(stmt)]
+
+    def get_availability(
+        self,
+        manager_id: UUID,
+        start_date: datetime,
+        end_date: datetime,
+        employee_ids: list[UUID] = None,
+        min_duration: timedelta = timedelta(0)
+    ) -> list[dict]:
+        start_date, end_date = as_utc(start_date), as_utc(end_date)
+        rows = self.db.execute(busy_intervals_query(manager_id, start_date, end_date, employee_ids))
+        return availability_from_rows(rows, start_date, end_date, min_duration)
+
+
+class AsyncJobShiftService:
+    """Read-only shift queries for endpoints served on the event loop."""
+
+    def __init__(self, db: AsyncSession):
+        self.db = db
+
+    async def get_shifts_by_params(
+        self,
+        manager_id: UUID,
+        employee_id: UUID = None,
+        client_id: UUID = None,
+        start_date: datetime = None,
+        end_date: datetime = None
+    ) -> list[dict]:
+        stmt = shifts_by_params_query(manager_id, employee_id, client_id, start_date, end_date)
+        return [_shift_read(row) for row in await self.db.execute(stmt)]
+
+    async def get_schedule_by_params(
+        self,
+        manager_id: UUID = None,
+        employee_id: UUID = None,
+        start_date: datetime = None,
+        end_date: datetime = None
+    ) -> list[dict]:
+        stmt = schedule_by_params_query(manager_id, employee_id, start_date, end_date)
+        return [_schedule_read(row) for row in await self.db.execute(stmt)]
+
+    async def get_payroll_summary(
+        self,
+        manager_id: UUID,
+        start_date: datetime,
+        end_date: datetime,
+        group_by: str = "employee",
+        period: str = "month",
+        employee_id: UUID = None,
+        client_id: UUID = None
+    ) -> list[dict]:
+        stmt = payroll_summary_query(manager_id, start_date, end_date, group_by, period, employee_id, client_id)
+        return [dict(row._mapping) for row in await self.db.execute(stmt)]
+
+    async def get_conflicts(self, manager_id: UUID, start_date: datetime, end_date: datetime) -> list[dict]:
+        stmt = shift_conflicts_query(manager_id, start_date, end_date)
+        return [dict(row._mapping) for row in await self.db.execute(stmt)]
+
+    async def get_availability(
+        self,
+        manager_id: UUID,
+        start_date: datetime,
+        end_date: datetime,
+        employee_ids: list[UUID] = None,
+        min_duration: timedelta = timedelta(0)
+    ) -> list[dict]:
+        start_date, end_date = as_utc(start_date), as_utc(end_date)
+        rows = await self.db.execute(busy_intervals_query(manager_id, start_date, end_date, employee_ids))
+        return availability_from_rows(rows, start_date, end_date, min_duration)
+
+
+# Client rate, else employee rate, else manager rate; needs join_rate_sources
+EFFECTIVE_RATE = resolve_rate_sql(
+    client_rate=ClientModel.default_rate,
+    employee_rate=EmployeeModel.default_rate,
+    manager_rate=ManagerModel.default_rate,
+)
+
+SHIFT_HOURS = func.extract("epoch", JobShiftModel.end_date - JobShiftModel.start_date) / 3600
+
+# Reads select only the columns JobShiftRead / JobShiftScheduleRead need instead of
+# loading the client, employee and manager entities (and their embeddings) per shift.
+SHIFT_COLUMNS = (
+    JobShiftModel.id,
+    JobShiftModel.manager_id,
+    JobShiftModel.client_id,
+    JobShiftModel.employee_id,
+    JobShiftModel.start_date,
+    JobShiftModel.end_date,
+    JobShiftModel.is_paid,
+    JobShiftModel.created_at,
+    JobShiftModel.updated_at,
+    EFFECTIVE_RATE.label("effective_rate"),
+)
+
+SCHEDULE_CLIENT_COLUMNS = {
+    "client_name": ClientModel.client_name,
+    "email": ClientModel.email.label("client_email"),
+    "mobile": ClientModel.mobile.label("client_mobile"),
+}
+
+SCHEDULE_EMPLOYEE_COLUMNS = {
+    "first_name": EmployeeModel.first_name,
+    "last_name": EmployeeModel.last_name,
+    "nickname": EmployeeModel.nickname,
+    "email": EmployeeModel.email.label("employee_email"),
+    "mobile": EmployeeModel.mobile.label("employee_mobile"),
+}
+
+
+def join_rate_sources(stmt):
+    # Outer joins keep shifts whose client, employee or manager is missing, like joinedload did
+    return (
+        stmt.select_from(JobShiftModel)
+        .outerjoin(ClientModel, ClientModel.id == JobShiftModel.client_id)
+        .outerjoin(EmployeeModel, EmployeeModel.id == JobShiftModel.employee_id)
+        .outerjoin(ManagerModel, ManagerModel.id == JobShiftModel.manager_id)
+    )
+
+
+def _shift_read(row) -> dict:
+    return {column.key: row._mapping[column.key] for column in SHIFT_COLUMNS}
+
+
+def _schedule_read(row) -> dict:
+    shift = _shift_read(row)
+    shift["client"] = {"id": row.client_id, **{
+        field: row._mapping[column.key] for field, column in SCHEDULE_CLIENT_COLUMNS.items()
+    }}
+    shift["employee"] = {"id": row.employee_id, **{
+        field: row._mapping[column.key] for field, column in SCHEDULE_EMPLOYEE_COLUMNS.items()
+    }}
+    return shift
+
+
+def shifts_by_params_query(
+    manager_id: UUID,
+    employee_id: UUID = None,
+    client_id: UUID = None,
+    start_date: datetime = None,
+    end_date: datetime = None
+) -> Select:
+    # Default date logic
+    if not start_date or not end_date:
+        now = datetime.now()
+        # Set to start of today to include shifts that already started today
+        start_date = now.replace(hour=0, minute=0, second=0, microsecond=0)
+        end_date = start_date + timedelta(days=30)
+
+    stmt = join_rate_sources(select(*SHIFT_COLUMNS)).where(
+        JobShiftModel.manager_id == manager_id,
+        JobShiftModel.start_date >= start_date,
+        JobShiftModel.start_date <= end_date
+    )
+
+    if employee_id:
+        stmt = stmt.where(JobShiftModel.employee_id == employee_id)
+    if client_id:
+        stmt = stmt.where(JobShiftModel.client_id == client_id)
+
+    return stmt
+
+
+def schedule_by_params_query(
+    manager_id: UUID = None,
+    employee_id: UUID = None,
+    start_date: datetime = None,
+    end_date: datetime = None
+) -> Select:
+    stmt = join_rate_sources(select(
+        *SHIFT_COLUMNS, *SCHEDULE_CLIENT_COLUMNS.values(), *SCHEDULE_EMPLOYEE_COLUMNS.values()
+    ))
+
+    if manager_id:
+        stmt = stmt.where(JobShiftModel.manager_id == manager_id)
+    if employee_id:
+        stmt = stmt.where(JobShiftModel.employee_id == employee_id)
+
+    if start_date and end_date:
+        stmt = stmt.where(
+            JobShiftModel.start_date >= start_date,
+            JobShiftModel.start_date <= end_date
         )
+    elif start_date:
+        stmt = stmt.where(JobShiftModel.start_date >= start_date)
+    elif end_date:
+        stmt = stmt.where(JobShiftModel.start_date <= end_date)
+
+    return stmt
+
+
+def shifts_export_query(manager_id: UUID = None, start_date: datetime = None, end_date: datetime = None) -> Select:
+    """Shifts in schedule order with their effective rate, optionally for ``[start_date, end_date)``."""
+    stmt = join_rate_sources(select(*SHIFT_COLUMNS))
+    if manager_id:
+        stmt = stmt.where(JobShiftModel.manager_id == manager_id)
+    if start_date:
+        stmt = stmt.where(JobShiftModel.start_date >= start_date)
+    if end_date:
+        stmt = stmt.where(JobShiftModel.start_date < end_date)
+    return stmt.order_by(*SHIFT_PAGE_KEY)
 
-        if manager_id:
-            query = query.filter(JobShiftModel.manager_id == manager_id)
-        if employee_id:
-            query = query.filter(JobShiftModel.employee_id == employee_id)
-
-        if start_date and end_date:
-            query = query.filter(
-                JobShiftModel.start_date >= start_date,
-                JobShiftModel.start_date <= end_date
-            )
-        elif start_date:
-            query = query.filter(JobShiftModel.start_date >= start_date)
-        elif end_date:
-            query = query.filter(JobShiftModel.start_date <= end_date)
-
-        return self._apply_effective_rates(query.all())
+
+def payroll_summary_query(
+    manager_id: UUID,
+    start_date: datetime,
+    end_date: datetime,
+    group_by: str = "employee",
+    period: str = "month",
+    employee_id: UUID = None,
+    client_id: UUID = None
+) -> Select:
+    """Hours and amounts per employee (payroll) or client (billing) per period, split by ``is_paid``.
+
+    Shifts are bucketed by the period their ``start_date`` falls in, over ``[start_date, end_date)``.
+    """
+    amount = SHIFT_HOURS * EFFECTIVE_RATE
+    paid = func.coalesce(JobShiftModel.is_paid, False)
+    period_start = func.date_trunc(period, JobShiftModel.start_date)
+
+    if group_by == "client":
+        group_id, group_name = JobShiftModel.client_id, ClientModel.client_name
+    else:
+        group_id, group_name = JobShiftModel.employee_id, EmployeeModel.first_name + " " + EmployeeModel.last_name
+
+    def total(value, condition=None):
+        aggregate = func.sum(value) if condition is None else func.sum(value).filter(condition)
+        return func.coalesce(aggregate, 0.0).cast(Float)
+
+    stmt = (
+        join_rate_sources(select(
+            period_start.label("period_start"),
+            group_id,
+            group_name.label("name"),
+            func.count().label("shift_count"),
+            total(SHIFT_HOURS).label("hours"),
+            total(SHIFT_HOURS, paid).label("paid_hours"),
+            total(SHIFT_HOURS, ~paid).label("unpaid_hours"),
+            total(amount).label("amount"),
+            total(amount, paid).label("paid_amount"),
+            total(amount, ~paid).label("unpaid_amount"),
+        ))
+        .where(
+            JobShiftModel.manager_id == manager_id,
+            JobShiftModel.start_date >= start_date,
+            JobShiftModel.start_date < end_date,
+        )
+    )
+    if employee_id:
+        stmt = stmt.where(JobShiftModel.employee_id == employee_id)
+    if client_id:
+        stmt = stmt.where(JobShiftModel.client_id == client_id)
+
+    return stmt.group_by(period_start, group_id, group_name).order_by(period_start, group_name)
+
+
+def overlapping_shifts_query(
+    employee_id: UUID, start_date: datetime, end_date: datetime, exclude_shift_id: UUID = None
+) -> Select:
+    """Ids of the employee's shifts overlapping ``[start_date, end_date)``, via ix_job_shifts_employee_id_period."""
+    stmt = select(JobShiftModel.id).where(
+        JobShiftModel.employee_id == employee_id,
+        shift_period().overlaps(func.tstzrange(start_date, end_date)),
+    )
+    if exclude_shift_id:
+        stmt = stmt.where(JobShiftModel.id != exclude_shift_id)
+    return stmt.order_by(JobShiftModel.start_date)
+
+
+def shift_conflicts_query(manager_id: UUID, start_date: datetime, end_date: datetime) -> Select:
+    """Pairs of overlapping shifts of the same employee whose overlap falls in ``[start_date, end_date)``.
+
+    The manager's shifts in the window come from ix_job_shifts_manager_id_period and each
+    one probes ix_job_shifts_employee_id_period for the shifts it collides with. A pair
+    of the manager's own shifts is reported once, by comparing ids; a collision with
+    another manager's shift is always reported from this manager's side.
+    """
+    shift, other = aliased(JobShiftModel), aliased(JobShiftModel)
+    window = func.tstzrange(start_date, end_date)
+    return (
+        select(
+            shift.employee_id,
+            shift.id.label("shift_id"),
+            other.id.label("conflicting_shift_id"),
+            func.greatest(shift.start_date, other.start_date).label("overlap_start"),
+            func.least(shift.end_date, other.end_date).label("overlap_end"),
+        )
+        .join(
+            other,
+            (other.employee_id == shift.employee_id)
+            & ((other.id > shift.id) | (other.manager_id != manager_id)),
+        )
+        .where(
+            shift.manager_id == manager_id,
+            shift_period(shift).overlaps(window),
+            shift_period(other).overlaps(window),
+            shift_period(other).overlaps(shift_period(shift)),
+        )
+        .order_by("overlap_start", shift.employee_id)
+    )
@@ -1,11 +1,12 @@
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Query
 from sqlalchemy.orm import Session
-from typing import List
+from typing import Optional
 
 from src.database import get_db
 from src.modules.auth.security import create_access_token, get_current_manager
 from src.modules.managers.schemas import ManagerCreate, ManagerLogin, ManagerRead, Token
 from src.modules.managers.service import ManagerService
+from src.modules.shared.pagination import MAX_PAGE_SIZE, CursorPage, InvalidCursor
 
 router = APIRouter(
     prefix="/managers",
@@ -23,14 +24,18 @@ def create_manager(manager: ManagerCreate, service: ManagerService = Depends(get
         raise HTTPException(status_code=400, detail="Email already registered")
     return service.create_manager(manager=manager)
 
-@router.get("/", response_model=List[ManagerRead])
+@router.get("/", response_model=CursorPage[ManagerRead])
 def read_managers(
-    skip: int = 0,
-    limit: int = 100,
+    cursor: Optional[str] = None,
+    limit: int = Query(100, ge=1, le=MAX_PAGE_SIZE),
     service: ManagerService = Depends(get_service),
     _current_manager=Depends(get_current_manager),
 ):
-    return service.get_managers(skip=skip, limit=limit)
+    try:
+        managers, next_cursor = service.get_managers(cursor=cursor, limit=limit)
+    except InvalidCursor as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    return {"items": managers, "next_cursor": next_cursor}
 
 @router.post("/login", response_model=Token)
 def login_manager(payload: ManagerLogin, service: ManagerService = Depends(get_service)):
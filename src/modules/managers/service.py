@@ -2,9 +2,12 @@ from sqlalchemy.orm import Session
 from passlib.context import CryptContext
 from src.modules.managers.models import ManagerModel
 from src.modules.managers.schemas import ManagerCreate
+from src.modules.shared.pagination import keyset_paginate
 
 pwd_context = CryptContext(schemes=["argon2"], deprecated="auto")
 
+MANAGER_PAGE_KEY = (ManagerModel.created_at, ManagerModel.id)
+
 class ManagerService:
     def __init__(self, db: Session):
         self.db = db
@@ -29,8 +32,8 @@ class ManagerService:
         self.db.refresh(db_manager)
         return db_manager
 
-    def get_managers(self, skip: int = 0, limit: int = 100):
-        return self.db.query(ManagerModel).offset(skip).limit(limit).all()
+    def get_managers(self, cursor: str = None, limit: int = 100):
+        return keyset_paginate(self.db.query(ManagerModel), MANAGER_PAGE_KEY, cursor, limit)
 
     def get_manager_by_email(self, email: str):
         return self.db.query(ManagerModel).filter(ManagerModel.email == email).first()
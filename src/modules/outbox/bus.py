@@ -0,0 +1,29 @@
+from typing import Callable
+from uuid import UUID
+from sqlalchemy import event as sa_event
+from sqlalchemy.orm import Session
+from src.modules.outbox.models import OutboxEventModel
+from src.modules.outbox.registry import EventRegistry, event_registry
+from src.modules.shared.domain.bus import EventPublisher
+from src.modules.shared.domain.event import DomainEvent
+
+
+class OutboxEventBus(EventPublisher):
+    """Writes events into the caller's session instead of dispatching them.
+
+    The event commits or rolls back together with the change that raised it, so
+    publish must be called before the commit. OutboxRelay dispatches committed
+    events to the handlers subscribed on its bus.
+    """
+
+    def __init__(self, db: Session, registry: EventRegistry = event_registry, on_commit: Callable[[], None] = None):
+        self.db = db
+        self.registry = registry
+        self.on_commit = on_commit
+
+    def publish(self, event: DomainEvent) -> None:
+        event_type, payload = self.registry.encode(event)
+        self.db.add(OutboxEventModel(id=UUID(event.event_id), event_type=event_type, payload=payload))
+        if self.on_commit:
+            # Lets a relay in this process pick the event up now instead of at its next poll
+            sa_event.listen(self.db, "after_commit", lambda session: self.on_commit(), once=True)
@@ -0,0 +1,23 @@
+from sqlalchemy import Column, DateTime, Index, Integer, String, Text
+from sqlalchemy.dialects.postgresql import JSONB, UUID
+from sqlalchemy.sql import func
+from src.database import Base
+
+class OutboxEventModel(Base):
+    """Domain events committed together with the change that raised them, until the relay dispatches them."""
+
+    __tablename__ = "outbox_events"
+    __table_args__ = (
+        # The relay reads the oldest pending events first
+        Index("ix_outbox_events_created_at", "created_at"),
+    )
+
+    # The event's own event_id, so an event is stored at most once
+    id = Column(UUID(as_uuid=True), primary_key=True)
+    event_type = Column(String, nullable=False)
+    payload = Column(JSONB, nullable=False)
+    created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
+
+    # Failed dispatches; events reaching the relay's max_attempts stay behind for inspection
+    attempts = Column(Integer, nullable=False, default=0)
+    last_error = Column(Text)
@@ -0,0 +1,70 @@
+import dataclasses
+import types
+from datetime import date, datetime
+from typing import Type, Union, get_args, get_origin, get_type_hints
+from uuid import UUID
+from src.modules.shared.domain.event import DomainEvent
+
+
+class EventRegistry:
+    """Names the event classes that can travel through the outbox and converts them to and from JSON."""
+
+    def __init__(self):
+        self._types: dict[str, Type[DomainEvent]] = {}
+
+    def register(self, *event_types: Type[DomainEvent]) -> None:
+        for event_type in event_types:
+            self._types[event_type.__name__] = event_type
+
+    def encode(self, event: DomainEvent) -> tuple[str, dict]:
+        event_type = type(event).__name__
+        if self._types.get(event_type) is not type(event):
+            raise KeyError(f"{event_type} is not registered for the outbox")
+        return event_type, _to_json(event)
+
+    def decode(self, event_type: str, payload: dict) -> DomainEvent:
+        if event_type not in self._types:
+            raise KeyError(f"{event_type} is not registered for the outbox")
+        return _from_json(self._types[event_type], payload)
+
+
+def _to_json(value):
+    if dataclasses.is_dataclass(value):
+        return {field.name: _to_json(getattr(value, field.name)) for field in dataclasses.fields(value)}
+    if isinstance(value, (list, tuple)):
+        return [_to_json(item) for item in value]
+    if isinstance(value, UUID):
+        return str(value)
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    return value
+
+
+def _from_json(hint, value):
+    """Rebuild ``value`` as ``hint`` using the dataclasses' annotations, nested events included."""
+    if value is None:
+        return None
+    if dataclasses.is_dataclass(hint):
+        hints = get_type_hints(hint)
+        return hint(**{
+            field.name: _from_json(hints[field.name], value[field.name])
+            for field in dataclasses.fields(hint) if field.init and field.name in value
+        })
+    origin = get_origin(hint)
+    if origin in (Union, types.UnionType):
+        # Optional[X] / X | None
+        return _from_json(next(arg for arg in get_args(hint) if arg is not type(None)), value)
+    if origin in (list, tuple):
+        items = [_from_json(get_args(hint)[0], item) for item in value]
+        return tuple(items) if origin is tuple else items
+    if hint is UUID:
+        return UUID(value)
+    if hint is datetime:
+        return datetime.fromisoformat(value)
+    if hint is date:
+        return date.fromisoformat(value)
+    return value
+
+
+# Process-wide registry; src/main.py registers the events that go through the outbox
+event_registry = EventRegistry()
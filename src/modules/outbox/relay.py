@@ -0,0 +1,100 @@
+import threading
+from sqlalchemy import select
+from sqlalchemy.orm import Session, sessionmaker
+from src.database import SessionLocal
+from src.modules.outbox.models import OutboxEventModel
+from src.modules.outbox.registry import EventRegistry, event_registry
+from src.modules.shared.domain.bus import InMemoryEventBus
+
+
+class OutboxRelay:
+    """Background thread that hands committed outbox events to their handlers.
+
+    ``event_bus`` must run handlers inline and let their exceptions propagate,
+    like InMemoryEventBus: a row is deleted only once every handler for its event
+    has returned, and a failure is recorded on the row and retried. A bus that
+    merely queues the event (AsyncEventBus) would let the row go before the work
+    is done.
+
+    Each batch is claimed with ``FOR UPDATE SKIP LOCKED``, so any number of relays
+    (one per application process) can poll the same table: a row locked by one
+    relay is skipped by the others, and no event is dispatched twice while its
+    batch is in flight. Handled rows are deleted in the same transaction.
+    Delivery is at least once: a relay that dies before committing leaves its
+    batch to be dispatched again.
+    """
+
+    def __init__(
+        self,
+        event_bus: InMemoryEventBus,
+        registry: EventRegistry = event_registry,
+        session_factory: sessionmaker = SessionLocal,
+        batch_size: int = 100,
+        poll_interval: float = 1.0,
+        max_attempts: int = 10,
+    ):
+        self.event_bus = event_bus
+        self.registry = registry
+        self.session_factory = session_factory
+        self.batch_size = batch_size
+        self.poll_interval = poll_interval
+        self.max_attempts = max_attempts
+        self._wake = threading.Event()
+        self._stopping = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    def start(self) -> None:
+        if self._thread is None:
+            self._stopping.clear()
+            self._thread = threading.Thread(target=self._run, name="outbox-relay", daemon=True)
+            self._thread.start()
+
+    def stop(self, timeout: float | None = None) -> None:
+        """Finish the current batch, then stop polling. Pending events stay in the table."""
+        if self._thread is not None:
+            self._stopping.set()
+            self._wake.set()
+            self._thread.join(timeout)
+            self._thread = None
+
+    def wake(self) -> None:
+        """Poll now rather than after ``poll_interval``, e.g. right after an outbox commit."""
+        self._wake.set()
+
+    def relay_batch(self) -> int:
+        """Dispatch up to ``batch_size`` pending events; returns how many rows were claimed."""
+        db: Session = self.session_factory()
+        try:
+            rows = db.execute(
+                select(OutboxEventModel)
+                .where(OutboxEventModel.attempts < self.max_attempts)
+                .order_by(OutboxEventModel.created_at)
+                .limit(self.batch_size)
+                .with_for_update(skip_locked=True)
+            ).scalars().all()
+            for row in rows:
+                try:
+                    # Runs the handlers here; the row goes only if none of them raised
+                    self.event_bus.publish(self.registry.decode(row.event_type, row.payload))
+                    db.delete(row)
+                except Exception as e:
+                    row.attempts += 1
+                    row.last_error = str(e)
+                    print(f"Error relaying outbox event {row.id} ({row.event_type}): {e}")
+            db.commit()
+            return len(rows)
+        finally:
+            db.close()
+
+    def _run(self) -> None:
+        while not self._stopping.is_set():
+            # Cleared before polling, so a commit made during the poll still wakes the next one
+            self._wake.clear()
+            try:
+                claimed = self.relay_batch()
+            except Exception as e:
+                print(f"Error polling the outbox: {e}")
+                claimed = 0
+            if claimed < self.batch_size:
+                # Caught up: sleep until the next poll or a wake-up
+                self._wake.wait(self.poll_interval)
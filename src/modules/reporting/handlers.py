@@ -0,0 +1,35 @@
+from sqlalchemy.orm import sessionmaker
+from src.database import SessionLocal
+from datetime import timedelta
+from src.modules.job_shifts.events import JobShiftCreated, JobShiftsBulkCreated, JobShiftUpdated
+from src.modules.reporting.service import rebuild_rollups, refresh_rollups, shift_day
+
+
+class ShiftRollupHandler:
+    def __init__(self, session_factory: sessionmaker = SessionLocal):
+        self.session_factory = session_factory
+
+    def handle(self, event: JobShiftCreated | JobShiftUpdated):
+        buckets = {(event.manager_id, event.employee_id, event.client_id, shift_day(event.start_date))}
+        if isinstance(event, JobShiftUpdated):
+            # The shift may have moved to another employee, client or day
+            buckets.add((
+                event.manager_id,
+                event.previous_employee_id,
+                event.previous_client_id,
+                shift_day(event.previous_start_date),
+            ))
+        with self.session_factory() as db:
+            refresh_rollups(db, buckets)
+            db.commit()
+
+    def handle_bulk(self, event: JobShiftsBulkCreated):
+        # One grouped rebuild over the manager's affected days beats refreshing each bucket
+        with self.session_factory() as db:
+            rebuild_rollups(
+                db,
+                event.manager_id,
+                shift_day(event.first_start_date),
+                shift_day(event.last_start_date) + timedelta(days=1),
+            )
+            db.commit()
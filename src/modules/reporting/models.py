@@ -0,0 +1,23 @@
+from sqlalchemy import Column, Date, DateTime, Float, ForeignKey, Integer
+from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.sql import func
+from src.database import Base
+
+class ShiftDailyRollupModel(Base):
+    """Shift totals per manager, employee, client and UTC day, maintained from job_shifts."""
+
+    __tablename__ = "shift_daily_rollups"
+
+    # Primary key order serves the dashboard shape: one manager over a range of days
+    manager_id = Column(UUID(as_uuid=True), ForeignKey("managers.id"), primary_key=True)
+    day = Column(Date, primary_key=True)
+    employee_id = Column(UUID(as_uuid=True), ForeignKey("employees.id"), primary_key=True)
+    client_id = Column(UUID(as_uuid=True), ForeignKey("clients.id"), primary_key=True)
+
+    shift_count = Column(Integer, nullable=False, default=0)
+    hours = Column(Float, nullable=False, default=0.0)
+    paid_hours = Column(Float, nullable=False, default=0.0)
+    revenue = Column(Float, nullable=False, default=0.0)
+    paid_revenue = Column(Float, nullable=False, default=0.0)
+
+    refreshed_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
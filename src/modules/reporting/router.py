@@ -0,0 +1,35 @@
+from fastapi import APIRouter, Depends
+from sqlalchemy.ext.asyncio import AsyncSession
+from typing import List
+
+from src.database import get_async_db
+from src.modules.reporting.schemas import ShiftSummaryRead, ShiftSummaryRequest
+from src.modules.reporting.service import AsyncReportingService
+
+def get_async_service(db: AsyncSession = Depends(get_async_db)) -> AsyncReportingService:
+    return AsyncReportingService(db)
+
+router = APIRouter(
+    prefix="/reports",
+    tags=["reports"],
+    responses={404: {"description": "Not found"}},
+)
+
+@router.post("/ShiftSummary", response_model=List[ShiftSummaryRead])
+async def shift_summary(
+    search_params: ShiftSummaryRequest,
+    service: AsyncReportingService = Depends(get_async_service)
+):
+    """
+    Shift count, hours and revenue per day, week or month for a manager's dashboard,
+    optionally per employee or per client. Served from the daily rollups.
+    """
+    return await service.get_shift_summary(
+        manager_id=search_params.manager_id,
+        start_day=search_params.start_date,
+        end_day=search_params.end_date,
+        group_by=search_params.group_by,
+        period=search_params.period,
+        employee_id=search_params.employee_id,
+        client_id=search_params.client_id
+    )
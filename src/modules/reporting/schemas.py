@@ -0,0 +1,25 @@
+from pydantic import BaseModel
+from datetime import date
+from typing import Literal, Optional
+from uuid import UUID
+
+class ShiftSummaryRequest(BaseModel):
+    manager_id: UUID
+    # Half-open range of UTC days
+    start_date: date
+    end_date: date
+    group_by: Optional[Literal["employee", "client"]] = None
+    period: Literal["day", "week", "month"] = "day"
+    employee_id: Optional[UUID] = None
+    client_id: Optional[UUID] = None
+
+class ShiftSummaryRead(BaseModel):
+    period_start: date
+    employee_id: Optional[UUID] = None
+    client_id: Optional[UUID] = None
+    name: Optional[str] = None
+    shift_count: int
+    hours: float
+    paid_hours: float
+    revenue: float
+    paid_revenue: float
@@ -0,0 +1,190 @@
+from datetime import date, datetime, time, timedelta, timezone
+from sqlalchemy import Date, Float, Select, and_, cast, delete, func, or_, select
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+from uuid import UUID
+from src.modules.clients.models import ClientModel
+from src.modules.employees.models import EmployeeModel
+from src.modules.job_shifts.models import JobShiftModel
+from src.modules.job_shifts.service import EFFECTIVE_RATE, SHIFT_HOURS, join_rate_sources
+from src.modules.reporting.models import ShiftDailyRollupModel
+
+# (manager_id, employee_id, client_id, day)
+Bucket = tuple[UUID, UUID, UUID, date]
+
+# Rollups bucket shifts by the UTC calendar day they start on
+SHIFT_DAY = cast(func.timezone("UTC", JobShiftModel.start_date), Date)
+
+ROLLUP_KEY = ("manager_id", "day", "employee_id", "client_id")
+ROLLUP_TOTALS = ("shift_count", "hours", "paid_hours", "revenue", "paid_revenue")
+
+
+def shift_day(start_date: datetime) -> date:
+    if start_date.tzinfo is None:
+        return start_date.date()
+    return start_date.astimezone(timezone.utc).date()
+
+
+def _day_range(day: date) -> tuple[datetime, datetime]:
+    start = datetime.combine(day, time.min, tzinfo=timezone.utc)
+    return start, start + timedelta(days=1)
+
+
+def rollup_source_query(*conditions) -> Select:
+    """Aggregate job_shifts into rollup rows; ``conditions`` narrow the shifts that are read."""
+    paid = func.coalesce(JobShiftModel.is_paid, False)
+    revenue = SHIFT_HOURS * EFFECTIVE_RATE
+    return (
+        join_rate_sources(select(
+            JobShiftModel.manager_id,
+            SHIFT_DAY.label("day"),
+            JobShiftModel.employee_id,
+            JobShiftModel.client_id,
+            func.count().label("shift_count"),
+            func.coalesce(func.sum(SHIFT_HOURS), 0.0).cast(Float).label("hours"),
+            func.coalesce(func.sum(SHIFT_HOURS).filter(paid), 0.0).cast(Float).label("paid_hours"),
+            func.coalesce(func.sum(revenue), 0.0).cast(Float).label("revenue"),
+            func.coalesce(func.sum(revenue).filter(paid), 0.0).cast(Float).label("paid_revenue"),
+        ))
+        .where(
+            JobShiftModel.manager_id.isnot(None),
+            JobShiftModel.employee_id.isnot(None),
+            JobShiftModel.client_id.isnot(None),
+            JobShiftModel.start_date.isnot(None),
+            *conditions,
+        )
+        .group_by(JobShiftModel.manager_id, SHIFT_DAY, JobShiftModel.employee_id, JobShiftModel.client_id)
+    )
+
+
+def _upsert_rollups(db: Session, source: Select) -> int:
+    stmt = insert(ShiftDailyRollupModel).from_select([*ROLLUP_KEY, *ROLLUP_TOTALS], source)
+    stmt = stmt.on_conflict_do_update(
+        index_elements=list(ROLLUP_KEY),
+        set_={
+            **{column: getattr(stmt.excluded, column) for column in ROLLUP_TOTALS},
+            "refreshed_at": func.now(),
+        },
+    )
+    return db.execute(stmt).rowcount
+
+
+def refresh_rollups(db: Session, buckets: set[Bucket]) -> None:
+    """Recompute the given buckets from job_shifts. The caller commits.
+
+    Each bucket is re-aggregated from its shifts (one employee, one client, one day),
+    which reads a handful of rows through the (employee_id, start_date) index.
+    """
+    buckets = {bucket for bucket in buckets if all(part is not None for part in bucket)}
+    if not buckets:
+        return
+
+    shift_filters = []
+    rollup_filters = []
+    for manager_id, employee_id, client_id, day in buckets:
+        day_start, day_end = _day_range(day)
+        shift_filters.append(and_(
+            JobShiftModel.employee_id == employee_id,
+            JobShiftModel.start_date >= day_start,
+            JobShiftModel.start_date < day_end,
+            JobShiftModel.manager_id == manager_id,
+            JobShiftModel.client_id == client_id,
+        ))
+        rollup_filters.append(and_(
+            ShiftDailyRollupModel.manager_id == manager_id,
+            ShiftDailyRollupModel.day == day,
+            ShiftDailyRollupModel.employee_id == employee_id,
+            ShiftDailyRollupModel.client_id == client_id,
+        ))
+
+    # Buckets a shift moved out of may now be empty; the upsert restores the rest
+    db.execute(delete(ShiftDailyRollupModel).where(or_(*rollup_filters)))
+    _upsert_rollups(db, rollup_source_query(or_(*shift_filters)))
+
+
+def rebuild_rollups(db: Session, manager_id: UUID = None, start_day: date = None, end_day: date = None) -> int:
+    """Replace the rollups for a manager and/or a ``[start_day, end_day)`` range from job_shifts. The caller commits."""
+    rollup_filters = []
+    shift_filters = []
+    if manager_id:
+        rollup_filters.append(ShiftDailyRollupModel.manager_id == manager_id)
+        shift_filters.append(JobShiftModel.manager_id == manager_id)
+    if start_day:
+        rollup_filters.append(ShiftDailyRollupModel.day >= start_day)
+        shift_filters.append(JobShiftModel.start_date >= _day_range(start_day)[0])
+    if end_day:
+        rollup_filters.append(ShiftDailyRollupModel.day < end_day)
+        shift_filters.append(JobShiftModel.start_date < _day_range(end_day)[0])
+
+    db.execute(delete(ShiftDailyRollupModel).where(*rollup_filters))
+    return _upsert_rollups(db, rollup_source_query(*shift_filters))
+
+
+class AsyncReportingService:
+    """Dashboard reads served from the rollups instead of raw job_shifts."""
+
+    def __init__(self, db: AsyncSession):
+        self.db = db
+
+    async def get_shift_summary(
+        self,
+        manager_id: UUID,
+        start_day: date,
+        end_day: date,
+        group_by: str = None,
+        period: str = "day",
+        employee_id: UUID = None,
+        client_id: UUID = None
+    ) -> list[dict]:
+        stmt = shift_summary_query(manager_id, start_day, end_day, group_by, period, employee_id, client_id)
+        return [dict(row._mapping) for row in await self.db.execute(stmt)]
+
+
+def shift_summary_query(
+    manager_id: UUID,
+    start_day: date,
+    end_day: date,
+    group_by: str = None,
+    period: str = "day",
+    employee_id: UUID = None,
+    client_id: UUID = None
+) -> Select:
+    """Totals per period over ``[start_day, end_day)``, optionally per employee or client.
+
+    Reads at most one row per employee, client and day, however many shifts those days hold.
+    """
+    rollup = ShiftDailyRollupModel
+    period_start = cast(func.date_trunc(period, rollup.day), Date)
+
+    group_columns = []
+    if group_by == "employee":
+        group_id, group_name = rollup.employee_id, EmployeeModel.first_name + " " + EmployeeModel.last_name
+        group_columns = [group_id, group_name]
+    elif group_by == "client":
+        group_id, group_name = rollup.client_id, ClientModel.client_name
+        group_columns = [group_id, group_name]
+
+    stmt = select(
+        period_start.label("period_start"),
+        *([group_id, group_name.label("name")] if group_columns else []),
+        func.sum(rollup.shift_count).label("shift_count"),
+        func.sum(rollup.hours).label("hours"),
+        func.sum(rollup.paid_hours).label("paid_hours"),
+        func.sum(rollup.revenue).label("revenue"),
+        func.sum(rollup.paid_revenue).label("paid_revenue"),
+    ).where(
+        rollup.manager_id == manager_id,
+        rollup.day >= start_day,
+        rollup.day < end_day,
+    )
+    if group_by == "employee":
+        stmt = stmt.join(EmployeeModel, EmployeeModel.id == rollup.employee_id)
+    elif group_by == "client":
+        stmt = stmt.join(ClientModel, ClientModel.id == rollup.client_id)
+    if employee_id:
+        stmt = stmt.where(rollup.employee_id == employee_id)
+    if client_id:
+        stmt = stmt.where(rollup.client_id == client_id)
+
+    return stmt.group_by(period_start, *group_columns).order_by(period_start, *group_columns)
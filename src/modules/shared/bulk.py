@@ -0,0 +1,39 @@
+import uuid
+from datetime import date, datetime
+from sqlalchemy import Table, cast, func, literal, select
+from sqlalchemy.dialects.postgresql import ARRAY, Insert, insert
+
+
+def _array_element(value) -> str:
+    if value is None:
+        return "NULL"
+    if isinstance(value, bool):
+        return "t" if value else "f"
+    if isinstance(value, (datetime, date)):
+        value = value.isoformat()
+    text = str(value).replace("\\", "\\\\").replace('"', '\\"')
+    return f'"{text}"'
+
+
+def array_literal(values) -> str:
+    """Postgres array text for ``values``, e.g. ``{"a","b",NULL}``."""
+    return "{" + ",".join(_array_element(value) for value in values) + "}"
+
+
+def bulk_insert(table: Table, rows: list[dict], columns: list[str]) -> Insert:
+    """``INSERT INTO table (columns) SELECT * FROM unnest(...)`` for many rows in one statement.
+
+    Each column travels as a single array parameter, so 10k rows are 7 bind
+    parameters rather than 70k: the statement stays small, is parsed once and
+    needs no per-value adaptation on the client. Python-side column defaults
+    (such as ``id``) are not applied, so ``rows`` must carry every column listed.
+    Returns a PostgreSQL insert, so callers can add ``on_conflict_*`` and ``returning``.
+    """
+    arrays = [cast(literal(array_literal(row[name] for row in rows)), ARRAY(table.c[name].type)) for name in columns]
+    source = func.unnest(*arrays).table_valued(*columns).render_derived()
+    return insert(table).from_select(columns, select(source))
+
+
+def with_ids(rows: list[dict]) -> list[dict]:
+    """Assign ``id`` up front (the models' uuid4 default), so ids are known in input order."""
+    return [{"id": uuid.uuid4(), **row} for row in rows]
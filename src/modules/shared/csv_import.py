@@ -0,0 +1,86 @@
+import codecs
+import csv
+from pydantic import BaseModel, ValidationError
+from typing import AsyncIterator, TypeVar
+
+ModelT = TypeVar("ModelT", bound=BaseModel)
+
+
+class CsvValidationError(ValueError):
+    """CSV rows that do not fit the schema, one message per problem, each naming its line."""
+
+    def __init__(self, errors: list[str]):
+        super().__init__("; ".join(errors))
+        self.errors = errors
+
+
+async def iter_csv_records(chunks: AsyncIterator[bytes]) -> AsyncIterator[tuple[int, str]]:
+    """Split a streamed UTF-8 body into complete CSV records, with the line each one starts on.
+
+    A line break inside a quoted field keeps the record open, so a record is never
+    split between two parser calls.
+    """
+    decoder = codecs.getincrementaldecoder("utf-8-sig")()
+    pending = ""
+    record = ""
+    record_start = line_number = 0
+    async for chunk in chunks:
+        pending += decoder.decode(chunk)
+        *lines, pending = pending.split("\n")
+        for line in lines:
+            line_number += 1
+            if not record:
+                record_start = line_number
+            record += line + "\n"
+            # An odd number of quotes so far means a quoted field spans this line break
+            if record.count('"') % 2 == 0:
+                yield record_start, record
+                record = ""
+
+    pending += decoder.decode(b"", final=True)
+    if pending or record:
+        yield record_start if record else line_number + 1, record + pending
+
+
+async def iter_csv_batches(chunks: AsyncIterator[bytes], batch_size: int = 1000) -> AsyncIterator[list[tuple[int, dict]]]:
+    """Parse a streamed CSV body (header row first) into batches of ``(line_number, row)``.
+
+    The body is decoded as it arrives and only one batch of rows is held at a time,
+    so an upload of any size is imported in constant memory. Blank lines are skipped.
+    """
+    header = None
+    batch = []
+    async for line_number, record in iter_csv_records(chunks):
+        values = next(csv.reader([record]), [])
+        if not values:
+            continue
+        if header is None:
+            header = [name.strip() for name in values]
+            continue
+        batch.append((line_number, dict(zip(header, values))))
+        if len(batch) >= batch_size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
+def validate_rows(schema: type[ModelT], batch: list[tuple[int, dict]], **fields) -> list[ModelT]:
+    """Build ``schema`` from each CSV row plus ``fields``; empty cells count as missing.
+
+    Raises CsvValidationError naming the offending lines, so the whole import is rejected.
+    """
+    models = []
+    errors = []
+    for line_number, row in batch:
+        values = {name: value for name, value in row.items() if value != ""}
+        try:
+            models.append(schema(**{**values, **fields}))
+        except ValidationError as e:
+            errors.extend(
+                f"line {line_number}: {'.'.join(str(part) for part in error['loc'])}: {error['msg']}"
+                for error in e.errors()
+            )
+    if errors:
+        raise CsvValidationError(errors)
+    return models
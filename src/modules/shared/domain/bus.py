@@ -1,12 +1,19 @@
+import asyncio
+import inspect
+import queue
+import threading
 from abc import ABC, abstractmethod
 from typing import Callable, Type, List, Dict
 from .event import DomainEvent
 
-class EventBus(ABC):
+class EventPublisher(ABC):
+    """What services need to raise events; where the events go is up to the implementation."""
+
     @abstractmethod
     def publish(self, event: DomainEvent) -> None:
         pass
 
+class EventBus(EventPublisher):
     @abstractmethod
     def subscribe(self, event_type: Type[DomainEvent], handler: Callable[[DomainEvent], None]) -> None:
         pass
@@ -24,3 +31,89 @@ class InMemoryEventBus(EventBus):
         if event_type not in self._handlers:
             self._handlers[event_type] = []
         self._handlers[event_type].append(handler)
+
+class AsyncEventBus(EventBus):
+    """Event bus that hands events to a pool of worker threads instead of running handlers inline.
+
+    ``publish`` only enqueues one job per subscribed handler, so a slow or failing
+    subscriber no longer adds to request latency or stops the handlers after it.
+    The queue is bounded: when handlers fall behind, publishers block until there
+    is room rather than letting the backlog grow without limit.
+
+    Handlers may be plain functions or ``async def``. Coroutines are run on the
+    event loop passed to ``start`` (the application's), where async sessions and
+    clients live, and the worker waits for them to finish.
+
+    Until ``start`` is called, events are dispatched inline like InMemoryEventBus,
+    so scripts and tests that never start the bus keep working.
+    """
+
+    def __init__(self, workers: int = 4, max_queue_size: int = 1000):
+        self.workers = workers
+        self._handlers: Dict[Type[DomainEvent], List[Callable[[DomainEvent], None]]] = {}
+        self._queue: queue.Queue[tuple[Callable, DomainEvent] | None] = queue.Queue(maxsize=max_queue_size)
+        self._threads: List[threading.Thread] = []
+        self._loop: asyncio.AbstractEventLoop | None = None
+
+    def subscribe(self, event_type: Type[DomainEvent], handler: Callable[[DomainEvent], None]) -> None:
+        self._handlers.setdefault(event_type, []).append(handler)
+
+    def publish(self, event: DomainEvent) -> None:
+        for handler in self._handlers.get(type(event), []):
+            if self._threads:
+                # Blocks when the queue is full, so producers slow down to the handlers' pace
+                self._queue.put((handler, event))
+            else:
+                self._dispatch(handler, event)
+
+    def start(self, loop: asyncio.AbstractEventLoop | None = None) -> None:
+        if self._threads:
+            return
+        self._loop = loop
+        for index in range(self.workers):
+            thread = threading.Thread(target=self._run, name=f"event-bus-{index}", daemon=True)
+            thread.start()
+            self._threads.append(thread)
+
+    def drain(self, timeout: float | None = None) -> bool:
+        """Wait until every queued event has been handled; False if ``timeout`` ran out first.
+
+        Never call this on the event loop given to ``start``: async handlers need
+        that loop to finish. From async code use ``await asyncio.to_thread(bus.drain)``.
+        """
+        with self._queue.all_tasks_done:
+            return self._queue.all_tasks_done.wait_for(lambda: self._queue.unfinished_tasks == 0, timeout)
+
+    def shutdown(self, timeout: float | None = None) -> None:
+        """Handle everything queued so far, then stop the workers. Later events are dispatched inline."""
+        if not self._threads:
+            return
+        self.drain(timeout)
+        for _ in self._threads:
+            self._queue.put(None)
+        for thread in self._threads:
+            thread.join(timeout)
+        self._threads = []
+        self._loop = None
+
+    def _run(self) -> None:
+        while True:
+            job = self._queue.get()
+            try:
+                if job is None:
+                    return
+                self._dispatch(*job)
+            finally:
+                self._queue.task_done()
+
+    def _dispatch(self, handler: Callable, event: DomainEvent) -> None:
+        try:
+            result = handler(event)
+            if inspect.isawaitable(result):
+                if self._loop is not None and self._loop.is_running():
+                    asyncio.run_coroutine_threadsafe(result, self._loop).result()
+                else:
+                    asyncio.run(result)
+        except Exception as e:
+            # One failing subscriber must not stop the others
+            print(f"Error handling {type(event).__name__} in {getattr(handler, '__qualname__', handler)}: {e}")
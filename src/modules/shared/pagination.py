@@ -0,0 +1,61 @@
+import base64
+import json
+from datetime import datetime
+from typing import Generic, Optional, TypeVar
+
+from pydantic import BaseModel
+from sqlalchemy import tuple_
+from sqlalchemy.orm import Query
+
+T = TypeVar("T")
+
+# Upper bound for the ``limit`` of list endpoints
+MAX_PAGE_SIZE = 1000
+
+
+class InvalidCursor(ValueError):
+    """A ``cursor`` that was not produced by encode_cursor for these columns."""
+
+
+class CursorPage(BaseModel, Generic[T]):
+    items: list[T]
+    # Pass back as ``cursor`` to fetch the next page; None on the last page
+    next_cursor: Optional[str] = None
+
+
+def encode_cursor(values: tuple) -> str:
+    payload = [value.isoformat() if isinstance(value, datetime) else str(value) for value in values]
+    return base64.urlsafe_b64encode(json.dumps(payload).encode()).decode()
+
+
+def decode_cursor(cursor: str, columns: tuple) -> tuple:
+    try:
+        payload = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+        if not isinstance(payload, list) or len(payload) != len(columns):
+            raise ValueError(cursor)
+        values = []
+        for column, value in zip(columns, payload):
+            python_type = column.type.python_type
+            values.append(datetime.fromisoformat(value) if python_type is datetime else python_type(value))
+        return tuple(values)
+    except (ValueError, TypeError):
+        raise InvalidCursor("Invalid cursor")
+
+
+def keyset_paginate(query: Query, columns: tuple, cursor: str | None = None, limit: int = 100) -> tuple[list, str | None]:
+    """Return one page of ``query`` ordered by ``columns`` and the cursor of the next page.
+
+    The page starts strictly after the row the cursor was taken from, so with a
+    composite index on ``columns`` every page costs the same however deep it is.
+    The last column must be unique (the primary key) to break ties. A malformed
+    cursor raises InvalidCursor.
+    """
+    if cursor:
+        query = query.filter(tuple_(*columns) > tuple_(*decode_cursor(cursor, columns)))
+    # One extra row tells us whether another page exists without a COUNT
+    rows = query.order_by(*columns).limit(limit + 1).all()
+    if len(rows) <= limit:
+        return rows, None
+    rows = rows[:limit]
+    last = rows[-1]
+    return rows, encode_cursor(tuple(getattr(last, column.key) for column in columns))
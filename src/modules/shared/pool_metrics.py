@@ -0,0 +1,77 @@
+import threading
+import time
+from bisect import bisect_left
+
+from sqlalchemy import exc
+from sqlalchemy.pool import Pool
+
+# Upper bounds (seconds) of the checkout wait histogram buckets; the last bucket is +Inf
+WAIT_BUCKETS = (0.001, 0.005, 0.01, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+
+
+class PoolMetrics:
+    """Counts how long callers wait to check a connection out of a pool."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._bucket_counts = [0] * (len(WAIT_BUCKETS) + 1)
+        self._wait_count = 0
+        self._wait_sum = 0.0
+        self._wait_max = 0.0
+        self._timeouts = 0
+
+    def observe_wait(self, seconds: float) -> None:
+        with self._lock:
+            self._bucket_counts[bisect_left(WAIT_BUCKETS, seconds)] += 1
+            self._wait_count += 1
+            self._wait_sum += seconds
+            self._wait_max = max(self._wait_max, seconds)
+
+    def record_timeout(self) -> None:
+        with self._lock:
+            self._timeouts += 1
+
+    def snapshot(self, pool: Pool) -> dict:
+        with self._lock:
+            cumulative = 0
+            buckets = {}
+            for bound, count in zip([*map(str, WAIT_BUCKETS), "+Inf"], self._bucket_counts):
+                cumulative += count
+                buckets[bound] = cumulative
+            wait = {
+                "count": self._wait_count,
+                "sum_seconds": self._wait_sum,
+                "max_seconds": self._wait_max,
+                "timeouts": self._timeouts,
+                "buckets": buckets,
+            }
+        return {
+            "pool": type(pool).__name__,
+            "size": pool.size(),
+            "checked_in": pool.checkedin(),
+            "checked_out": pool.checkedout(),
+            "overflow": pool.overflow(),
+            "checkout_wait": wait,
+        }
+
+
+def instrument_pool_class(pool_class: type[Pool], metrics: PoolMetrics) -> type[Pool]:
+    """Subclass ``pool_class`` so every checkout wait is reported to ``metrics``.
+
+    A subclass rather than an instance attribute survives ``engine.dispose()``,
+    which recreates the pool from its class.
+    """
+
+    class InstrumentedPool(pool_class):
+        def _do_get(self):
+            start = time.perf_counter()
+            try:
+                connection = super()._do_get()
+            except exc.TimeoutError:
+                metrics.record_timeout()
+                raise
+            metrics.observe_wait(time.perf_counter() - start)
+            return connection
+
+    InstrumentedPool.__name__ = f"Instrumented{pool_class.__name__}"
+    return InstrumentedPool
@@ -0,0 +1,17 @@
+from collections.abc import Hashable, Sequence
+
+# Constant from the original RRF paper; dampens the weight of the very top ranks
+RRF_K = 60
+
+
+def reciprocal_rank_fusion(rankings: Sequence[Sequence[Hashable]], k: int = RRF_K) -> list[tuple[Hashable, float]]:
+    """Fuse several best-first rankings into one: score(d) = sum over rankings of 1 / (k + rank(d)).
+
+    Only ranks are used, so scores from different retrievers (trigram similarity,
+    cosine distance) never need to be made comparable.
+    """
+    scores: dict[Hashable, float] = {}
+    for ranking in rankings:
+        for rank, key in enumerate(ranking, start=1):
+            scores[key] = scores.get(key, 0.0) + 1.0 / (k + rank)
+    return sorted(scores.items(), key=lambda item: item[1], reverse=True)
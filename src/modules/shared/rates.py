@@ -1,3 +1,6 @@
+from sqlalchemy import ColumnElement, Float, func, literal
+
+
 def is_valid_rate(rate: float | None) -> bool:
     return rate is not None and rate != 0
 
@@ -13,3 +16,11 @@ def resolve_rate(
     if is_valid_rate(employee_rate):
         return float(employee_rate)
     return float(manager_rate or 0.0)
+
+
+def resolve_rate_sql(*, client_rate=None, employee_rate=None, manager_rate=None) -> ColumnElement:
+    """SQL counterpart of :func:`resolve_rate` for columns, so queries can select the rate directly."""
+    candidates = [func.nullif(rate, 0) for rate in (client_rate, employee_rate) if rate is not None]
+    if manager_rate is not None:
+        candidates.append(manager_rate)
+    return func.coalesce(*candidates, literal(0.0, Float)).cast(Float)
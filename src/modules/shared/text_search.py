@@ -0,0 +1,24 @@
+from sqlalchemy import ColumnElement, Index, func, or_
+
+
+def trigram_index(name: str, column: str) -> Index:
+    """pg_trgm GIN index that serves ``ILIKE '%...%'`` and similarity lookups on ``column``."""
+    return Index(name, column, postgresql_using="gin", postgresql_ops={column: "gin_trgm_ops"})
+
+
+def escape_like(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+
+
+def contains(column, value: str) -> ColumnElement:
+    # Trigram GIN indexes answer unanchored ILIKE patterns, unlike btree indexes
+    return column.ilike(f"%{escape_like(value)}%", escape="\\")
+
+
+def contains_any(value: str, *columns) -> ColumnElement:
+    return or_(*(contains(column, value) for column in columns))
+
+
+def relevance(value: str, *columns) -> ColumnElement:
+    """Best pg_trgm word similarity of ``value`` against any of ``columns`` (NULL columns are skipped)."""
+    return func.greatest(*(func.word_similarity(value, column) for column in columns))
@@ -65,8 +65,15 @@ def main():
 
     # 3. Verify Client List
     print("\n3. Listing Clients...")
-    response = requests.get(f"{base_url}/clients/")
-    clients = check(response)
+    # The list is cursor-paginated in creation order: follow next_cursor to the last page
+    clients = []
+    params = {}
+    while True:
+        page = check(requests.get(f"{base_url}/clients/", params=params))
+        clients.extend(page["items"])
+        if not page["next_cursor"]:
+            break
+        params = {"cursor": page["next_cursor"]}
     print(f"Found {len(clients)} clients")
     
     found = False
@@ -53,8 +53,15 @@ def main():
 
     # 3. Verify Employee List
     print("\n3. Listing Employees...")
-    response = requests.get(f"{base_url}/employees/")
-    employees = check(response)
+    # The list is cursor-paginated in creation order: follow next_cursor to the last page
+    employees = []
+    params = {}
+    while True:
+        page = check(requests.get(f"{base_url}/employees/", params=params))
+        employees.extend(page["items"])
+        if not page["next_cursor"]:
+            break
+        params = {"cursor": page["next_cursor"]}
     print(f"Found {len(employees)} employees")
     
     found = False
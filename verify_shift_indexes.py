@@ -0,0 +1,148 @@
+import argparse
+import json
+import os
+import sys
+from datetime import datetime, timedelta, timezone
+from dotenv import load_dotenv
+from sqlalchemy import text
+
+# Ensure src is in pythonpath
+sys.path.append(os.getcwd())
+load_dotenv()
+
+from src.database import engine
+from src.modules.managers.models import ManagerModel
+from src.modules.employees.models import EmployeeModel
+from src.modules.clients.models import ClientModel
+from src.modules.job_shifts.models import JobShiftModel
+from src.modules.agents.models import AgentModel
+from src.modules.job_shifts.service import (
+    overlapping_shifts_query, schedule_by_params_query, shift_conflicts_query, shifts_by_params_query
+)
+
+EPOCH = datetime(2025, 1, 1, tzinfo=timezone.utc)
+
+
+def seed(conn, managers: int, people: int, shifts: int):
+    """Seed a realistic spread: many tenants, each with its own staff, clients and a year of shifts."""
+    print(f"Seeding {managers} managers, {people} employees/clients and {shifts} shifts...")
+    conn.execute(text("""
+        INSERT INTO managers (id, first_name, last_name, username, email, password)
+        SELECT gen_random_uuid(), 'Index', 'Check ' || i, 'index_check_' || i, 'index.check.' || i || '@example.com', '-'
+        FROM generate_series(1, :managers) AS i
+    """), {"managers": managers})
+    for table, name_columns in (("employees", "first_name, last_name"), ("clients", "client_name, client_description")):
+        conn.execute(text(f"""
+            INSERT INTO {table} (id, {name_columns}, mobile, email, manager_id)
+            SELECT gen_random_uuid(), 'Index', 'Check ' || i, '+1555' || i, '{table}.index.check.' || i || '@example.com',
+                   (SELECT id FROM managers WHERE username = 'index_check_' || (1 + i % :managers))
+            FROM generate_series(1, :people) AS i
+        """), {"managers": managers, "people": people})
+    # Each shift goes to an employee and a client of the same manager
+    conn.execute(text("""
+        WITH staff AS (
+            SELECT e.manager_id, e.id AS employee_id, c.id AS client_id,
+                   row_number() OVER () - 1 AS n
+            FROM (SELECT id, manager_id, row_number() OVER (PARTITION BY manager_id ORDER BY id) AS k
+                  FROM employees WHERE email LIKE 'employees.index.check.%') e
+            JOIN (SELECT id, manager_id, row_number() OVER (PARTITION BY manager_id ORDER BY id) AS k
+                  FROM clients WHERE email LIKE 'clients.index.check.%') c
+              ON c.manager_id = e.manager_id AND c.k = e.k
+        ), staff_count AS (SELECT count(*) AS total FROM staff)
+        INSERT INTO job_shifts (id, manager_id, employee_id, client_id, start_date, end_date, is_paid)
+        SELECT gen_random_uuid(), s.manager_id, s.employee_id, s.client_id,
+               :epoch + (i % 365) * interval '1 day' + (i % 12) * interval '1 hour',
+               :epoch + (i % 365) * interval '1 day' + (i % 12 + 8) * interval '1 hour',
+               i % 3 = 0
+        FROM generate_series(1, :shifts) AS i
+        CROSS JOIN staff_count
+        JOIN staff s ON s.n = i % staff_count.total
+    """), {"shifts": shifts, "epoch": EPOCH})
+    conn.execute(text("ANALYZE managers, employees, clients, job_shifts"))
+
+
+def explain(conn, stmt) -> dict:
+    compiled = stmt.compile(dialect=engine.dialect)
+    rows = conn.exec_driver_sql(f"EXPLAIN (FORMAT JSON) {compiled}", compiled.params).scalar()
+    plan = rows if isinstance(rows, list) else json.loads(rows)
+    return plan[0]["Plan"]
+
+
+def job_shift_scans(plan: dict) -> list[dict]:
+    nodes = []
+    if plan.get("Relation Name") == "job_shifts" or (
+        plan.get("Node Type") == "Bitmap Index Scan" and plan.get("Index Name", "").startswith("ix_job_shifts")
+    ):
+        nodes.append(plan)
+    for child in plan.get("Plans", []):
+        nodes.extend(job_shift_scans(child))
+    return nodes
+
+
+def check_plan(conn, label: str, stmt, expected_index: str) -> bool:
+    scans = job_shift_scans(explain(conn, stmt))
+    used = {node.get("Index Name") for node in scans} - {None}
+    seq_scan = any(node["Node Type"] == "Seq Scan" for node in scans)
+    ok = expected_index in used and not seq_scan
+    status = "OK" if ok else "FAILED"
+    print(f"{status:<7}{label:<40}{', '.join(sorted(used)) or 'Seq Scan on job_shifts'}")
+    return ok
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Assert the job_shifts schedule and overlap queries are served by index scans.")
+    parser.add_argument("--managers", type=int, default=200)
+    parser.add_argument("--people", type=int, default=10_000)
+    parser.add_argument("--shifts", type=int, default=500_000)
+    args = parser.parse_args()
+
+    # Everything happens in one transaction that is rolled back: the database is left untouched
+    with engine.connect() as conn:
+        missing = {index.name for index in JobShiftModel.__table__.indexes} - {
+            row[0] for row in conn.execute(text("SELECT indexname FROM pg_indexes WHERE tablename = 'job_shifts'"))
+        }
+        if missing:
+            print(f"FAILED: missing indexes {sorted(missing)}; run python create_indexes.py")
+            sys.exit(1)
+
+        try:
+            seed(conn, args.managers, args.people, args.shifts)
+            manager_id, employee_id, client_id = conn.execute(text(
+                "SELECT manager_id, employee_id, client_id FROM job_shifts "
+                "WHERE employee_id IN (SELECT id FROM employees WHERE email LIKE 'employees.index.check.%') LIMIT 1"
+            )).one()
+            week_start, week_end = EPOCH + timedelta(days=100), EPOCH + timedelta(days=107)
+
+            results = [
+                check_plan(conn, "FindShifts manager + week",
+                           shifts_by_params_query(manager_id, start_date=week_start, end_date=week_end),
+                           "ix_job_shifts_manager_id_start_date"),
+                check_plan(conn, "FindShifts manager + employee + week",
+                           shifts_by_params_query(manager_id, employee_id=employee_id, start_date=week_start, end_date=week_end),
+                           "ix_job_shifts_employee_id_start_date"),
+                check_plan(conn, "FindShifts manager + client + week",
+                           shifts_by_params_query(manager_id, client_id=client_id, start_date=week_start, end_date=week_end),
+                           "ix_job_shifts_client_id_start_date"),
+                check_plan(conn, "FindSchedule manager + week",
+                           schedule_by_params_query(manager_id, start_date=week_start, end_date=week_end),
+                           "ix_job_shifts_manager_id_start_date"),
+                check_plan(conn, "FindSchedule employee from date",
+                           schedule_by_params_query(employee_id=employee_id, start_date=week_start),
+                           "ix_job_shifts_employee_id_start_date"),
+                check_plan(conn, "Overlap check on create",
+                           overlapping_shifts_query(employee_id, week_start, week_end),
+                           "ix_job_shifts_employee_id_period"),
+                check_plan(conn, "Conflicts manager + week",
+                           shift_conflicts_query(manager_id, week_start, week_end),
+                           "ix_job_shifts_employee_id_period"),
+            ]
+        finally:
+            conn.rollback()
+
+    if not all(results):
+        sys.exit(1)
+    print("All schedule queries use the job_shifts indexes.")
+
+
+if __name__ == "__main__":
+    main()
@@ -108,8 +108,15 @@ def main():
     
     # 5. List Shifts
     print("\n5. Listing Shifts...")
-    response = requests.get(f"{base_url}/job_shifts/")
-    shifts = check(response)
+    # The list is cursor-paginated in start order: follow next_cursor to the last page
+    shifts = []
+    params = {}
+    while True:
+        page = check(requests.get(f"{base_url}/job_shifts/", params=params))
+        shifts.extend(page["items"])
+        if not page["next_cursor"]:
+            break
+        params = {"cursor": page["next_cursor"]}
     print(f"Found {len(shifts)} shifts")
     
     found = False